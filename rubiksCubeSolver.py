@@ -1,7 +1,30 @@
-from copy   import deepcopy
-from random import randint, choice
-from typing import Any, Callable
-from sys    import exit
+from random      import randint, choice, Random
+from typing      import Any, Callable, Iterator
+from sys         import exit, byteorder
+from functools   import lru_cache
+from itertools   import permutations, count as countFrom
+from re          import compile as compileRegex
+from collections import deque
+from heapq       import heappush, heappop
+from operator    import itemgetter
+from struct      import Struct
+from mmap        import mmap, ACCESS_READ
+from array       import array
+from math        import comb, perm
+from os          import makedirs, replace, remove, cpu_count
+from os.path     import exists, dirname, expanduser, join as joinPath
+from time        import perf_counter
+from zlib        import crc32
+from signal      import signal, SIGINT, SIG_IGN
+from multiprocessing               import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+#  NumPy is only needed for batches of cubes (see CubeBatch) and to generate the pattern databases (see PatternDatabases),
+#  and it generates the pruning tables of the two-phase solver in parallel (see generatePruningTable()).
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 
@@ -223,7 +246,7 @@ SIMPLIFY_CLEANUP_DICTIONARY: dict[tuple[str], str] = \
 
     ("U E2 D2" ,) : "U' y2",
     ("U' E2 D2",) : "U y2" ,
-    ("U2 E2 D2",
+    ("U2 E D2" ,
      "U' D y'" ,
      "u2 D' d'", "u2 D' Dw'", "Uw2 D' d'", "Uw2 D' Dw'",
     "d2 U u"   , "d2 U Uw"  , "Dw2 U u"  , "Dw2 U Uw"  ,
@@ -295,8 +318,8 @@ SIMPLIFY_CLEANUP_DICTIONARY: dict[tuple[str], str] = \
     ("F2 z2", "B2 S2") : "b2",
 
 
-    ("L' R x2" ,) : "M x"  ,
-    ("L R' x2" ,) : "M' x'",
+    ("L' R x2" ,) : "M x'" ,
+    ("L R' x2" ,) : "M' x" ,
     ("L R' x'"   ,
      "L2 M R2"   ,
      "L' l' r2"  , "L' l' Rw2", "L' Lw' r2", "L' Lw' Rw2",
@@ -412,12 +435,11 @@ def concatenateStringList(L: list[str], separator: str = " ") -> str:
         raise TypeError(f"concatenateStringList:\n\tparameter L: \"{str(L)}\" is not a list.")
     elif(type(separator) != str):
         raise TypeError(f"concatenateStringList:\n\tparameter separator: \"{str(separator)}\" is not a string.")
-    elif(L == []):
-        return ""
-    elif(type(L[0]) != str):
-        raise TypeError(f"concatenateStringList:\n\tin parameter L: \"{str(L[0])}\" is not a string.")
     else:
-        return L[0] + (separator if(len(L) > 1) else "") + concatenateStringList(L[1:], separator)
+        for s in L:
+            if(type(s) != str):
+                raise TypeError(f"concatenateStringList:\n\tin parameter L: \"{str(s)}\" is not a string.")
+        return separator.join(L)
 
 
 #  Returns whether a given string is a valid move or not, including parentheses.
@@ -441,8 +463,8 @@ def firstOccurenceInList_index(L: list, x: Any) -> int:
 def matchingCloseParen_index(s: str | list) -> int:
     if(type(s) not in [str, list]):
         raise TypeError(f"matchingCloseParen_index:\n\tparameter s: \"{str(s)}\" is not a string or list.")
-    if(firstOccurenceInList_index(list(s), "(") == -1):
-        return - 1
+    elif("(" not in s):
+        return -1
     else:
         parenBalance: int = 1
         for i in range(s.index("(") + 1, len(s)):
@@ -453,23 +475,27 @@ def matchingCloseParen_index(s: str | list) -> int:
         return -1
 
 
-# Returns whether a given string is a valid sequence of moves or not, including parentheses.
+#  The error raised when a sequence of moves is not valid. Its position is the index in the string of moves
+#  of the first invalid move or unmatched parenthesis.
+class InvalidMovesError(ValueError):
+    def __init__(self, message: str, position: int) -> None:
+        super().__init__(message)
+        self.position: int = position
+        return
+
+
+#  Returns whether a given string is a valid sequence of moves or not, including parentheses.
+#  The moves are validated in a single pass (see parseMoveCodes()), so this takes linear time in the length of
+#  the string, no matter how deeply nested its parentheses are.
 def areValidMoves(moves: str) -> bool:
     if(type(moves) != str):
         raise TypeError(f"areValidMoves:\n\tparameter moves: \"{str(moves)}\" is not a string.")
-    elif(len(tokens := moves.replace("(", " ( ").replace(")", " ) ").split()) <= 1):
-        return isValidMove(moves)
-    elif((ms := moves.strip()).count("(")   !=   ms.count(")")):
-        return False
-    elif("(" in ms):
-        openParen_index : int = ms.index("(")
-        closeParen_index: int = matchingCloseParen_index(ms)
-
-        return areValidMoves(ms[:openParen_index]) and  \
-               areValidMoves(ms[openParen_index + 1: closeParen_index]) and  \
-               areValidMoves(ms[closeParen_index + 1:])
     else:
-        return areValidMoves(tokens[0]) and areValidMoves(concatenateStringList(tokens[1:])) 
+        try:
+            parseMoveCodes(moves)
+        except InvalidMovesError:
+            return False
+        return True
 
 
 #  Splits a move into a list of length two, first containting its root, and second containing its stem.
@@ -632,20 +658,10 @@ def combineTwoMoves(move0: str, move1: str) -> str:
         else:
             return ""
 
-#  Combines all adjacent like terms in a sequence of moves.
+#  Combines all adjacent like terms in a sequence of moves, including like terms that only become adjacent
+#  after the moves between them cancel out, for example R U U' R' -> (no moves).
 def combineMoves(moves: str) -> str:
-    if(not areValidMoves(moves)):
-        raise ValueError(f"combineMoves:\n\tparameter moves: \"{str(moves)}\" are not valid moves.")
-    elif((tokens := moves.replace("(", " ").replace(")", " ").split())     ==     []):
-        return ""
-    elif(len(tokens) == 1):
-        return tokens[0]
-    else:
-        combineFirstTwo: str = combineTwoMoves(tokens[0], tokens[1])
-        if(len(combineFirstTwo.split()) == 2):
-            return tokens[0] + " " + combineMoves(concatenateStringList(tokens[1:])).strip()
-        else:
-            return combineMoves(combineFirstTwo + " " + concatenateStringList(tokens[2:])).strip()
+    return str(parseMoveSequence(moves, "combineMoves").combine())
 
 
 #  Takes an unary move operator and a sequence of moves (a string), maps
@@ -653,28 +669,15 @@ def combineMoves(moves: str) -> str:
 #  Parentheses in the move sequence are ignored.
 def mapMoves(func: Callable[[str], str], moves: str) -> str:
     if(not callable(func)):
-        raise TypeError(f"mapMove:\n\tparameter func: \"{str(func)}\" is not a valid function.")
-    elif(not areValidMoves(moves)):
-        raise ValueError(f"mapMove:\n\tparameter moves: \"{str(moves)}\" are not valid moves.")
-    elif(set(moves.replace(" ", "").replace("\n", "").replace("\t", "")) in [{}, {"(", ")"}]):
-        return ""
+        raise TypeError(f"mapMoves:\n\tparameter func: \"{str(func)}\" is not a valid function.")
     else:
-        tokens: list[str] = moves.replace("(", " ( ").replace(")", " ) ").split()
-        result: str = ""
-        for move in tokens:
-            result += (func(move) if(move not in "()") else move) + " "
-        return cleanUpSpacing(result)
+        result: list[str] = [(func(MOVE_TOKENS[code]) if(code < MOVE_CODE_COUNT) else MOVE_TOKENS[code]) for code in parseMoveSequence(moves, "mapMoves").codes]
+        return cleanUpSpacing(concatenateStringList(result))
 
 
 #  Reverses the order of a sequence of moves (a string).
 def reverseMoves(moves: str) -> str:
-    if(not areValidMoves(moves)):
-        raise ValueError(f"reverseMoves:\n\tparameter moves: \"{str(moves)}\" are not valid moves.")
-    else:
-        result: str = ""
-        for move in moves.replace("(", " ( ").replace(")", " ) ").split():
-            result = move + " " + result
-        return cleanUpSpacing(result.replace("(", "🟩").replace(")", "(").replace("🟩", ")"))
+    return str(parseMoveSequence(moves, "reverseMoves").reverse())
 
 
 #  Reduces a move to its lowest possible stem, for example R3' -> R.
@@ -699,7 +702,7 @@ def reduceMove(move: str) -> str:
 
 #  Reduces a sequence of moves (a string) to their lowest possible stems.
 def reduceMoves(moves: str) -> str:
-    return mapMoves(reduceMove, moves)
+    return str(parseMoveSequence(moves, "reduceMoves").reduce())
 
 #  "Unreduces" a move to its highest possible stem, for example R -> R3'.
 #  If a move is already unreduced, it just trims it.
@@ -725,7 +728,7 @@ def unreduceMove(move: str) -> str:
 
 #  "Unreduces" a sequence of moves (a string) to their highest possible stems.
 def unreduceMoves(moves: str) -> str:
-    return mapMoves(unreduceMove, moves)
+    return str(parseMoveSequence(moves, "unreduceMoves").unreduce())
 
 
 #  Returns the inverse of a move, preserving any unreduced stems (for inverting possible finger tricks as well).
@@ -745,73 +748,12 @@ def invertMove(move: str) -> str:
 #  Returns the inverse of a sequence of moves (a string), inverting each move individually, 
 #  then reversing the order of the entire sequence.
 def invertMoves(moves: str) -> str:
-    return reverseMoves(mapMoves(invertMove, moves))
+    return str(parseMoveSequence(moves, "invertMoves").invert())
 
 #  Cleans up the spacing between moves in a string of moves, including parentheses, one space between each move.
+#  All unnecessary parentheses are removed as well (see formatMoveCodes()).
 def cleanUpSpacing(moves: str) -> str:
-    if(not areValidMoves(moves)):
-        raise ValueError(f"cleanUpSpacing:\n\tparameter moves: \"{str(moves)}\" are not valid moves.")
-    else:
-        def cleanUpSpacing_helper(moves: str) -> str:
-
-            #  If the entire sequence of moves is surrounded by a pair of parentheses, remove them.
-            if(((ms := moves.strip()) != "") and  \
-               ((ms[0] + ms[-1]) == "()") and  \
-               areValidMoves(mt := ms[1: -1])
-              ):
-                return cleanUpSpacing_helper(mt)
-
-            else:
-                #  Remove all pairs of parentheses that don't contain any moves inside them (only whitespace)
-                ms = concatenateStringList(moves.replace("(", " ( ").replace(")", " ) ").split()).replace("( )", " ")
-
-                #  Remove all pairs of parentheses that only contain exactly one move inside them
-                tokens: list[str] = ms.replace("(", " ( ").replace(")", " ) ").split()
-                i     : int       = firstOccurenceInList_index(tokens, "(")
-                result: str       = concatenateStringList(tokens[:i])
-                if(i != -1):
-                    while(i < len(tokens)):
-                        if((i < (len(tokens) - 2)) and (tokens[i] == "(") and (tokens[i + 1] not in "()") and (tokens[i + 2] == ")")):
-                            result += " " + tokens[i + 1]
-                            i += 3
-                        else:
-                            result += " " + tokens[i]
-                            i += 1
-                    ms = result     #  update ms
-
-                #  Remove all redundant pairs of parentheses, for ex:
-                #  ((R U R' U')) F2   ->   (R U R' U') F2
-                tokens: list[str] = ms.replace("(", " ( ").replace(")", " ) ").split()
-                i     : int       = firstOccurenceInList_index(tokens, "(")
-                result: str       = concatenateStringList(tokens[:i])
-                if(i != -1):
-                    while(i < len(tokens)):
-                        if((tokens[i] == "(") and (tokens[i + 1] == "(") and  \
-                        (tokens[(cp := matchingCloseParen_index(tokens[i:]) + i) - 1] == ")")):
-                           result += " " + concatenateStringList(tokens[i + 1: cp])
-                           i = cp + 1
-                        else:
-                            result += " " + tokens[i]
-                            i += 1
-                    ms = result     #  update ms
-
-                #  Finally, tidy up all the spacing between moves and parentheses before returning the sequence of moves.
-                result = ""
-                for move in ms.replace("(", " ( ").replace(")", " ) ").split():
-                    if((result[-1:] != "(") and (move != ")")):
-                        result += " "
-                    result += move
-                
-                return result
-
-        #  Keep repeating the algorithm until the sequence of moves containts the least number of parentheses
-        #  ( to remove all unnecessary parentheses, included repeated ones like "(((R U))) L" ).
-        result: str = cleanUpSpacing_helper(moves)
-        while(result.count("(") > cleanUpSpacing_helper(result).count("(")):
-            result = cleanUpSpacing_helper(result)
-
-
-        return result.strip()
+    return str(parseMoveSequence(moves, "cleanUpSpacing"))
 
 
 #  Returns the axis on which a move operates on, returns one of {"R", "U", "F", "RUF"}.
@@ -857,7 +799,7 @@ def flipMove(move: str) -> str:
 
 #  Flips a string of moves across their respective perpendicular axes.
 def flipMoves(moves: str) -> str:
-    return mapMoves(flipMove, moves)
+    return str(parseMoveSequence(moves, "flipMoves").flip())
 
 
 #  Given two moves, the first needed to be a cube rotation, this function returns the move
@@ -870,100 +812,13 @@ def rotateMove(rotation: str, move: str) -> str:
         raise ValueError(f"rotateMoves:\n\tparameter rotation: \"{rotation}\" is not a valid cube rotation.")
     elif(not isValidMove(move)):
         raise ValueError(f"rotateMove:\n\tparameter move: \"{str(move)}\" is not a valid move.")
-    elif((moveAxis(rotation) == moveAxis(move)) or (move.strip() == "") or (rotation.strip() == "")):
+    elif(((m := move.strip()) != "") and (m[0] + m[-1] == "()")):
+        return rotateMove(rotation, m[1: -1])
+    elif((moveAxis(rotation) == moveAxis(move)) or (m == "") or (rotation.strip() == "")):
         return move
     else:
-        m_root:     str = moveSplit(move)[0]
-        m_stem:     str = moveSplit(move)[1]
-        lowercase:  bool = (m_root == m_root.lower())
-        has_w:      bool = (m_root[-1] == "w")
-
-        rr: str = reduceMove(rotation).lower()
-        result: str
-
-        if(rr[-1] == "2"):
-            return flipMove(move)
-        
-        match rr[0]:
-            case "x":
-                match m_root[0].upper():
-                    case "U":
-                        result = "F"
-                    case "F":
-                        result = "D"
-                    case "B":
-                        result = "U"
-                    case "D":
-                        result = "B"
-                    
-                    case "E":
-                        result = "S"
-                    case "S":
-                        result = "E"
-                    
-                    case "Y":
-                        result = chr(ord(m_root) + 1)
-                    case _:     #  case "Z":
-                        result = chr(ord(m_root) - 1)
-
-            case "y":
-                match m_root[0].upper():
-                    case "R":
-                        result = "B"
-                    case "L":
-                        result = "F"
-                    case "F":
-                        result = "R"
-                    case "B":
-                        result = "L"
-                    
-                    case "M":
-                        result = "S"
-                    case "S":
-                        result = "M"
-                    
-                    case "X":
-                        result = chr(ord(m_root) + 2)
-                    case _:     #  case "Z":
-                        result = chr(ord(m_root) - 2)
-
-            case _:     #  case "z":
-                match m_root[0].upper():
-                    case "R":
-                        result = "U"
-                    case "L":
-                        result = "D"
-                    case "U":
-                        result = "L"
-                    case "D":
-                        result = "R"
-                    
-                    case "M":
-                        result = "E"
-                    case "E":
-                        result = "M"
-                    
-                    case "X":
-                        result = chr(ord(m_root) + 1)
-                    case _:     #  case "Y":
-                        result = chr(ord(m_root) - 1)
-            
-        if(lowercase):
-            result = result.lower()
-        elif(has_w):
-            result += "w"
-
-        result += m_stem
-        result = ((flipMove(result)) if(rr[-1] == "'") else result)
-
-        if(
-            ((rr[0] == "x") and (m_root.upper() in ["E", "Z"])) or \
-            ((rr[0] == "y") and (m_root.upper() in ["S", "X"])) or \
-            ((rr[0] == "z") and (m_root.upper() in ["E", "Y"]))
-          ):
-          result = invertMove(result)
-
-        return result
+        #  Every rotation is looked up in the table of its reduced lowercase rotation (see ROTATE_MOVE_CODES).
+        return MOVE_TOKENS[ROTATE_MOVE_CODES[ROTATION_KEY_CODES[MOVE_TOKEN_CODES[rotation.strip()]]][MOVE_TOKEN_CODES[m]]]
 
 #  Given a cube rotation and a sequence of moves, this function returns the sequence of moves
 #  resulting from simplifying the following sequence of moves: (rotation moves rotation'),
@@ -971,47 +826,28 @@ def rotateMove(rotation: str, move: str) -> str:
 def rotateMoves(rotation: str, moves: str) -> str:
     if(not isValidCubeRotation(rotation)):
         raise ValueError(f"rotateMoves:\n\tparameter rotation: \"{str(rotation)}\" is not a valid cube rotation.")
-    elif(not areValidMoves(moves)):
-        raise ValueError(f"rotateMoves:\n\tparameter moves: \"{str(moves)}\" are not valid moves.")
-    elif(set(moves.replace(" ", "").replace("\n", "").replace("\t", "")) in [{}, {"(", ")"}]):
-        return ""
     else:
-        tokens: list[str] = moves.replace("(", " ( ").replace(")", " ) ").split()
-        result: str = ""
-        for move in tokens:
-            result += (rotateMove(rotation, move) if(move not in "()") else move) + " "
-        return cleanUpSpacing(result)
+        return str(parseMoveSequence(moves, "rotateMoves").rotate(rotation))
 
 #  Simplifies all subsequences of the form (rotation moves rotation') in a sequence of moves, where
 #  rotation' represents the inverse of some cube rotation. In other words, if a cube rotation appears in a sequence of moves,
 #  the inverse of that cube rotation will never appear in that sequence after being passed through this function.
 def simplifyRotationPairs(moves: str) -> str:
-    if(not areValidMoves(moves)):
-        raise ValueError(f"simplifyRotationPairs:\n\tparameter moves: \"{str(moves)}\" are not valid moves.")
+    return formatMoveCodes(simplifyRotationPairCodes(parseMoveSequence(moves, "simplifyRotationPairs").moveCodes()))
+
+
+#  Removes every cube rotation from a sequence of moves in a single pass, rewriting every move after a rotation as the
+#  move that does the same thing without the rotation (for example, x U -> F x). If keepOrientation is True, the result
+#  ends with at most two cube rotations that leave the cube in the same orientation as the original sequence of moves.
+#  Otherwise, the result contains no cube rotations at all (such as for WCA notation), and only the orientation of the
+#  cube is different after performing it. Parentheses are removed along with the rotations.
+def removeRotations(moves: str, keepOrientation: bool = True) -> str:
+    if(type(moves) != str):
+        raise TypeError(f"removeRotations:\n\tparameter moves: \"{str(moves)}\" is not a string.")
+    elif(type(keepOrientation) != bool):
+        raise TypeError(f"removeRotations:\n\tparameter keepOrientation: \"{str(keepOrientation)}\" is not a bool.")
     else:
-        if((tokens := moves.replace("(", " ").replace(")", " ").split()) == []):
-            return ""
-        else:
-            T: list[str] = tokens[1:]
-            m_inverse: str = invertMove(m := tokens[0])
-            foilii: list[int] = list(
-                                      filter(
-                                        lambda n: n != -1,
-                                        [
-                                            firstOccurenceInList_index(T, reduceMove(m_inverse).lower()),
-                                            firstOccurenceInList_index(T, reduceMove(m_inverse).upper()),
-                                            firstOccurenceInList_index(T, unreduceMove(m_inverse).lower()),
-                                            firstOccurenceInList_index(T, unreduceMove(m_inverse).upper()),
-                                        ]
-                                      )
-                                    )
-            if(isValidCubeRotation(m) and (foilii != [])):
-                endBlock: int = min(foilii)               
-                rotated:  str = rotateMoves(m, concatenateStringList(tokens[1:(endBlock + 1)]))
-                theRest:  str = simplifyRotationPairs(concatenateStringList(tokens[(endBlock + 2):]))
-                return simplifyRotationPairs(rotated + " " + theRest).strip()
-            else:
-                return (m + " " + simplifyRotationPairs(concatenateStringList(tokens[1:]))).strip()
+        return str(MoveSequence(moves).removeRotations(keepOrientation))
 
 
 #  Replaces all sublists in a given list that match a given set with a given replacement,
@@ -1039,17 +875,17 @@ def replaceSubsetInList(L: list, S: set, replacement: Any) -> list:
 
 #  Uses the REVEAL_ROTATIONS_DICTIONARY to simplify any subsequences in a string of moves to a single cube rotation.
 def revealRotations(moves: str) -> str:
-    if(not areValidMoves(moves)):
-        raise ValueError(f"revealRotations:\n\parameter moves: \"{str(moves)}\" are not valid moves.")
+    if(type(moves) != str):
+        raise TypeError(f"revealRotations:\n\tparameter moves: \"{str(moves)}\" is not a string.")
     else:
-        tokens: list[str] = moves.split()
-        justRearranged: list[str] = tokens.copy()
-
-        for key in REVEAL_ROTATIONS_DICTIONARY:
-            for t in key:
-                tokens = replaceSubsetInList(tokens, set(t.split()), REVEAL_ROTATIONS_DICTIONARY[key])
-        
-        return moves if(tokens == justRearranged) else concatenateStringList(tokens)
+        codes, tokens = tokenMoveCodes(moves)
+        result: list[int] = REVEAL_ROTATIONS.replace(codes)
+        return moves if(result == codes) else concatenateStringList(
+                                                                      [
+                                                                          MOVE_TOKENS[c] if(c < len(MOVE_TOKENS)) else tokens[c - len(MOVE_TOKENS)]
+                                                                          for c in result
+                                                                      ]
+                                                                  )
 
 
 #  Keeps track of where a specific face of the cube is located after performing a cube rotation.
@@ -1113,55 +949,16 @@ def simplifyRotationTriplet(r0: str, r1: str, r2: str) -> str:
     elif((len(r0) * len(r1) * len(r2)) == 0):
         return combineMoves(f"{r0} {r1} {r2}")
     else:
-        result: str = ""
-
-        match cubeRotatesFace("U", concatenateStringList([r0, r1, r2])):
-            case "R":
-                result = "z" + result
-            case "L":
-                result = "z'" + result
-            case "U":
-                pass
-            case "D":
-                result = "x2" + result
-            case "F":
-                result = "x'" + result
-            case _:     #  case "B":
-                result = "x" + result
-        
-        result =  " " + result
-        
-        match cubeRotatesFace("F", concatenateStringList([r0, r1, r2, invertMove(result)])):
-            case "R":
-                result = "y'" + result
-            case "L":
-                result = "y" + result
-            case "F":
-                pass
-            case _:     #  case "B":
-                result = "y2" + result
-
-        return result.strip()
+        codes: list[int] = [MOVE_TOKEN_CODES[r] for r in (r0, r1, r2)]
+        return concatenateStringList([MOVE_TOKENS[code] for code in ORIENTATION_ROTATION_CODES[rotationCodesOrientation(codes)]])
 
 #  Simplifies all subsequences of cube rotations of at least length three in a sequence (string) of moves,
 #  simplfying these subsequences to subsequences of at most two cube rotations.
 def simplifyRotationTriplets(moves: str) -> str:
     if(type(moves) != str):
         raise TypeError(f"simplifyRotationTriplets:\n\tparameter moves: \"{str(moves)}\" is not a string.")
-    elif(moves.strip() == ""):
-        return ""
-    elif(not isValidMove(   (tokens := moves.replace("(", " ").replace(")", " ").split())   [0]   )):
-        raise ValueError(f"simplifyRotationTriplets:\n\tin parameter moves: \"{tokens[0]}\" is not a valid move.")
-    elif((len(tokens) >= 2) and (not isValidMove(tokens[1]))):
-        raise ValueError(f"simplifyRotationTriplets:\n\tin parameter moves: \"{tokens[1]}\" is not a valid move.")
-    elif((len(tokens) >= 3) and (not isValidMove(tokens[2]))):
-        raise ValueError(f"simplifyRotationTriplets:\n\tin parameter moves: \"{tokens[2]}\" is not a valid move.")
-    elif(len(tokens) < 3):
-        return concatenateStringList(tokens)
-    elif(isValidCubeRotation(tokens[0]) and isValidCubeRotation(tokens[1]) and isValidCubeRotation(tokens[2])):
-        return simplifyRotationTriplets(simplifyRotationTriplet(tokens[0], tokens[1], tokens[2]) + " " + concatenateStringList(tokens[3:]))
     else:
-        return tokens[0] + " " + simplifyRotationTriplets(concatenateStringList(tokens[1:]))
+        return formatMoveCodes(simplifyRotationTripletCodes(moveCodesWithoutParens(moves)))
 
 #  Uses the SIMPLIFY_CLEANUP_DICTIONARY to simplify any unordered subsequences in a sequence of moves,
 #  using many complex moves such as wide moves, slice moves, and cube rotations.
@@ -1169,17 +966,9 @@ def simplifyCleanUp(moves: str) -> str:
     if(type(moves) != str):
         raise TypeError(f"simplifyCleanUp:\n\tparameter moves: \"{str(moves)}\" is not a string.")
     else:
-        tokens: list[str] = moves.replace("(", " ").replace(")", " ").split()
-        justRearranged: list[str] = tokens.copy()
-        for move in tokens:
-            if(not isValidMove(move)):
-                raise ValueError(f"simplifyCleanUp:\n\tin parameter moves: \"{move}\" is not a valid move.")
-
-        for key in SIMPLIFY_CLEANUP_DICTIONARY:
-            for t in key:
-                tokens = replaceSubsetInList(tokens, set(t.split()), SIMPLIFY_CLEANUP_DICTIONARY[key])
-        
-        return moves if(tokens == justRearranged) else concatenateStringList(tokens)
+        codes : list[int] = moveCodesWithoutParens(moves)
+        result: list[int] = SIMPLIFY_CLEANUP.replace(codes)
+        return moves if(result == codes) else formatMoveCodes(result)
 
 
 #  Takes a string of moves and splits it into a list of lists of strings, making splits
@@ -1188,20 +977,8 @@ def simplifyCleanUp(moves: str) -> str:
 def splitMovesAxes(moves: str) -> str:
     if(type(moves) != str):
         raise TypeError(f"splitMovesAxes:\n\tparameter moves: \"{str(moves)}\" is not a string.")
-    else:        
-        result     : list[list[str]] = []
-        currentList: list[str]       = []
-
-        for move in moves.replace("(", " ").replace(")", " ").split():
-            if(not isValidMove(move)):
-                raise ValueError(f"splitMovesAxes:\n\tin parameter moves: \"{move}\" is not a valid move.")
-            elif((currentList == []) or (moveAxis(currentList[0]) == moveAxis(move))):
-                currentList.append(move)
-            else:
-                result.append(currentList)
-                currentList = [move]
-
-        return result + [currentList]
+    else:
+        return [[MOVE_TOKENS[code] for code in axis] for axis in splitMoveCodeAxes(moveCodesWithoutParens(moves))]
 
 
 #  Splits a string of moves into their respective axes in a 2D list, sorts each list of moves in this list first by
@@ -1211,36 +988,21 @@ def sortMoveAxes(moves: str) -> str:
     if(type(moves) != str):
         raise TypeError(f"sortMoveAxes:\n\tparameter moves: \"{str(moves)}\" is not a string.")
     else:
-        for move in (m := moves.replace("(", " ").replace(")", " ")).split():
-            if(not isValidMove(move)):
-                raise ValueError(f"sortMoveAxes:\n\tin parameter moves: \"{move}\" is not a valid move.")
-                
-        result: str = ""
-        for axis in splitMovesAxes(m):
-            result += concatenateStringList(sorted(sorted(axis, key = lambda x: moveSplit(x)[0]), key = lambda x: x[0].lower() if x != "" else "")) + " "
-
-        return result.strip()
+        return formatMoveCodes(sortMoveCodeAxes(moveCodesWithoutParens(moves)))
 
 
-#  Simplifies a string of moves, using all of the move simplication algorithms previously described. Internally, this
-#  function is repeatedly applied until the resulting string of moves contains the minimum number of moves possible.
+#  Simplifies a string of moves, using all of the move simplication algorithms previously described, until none of
+#  them can simplify the moves any further. The moves are only parsed once, and every simplification algorithm is applied
+#  to their move codes (see simplifyMoveCodes()).
 def simplifyMoves(moves: str) -> str:    
     if(type(moves) != str):
         raise TypeError(f"simplifyMoves:\n\tparameter moves: \"{str(moves)}\" is not a string.")
     else:
-        for move in moves.replace("(", " ").replace(")", " ").split():
-            if(not isValidMove(move)):
-                raise ValueError(f"simplifyMoves:\n\tin parameter moves: \"{move}\" is not a valid move.")
+        sequence: MoveSequence = MoveSequence(moves)
+        codes   : list[int]    = sequence.moveCodes()
 
-        def simplifier(m: str) -> str:
-            return simplifyCleanUp(simplifyRotationPairs(simplifyRotationTriplets(revealRotations(combineMoves(sortMoveAxes(reduceMoves(m)))))))
-        
-        result:    str = simplifier(moves)
-        newResult: str = simplifier(result)
-        while(len(newResult.split()) < len(result.split())):
-            result = newResult
-            newResult = simplifier(result)
-        return result if(result != cleanUpSpacing(moves.replace("(", " ").replace(")", " "))) else cleanUpSpacing(moves)
+        result  : list[int]    = simplifyMoveCodes(codes)
+        return formatMoveCodes(result) if(result != codes) else str(sequence)
 
 
 #  Generates a random move. Specifying WCA as False will make it possible to generate more complex
@@ -1372,138 +1134,1657 @@ def commutator(moves0: str, moves1: str) -> str:
         return cleanUpSpacing(f"({m0}) ({m1}) ({invertMoves(m0)}) ({invertMoves(m1)})")
 
 
+
+
+#  Internally, the state of a cube object is a flat list of all (3**2 * 6) = 54 of its stickers, where the sticker at
+#  position i on face f has the index (9 * f) + i. Every move is then a permutation of these 54 sticker indices: performing
+#  a move with the permutation P on a state s results in the new state [s[P[i]] for i in range(54)].
+STICKER_COUNT: int = 54
+
+#  The permutation that leaves every sticker where it is.
+IDENTITY_PERMUTATION: tuple[int] = tuple(range(STICKER_COUNT))
+
+#  The solved state of a cube object. The state of every cube object is stored as an immutable string of 54 bytes (one
+#  byte per sticker), so that cube objects are small, can share their states, and can be hashed.
+SOLVED_STATE: bytes = bytes(color for face in SOLVED_CUBE for color in face)
+
+#  The sum of the stickers of every valid state of a cube, since each of the six colors is on exactly nine stickers.
+#  This is used as a cheap checksum of the state of a cube object (see Cube.validate()).
+STATE_CHECKSUM: int = sum(SOLVED_STATE)
+
+#  Every possible move root and every possible move stem, including the unreduced stems.
+ALL_MOVE_ROOTS: tuple[str] = POSSIBLE_FACE_MOVE_ROOTS + tuple(root.lower() for root in POSSIBLE_FACE_MOVE_ROOTS) +  \
+                             tuple(root + "w" for root in POSSIBLE_FACE_MOVE_ROOTS) + POSSIBLE_SLICE_MOVE_ROOTS +  \
+                             POSSIBLE_CUBE_ROTATION_ROOTS + tuple(root.upper() for root in POSSIBLE_CUBE_ROTATION_ROOTS)
+ALL_MOVE_STEMS: tuple[str] = ("", "'", "2", "3", "2'", "3'")
+
+#  The order in which the stickers of a face are gathered when that face is turned clockwise by 90 degrees.
+FACE_TURN_CLOCKWISE: tuple[int] = (6, 3, 0, 7, 4, 1, 8, 5, 2)
+
+#  The moves R, x, y and z are defined sticker by sticker. The R move is given as the list of (destination, source)
+#  sticker pairs of the stickers it moves off of the right face, and each cube rotation is given as the faces that
+#  end up in each position, followed by the number of clockwise quarter turns each of those faces is then turned by.
+R_MOVE_STICKERS: tuple[tuple[int]] = \
+(
+    ((9 * UP)    + 2, (9 * FRONT) + 2), ((9 * UP)    + 5, (9 * FRONT) + 5), ((9 * UP)    + 8, (9 * FRONT) + 8),
+    ((9 * FRONT) + 2, (9 * DOWN)  + 2), ((9 * FRONT) + 5, (9 * DOWN)  + 5), ((9 * FRONT) + 8, (9 * DOWN)  + 8),
+    ((9 * BACK)  + 0, (9 * UP)    + 8), ((9 * BACK)  + 3, (9 * UP)    + 5), ((9 * BACK)  + 6, (9 * UP)    + 2),
+    ((9 * DOWN)  + 2, (9 * BACK)  + 6), ((9 * DOWN)  + 5, (9 * BACK)  + 3), ((9 * DOWN)  + 8, (9 * BACK)  + 0)
+)
+
+CUBE_ROTATION_FACES: dict[str, tuple[tuple[int]]] = \
+{
+    "x": ((FRONT, LEFT, DOWN , RIGHT, UP  , BACK ), (0, -1, 0, 1, 2, 2)),
+    "y": ((UP   , FRONT, RIGHT, BACK, LEFT, DOWN ), (1,  0, 0, 0, 0, -1)),
+    "z": ((LEFT , DOWN , FRONT, UP  , BACK, RIGHT), (1,  1, 1, 1, -1, 1))
+}
+
+#  Every other move is defined in terms of R and the cube rotations (or in terms of moves defined before it),
+#  as a sequence of (root, number of clockwise quarter turns) pairs.
+MOVE_DEFINITIONS: dict[str, tuple[tuple[str, int]]] = \
+{
+    "L": (("y",  2), ("R",  1), ("y",  2)),
+    "U": (("z",  1), ("R",  1), ("z", -1)),
+    "D": (("z", -1), ("R",  1), ("z",  1)),
+    "F": (("y", -1), ("R",  1), ("y",  1)),
+    "B": (("y",  1), ("R",  1), ("y", -1)),
+
+    "r": (("L",  1), ("x",  1)),
+    "l": (("R",  1), ("x", -1)),
+    "u": (("D",  1), ("y",  1)),
+    "d": (("U",  1), ("y", -1)),
+    "f": (("B",  1), ("z",  1)),
+    "b": (("F",  1), ("z", -1)),
+
+    "M": (("l",  1), ("L", -1)),
+    "E": (("d",  1), ("D", -1)),
+    "S": (("b", -1), ("B",  1))
+}
+
+
+#  Composes two permutations, returning the permutation equivalent to performing p0 followed by p1.
+def composePermutations(p0: tuple[int], p1: tuple[int]) -> tuple[int]:
+    return tuple(map(p0.__getitem__, p1))
+
+#  Returns the inverse of a permutation, which undoes the permutation.
+def invertPermutation(p: tuple[int]) -> tuple[int]:
+    result: list[int] = [0] * len(p)
+    for i in range(len(p)):
+        result[p[i]] = i
+    return tuple(result)
+
+#  Returns the permutation equivalent to performing a permutation n times in a row (n can be negative).
+def powerPermutation(p: tuple[int], n: int) -> tuple[int]:
+    if(type(n) != int):
+        raise TypeError(f"powerPermutation:\n\tparameter n: \"{str(n)}\" is not an int.")
+    else:
+        result: tuple[int] = tuple(range(len(p)))
+        for _ in range(abs(n)):
+            result = composePermutations(result, p)
+        return result if(n >= 0) else invertPermutation(result)
+
+#  Performs a permutation on a flat list (or bytes) of stickers with a single gather, and returns the new list of stickers.
+def applyPermutation(state: list[int] | bytes, p: tuple[int]) -> list[int]:
+    return list(map(state.__getitem__, p))
+
+
+#  Returns the permutation that turns a single face of the cube clockwise by some number of quarter turns.
+def faceTurnPermutation(face: int, turns: int) -> tuple[int]:
+    if(face not in range(6)):
+        raise ValueError(f"faceTurnPermutation:\n\tparameter face: \"{str(face)}\" is not a valid face.")
+    else:
+        quarterTurn: list[int] = list(IDENTITY_PERMUTATION)
+        for i in range(9):
+            quarterTurn[(9 * face) + i] = (9 * face) + FACE_TURN_CLOCKWISE[i]
+        return powerPermutation(tuple(quarterTurn), turns % 4)
+
+#  Generates the permutation of every possible move (every root with every stem, for example "Rw2'" or "X3"),
+#  all from the definitions of R, x, y and z above.
+def generateMovePermutations() -> dict[str, tuple[int]]:
+    base: dict[str, tuple[int]] = {}
+
+    rMove: list[int] = list(IDENTITY_PERMUTATION)
+    for destination, source in R_MOVE_STICKERS:
+        rMove[destination] = source
+    base["R"] = composePermutations(tuple(rMove), faceTurnPermutation(RIGHT, 1))
+
+    for rotation, (faceOrder, faceTurns) in CUBE_ROTATION_FACES.items():
+        p: tuple[int] = tuple([(9 * faceOrder[i // 9]) + (i % 9) for i in IDENTITY_PERMUTATION])
+        for face in range(6):
+            p = composePermutations(p, faceTurnPermutation(face, faceTurns[face]))
+        base[rotation] = base[rotation.upper()] = p
+
+    for root, definition in MOVE_DEFINITIONS.items():
+        p: tuple[int] = IDENTITY_PERMUTATION
+        for subroot, turns in definition:
+            p = composePermutations(p, powerPermutation(base[subroot], turns))
+        base[root] = p
+    for root in POSSIBLE_FACE_MOVE_ROOTS:
+        base[root + "w"] = base[root.lower()]
+
+    result: dict[str, tuple[int]] = {}
+    for root in ALL_MOVE_ROOTS:
+        for stem in ALL_MOVE_STEMS:
+            result[root + stem] = powerPermutation(base[root], moveStemToInt(stem))
+    return result
+
+#  The permutation of every possible move, generated once when the program starts.
+MOVE_PERMUTATIONS: dict[str, tuple[int]] = generateMovePermutations()
+
+
+#  The maximum number of distinct sequences of moves that compileMoves() keeps compiled at once.
+COMPILED_MOVES_CACHE_SIZE: int = 4096
+
+#  A sequence of moves compiled into the single permutation of stickers that it performs on a cube, so that
+#  performing it on any cube object takes a single gather, no matter how many moves are in the sequence.
+#  The permutation is also split into the orientation that its cube rotations reach, and the gather of the rest of the
+#  permutation in the frame of every orientation of a cube object (see Cube.performMoves()), built when first needed.
+class CompiledMoves:
+    __slots__ = ("moves", "permutation", "orientation", "frameGathers", "zobristUpdates")
+
+    def __init__(self, moves: str, permutation: tuple[int]) -> None:
+        self.moves       : str                                             = moves
+        self.permutation : tuple[int]                                      = permutation
+        self.orientation : int                                             = ORIENTATION_INDICES[centerPermutation(permutation)]
+        self.frameGathers: dict[int, Callable[[bytes], tuple[int]] | None] = {}
+
+        #  The stickers that change, for updating the Zobrist hash of a cube object (see frameZobristUpdates()).
+        self.zobristUpdates: dict[int, tuple[tuple[int, int, int]]] = {}
+        return
+
+    #  Returns the gather that performs these moves on the stickers of a cube object in the given orientation, without
+    #  their cube rotations (which only change the orientation), or None if the moves are only cube rotations.
+    def frameGather(self, orientation: int) -> Callable[[bytes], tuple[int]] | None:
+        if(orientation not in self.frameGathers):
+            p: tuple[int] = composePermutations(
+                                                   composePermutations(ORIENTATION_PERMUTATIONS[orientation], self.permutation),
+                                                   ORIENTATION_INVERSE_PERMUTATIONS[ORIENTATION_PRODUCTS[orientation][self.orientation]]
+                                               )
+            self.frameGathers[orientation] = None if(p == IDENTITY_PERMUTATION) else itemgetter(*p)
+        return self.frameGathers[orientation]
+
+    #  Returns every sticker i that these moves change (as the offset 36 * i into ZOBRIST_MOVE_KEYS), along with the indices
+    #  (in the frame of the given orientation) of the stickers of a cube object that are at i before and after the moves,
+    #  so that the Zobrist hash of a cube object is updated with only the stickers that moved (see Cube.zobristHash()).
+    def frameZobristUpdates(self, orientation: int) -> tuple[tuple[int, int, int]]:
+        if(orientation not in self.zobristUpdates):
+            frame: tuple[int] = ORIENTATION_PERMUTATIONS[orientation]
+            self.zobristUpdates[orientation] = tuple(
+                                                        (36 * i, frame[i], frame[self.permutation[i]])
+                                                        for i in range(STICKER_COUNT) if(self.permutation[i] != i)
+                                                    )
+        return self.zobristUpdates[orientation]
+
+    def __repr__(self) -> str:
+        return f"CompiledMoves(\"{self.moves}\")"
+
+
+#  Returns a sequence of moves (a string) with all of its parentheses removed, and one space between each move.
+#  Two sequences of moves with the same normalized string always perform the same permutation on a cube.
+def normalizeMoves(moves: str) -> str:
+    if(type(moves) != str):
+        raise TypeError(f"normalizeMoves:\n\tparameter moves: \"{str(moves)}\" is not a string.")
+    else:
+        return concatenateStringList(moves.replace("(", " ").replace(")", " ").split())
+
+#  Compiles a normalized sequence of moves, caching the result by its normalized string.
+@lru_cache(maxsize = COMPILED_MOVES_CACHE_SIZE)
+def compileNormalizedMoves(moves: str) -> CompiledMoves:
+    permutation: tuple[int] = IDENTITY_PERMUTATION
+    for move in moves.split():
+        if(move not in MOVE_PERMUTATIONS):
+            raise ValueError(f"compileNormalizedMoves:\n\tin parameter moves: \"{move}\" is not a valid move.")
+        permutation = composePermutations(permutation, MOVE_PERMUTATIONS[move])
+    return CompiledMoves(moves, permutation)
+
+#  Validates and compiles a sequence of moves, caching the result by the exact string given, so that
+#  repeated sequences of moves are never parsed more than once while they stay in the cache. Invalid moves raise an
+#  InvalidMovesError with the position of the first invalid move or unmatched parenthesis (see parseMoveCodes()).
+@lru_cache(maxsize = COMPILED_MOVES_CACHE_SIZE)
+def compileValidMoves(moves: str) -> CompiledMoves:
+    try:
+        parseMoveCodes(moves)
+    except InvalidMovesError as error:
+        raise InvalidMovesError(f"compileMoves:\n\tparameter moves: \"{moves}\" are not valid moves.", error.position) from error
+    return compileNormalizedMoves(normalizeMoves(moves))
+
+#  Compiles a sequence of moves (a string, including any parentheses, wide moves, slice moves and cube rotations)
+#  into a CompiledMoves object, which can then be performed on any cube object with Cube.performMoves().
+def compileMoves(moves: str) -> CompiledMoves:
+    if(type(moves) != str):
+        raise TypeError(f"compileMoves:\n\tparameter moves: \"{str(moves)}\" is not a string.")
+    else:
+        return compileValidMoves(moves)
+
+
+
+
+#  Every move token (every possible move, as well as the two parentheses) is interned as an integer code, which is
+#  its index in MOVE_TOKENS. Sequences of moves can then be parsed once into lists of these codes, and every operation
+#  on the moves becomes a lookup into one of the tables of codes below, instead of re-validating and re-splitting strings.
+MOVE_TOKENS     : tuple[str]     = tuple(MOVE_PERMUTATIONS) + ("(", ")")
+MOVE_TOKEN_CODES: dict[str, int] = {token: code for code, token in enumerate(MOVE_TOKENS)}
+OPEN_PAREN_CODE : int            = MOVE_TOKEN_CODES["("]
+CLOSE_PAREN_CODE: int            = MOVE_TOKEN_CODES[")"]
+
+#  The number of codes that represent actual moves (all of the codes before the two parentheses).
+MOVE_CODE_COUNT : int            = OPEN_PAREN_CODE
+
+#  The root, stem, width and number of clockwise quarter turns (mod 4) of the move represented by every move code.
+#  The width of a move is the number of layers it turns: 1 for face moves and slice moves, 2 for wide moves,
+#  and 3 for cube rotations.
+MOVE_CODE_ROOTS : tuple[str] = tuple(moveSplit(move)[0] for move in MOVE_TOKENS[:MOVE_CODE_COUNT])
+MOVE_CODE_STEMS : tuple[str] = tuple(moveSplit(move)[1] for move in MOVE_TOKENS[:MOVE_CODE_COUNT])
+MOVE_CODE_WIDTHS: tuple[int] = tuple(
+                                        3 if(isValidCubeRotation(root)) else (2 if((root.lower() == root) or ("w" in root)) else 1)
+                                        for root in MOVE_CODE_ROOTS
+                                    )
+MOVE_CODE_TURNS : tuple[int] = tuple(moveStemToInt(stem) % 4 for stem in MOVE_CODE_STEMS)
+
+#  The axis of every move code (one of {"R", "U", "F"}), and whether every move code is a cube rotation or not.
+MOVE_CODE_AXES       : tuple[str]  = tuple(moveAxis(move) for move in MOVE_TOKENS[:MOVE_CODE_COUNT])
+IS_ROTATION_MOVE_CODE: tuple[bool] = tuple(width == 3 for width in MOVE_CODE_WIDTHS) + (False, False)
+
+#  Move codes are only ever combined with the move codes of equivalent roots (such as "r" and "Rw", or "x" and "X"),
+#  so every move code is given the index of its class of equivalent roots.
+MOVE_CODE_ROOT_CLASSES: tuple[int] = tuple(
+                                              [
+                                                  firstOccurenceInList_index(
+                                                      [areEquivalentMoveRoots(root, other) for other in ALL_MOVE_ROOTS], True
+                                                  )
+                                                  for root in MOVE_CODE_ROOTS
+                                              ]
+                                          )
+
+#  REDUCED_MOVE_CODES[code][turns] is the reduced move code with the same root as code, turning (turns mod 4) quarter turns.
+#  The entry for zero turns is None, since no move remains after the move cancels out.
+REDUCED_MOVE_CODES: tuple[tuple[int]] = tuple(
+                                                 (None,) + tuple(MOVE_TOKEN_CODES[root + intToMoveStem(n)] for n in (1, 2, 3))
+                                                 for root in MOVE_CODE_ROOTS
+                                             )
+
+
+#  Returns the table mapping every move code to the code of the move resulting from a unary move operator
+#  (such as invertMove() or reduceMove()), leaving the codes of parentheses unchanged.
+def moveCodeTable(func: Callable[[str], str]) -> tuple[int]:
+    if(not callable(func)):
+        raise TypeError(f"moveCodeTable:\n\tparameter func: \"{str(func)}\" is not a valid function.")
+    else:
+        return tuple(MOVE_TOKEN_CODES[func(move)] for move in MOVE_TOKENS[:MOVE_CODE_COUNT]) + (OPEN_PAREN_CODE, CLOSE_PAREN_CODE)
+
+INVERT_MOVE_CODES  : tuple[int] = moveCodeTable(invertMove)
+REDUCE_MOVE_CODES  : tuple[int] = moveCodeTable(reduceMove)
+UNREDUCE_MOVE_CODES: tuple[int] = moveCodeTable(unreduceMove)
+FLIP_MOVE_CODES    : tuple[int] = moveCodeTable(flipMove)
+
+#  Returns the table of every move code rotated by a cube rotation (see rotateMove()), found from the permutations of
+#  stickers: a move rotated by a rotation performs the same permutation as (rotation move rotation'). The root of every
+#  rotated move is written in the same way as the root of the move (a face, slice, lowercase wide, "w" wide, lowercase or
+#  uppercase rotation root), with the same stem, which is inverted if the rotation turns the root the opposite way.
+def rotateMoveCodeTable(rotation: str) -> tuple[int]:
+    if(not isValidCubeRotation(rotation)):
+        raise ValueError(f"rotateMoveCodeTable:\n\tparameter rotation: \"{str(rotation)}\" is not a valid cube rotation.")
+    else:
+        r      : tuple[int] = MOVE_PERMUTATIONS[rotation]
+        inverse: tuple[int] = invertPermutation(r)
+        def rootKind(root: str) -> tuple[int, bool, bool]:
+            return (MOVE_CODE_WIDTHS[MOVE_TOKEN_CODES[root]], root == root.lower(), root[-1] == "w")
+
+        #  Every root is rotated to a root of the same kind, and whether or not the rotated root is inverted.
+        rotatedRoots: dict[str, tuple[str, bool]] = {}
+        for root in ALL_MOVE_ROOTS:
+            target: tuple[int] = composePermutations(composePermutations(r, MOVE_PERMUTATIONS[root]), inverse)
+            for other in (root,) + ALL_MOVE_ROOTS:
+                if(rootKind(other) != rootKind(root)):
+                    continue
+                elif(MOVE_PERMUTATIONS[other] == target):
+                    rotatedRoots[root] = (other, False)
+                    break
+                elif(MOVE_PERMUTATIONS[invertMove(other)] == target):
+                    rotatedRoots[root] = (other, True)
+                    break
+
+        result: list[int] = []
+        for code in range(MOVE_CODE_COUNT):
+            other, inverted = rotatedRoots[MOVE_CODE_ROOTS[code]]
+            move: str = other + MOVE_CODE_STEMS[code]
+            result.append(MOVE_TOKEN_CODES[invertMove(move) if(inverted) else move])
+        return tuple(result) + (OPEN_PAREN_CODE, CLOSE_PAREN_CODE)
+
+#  ROTATE_MOVE_CODES[rotation] is the table of every move code rotated by a cube rotation, for every reduced lowercase
+#  cube rotation. Every cube rotation code is mapped to its reduced lowercase rotation code in ROTATION_KEY_CODES.
+ROTATE_MOVE_CODES : dict[int, tuple[int]] = \
+{
+    MOVE_TOKEN_CODES[rotation]: rotateMoveCodeTable(rotation)
+    for rotation in (r + stem for r in POSSIBLE_CUBE_ROTATION_ROOTS for stem in POSSIBLE_MOVE_STEMS)
+}
+ROTATION_KEY_CODES: dict[int, int] = \
+{
+    code: MOVE_TOKEN_CODES[reduceMove(MOVE_TOKENS[code]).lower()]
+    for code in range(MOVE_CODE_COUNT) if(IS_ROTATION_MOVE_CODE[code])
+}
+
+#  Returns the set of move codes that simplifyRotationPairs() considers the inverse of a cube rotation code.
+def rotationInverseCodes(code: int) -> set[int]:
+    m_inverse: str = invertMove(MOVE_TOKENS[code])
+    return set(
+                  MOVE_TOKEN_CODES[move] for move in
+                  [
+                      reduceMove(m_inverse).lower(),
+                      reduceMove(m_inverse).upper(),
+                      unreduceMove(m_inverse).lower(),
+                      unreduceMove(m_inverse).upper()
+                  ]
+              )
+
+ROTATION_INVERSE_CODES: dict[int, set[int]] = {code: rotationInverseCodes(code) for code in ROTATION_KEY_CODES}
+
+
+#  Every one of the 24 orientations of the whole cube is represented by an integer: its index in ORIENTATIONS, which holds
+#  the face that every center moves from, as a permutation of the six faces (in the same way as a permutation of stickers).
+def centerPermutation(p: tuple[int]) -> tuple[int]:
+    return tuple(p[(9*face) + 4] // 9 for face in range(6))
+
+def generateOrientations() -> tuple[tuple[int]]:
+    result: list[tuple[int]] = [tuple(range(6))]
+    for orientation in result:      #  a breadth-first search, as the list grows while it is being iterated over
+        for rotation in POSSIBLE_CUBE_ROTATION_ROOTS:
+            c: tuple[int] = centerPermutation(MOVE_PERMUTATIONS[rotation])
+            if((product := tuple(orientation[c[face]] for face in range(6))) not in result):
+                result.append(product)
+    return tuple(result)
+
+ORIENTATIONS       : tuple[tuple[int]]     = generateOrientations()
+ORIENTATION_INDICES: dict[tuple[int], int] = {orientation: i for i, orientation in enumerate(ORIENTATIONS)}
+IDENTITY_ORIENTATION: int                  = ORIENTATION_INDICES[tuple(range(6))]
+
+#  ORIENTATION_PRODUCTS[o0][o1] is the orientation reached by the rotations of o0 followed by the rotations of o1.
+ORIENTATION_PRODUCTS: tuple[tuple[int]] = tuple(
+                                                   tuple(ORIENTATION_INDICES[tuple(o0[o1[face]] for face in range(6))] for o1 in ORIENTATIONS)
+                                                   for o0 in ORIENTATIONS
+                                               )
+
+#  The orientation reached by every cube rotation code.
+ROTATION_ORIENTATIONS: dict[int, int] = \
+{
+    code: ORIENTATION_INDICES[centerPermutation(MOVE_PERMUTATIONS[MOVE_TOKENS[code]])] for code in ROTATION_KEY_CODES
+}
+
+#  ORIENTATION_ROTATION_CODES[orientation] is the canonical sequence of at most two cube rotations reaching an orientation,
+#  as a tuple of move codes: a y rotation followed by an x or z rotation, in the same way as simplifyRotationTriplet(), unless
+#  a single rotation (such as z2) reaches the orientation.
+def orientationRotationCodes() -> tuple[tuple[int]]:
+    result: list[tuple[int]] = [None] * len(ORIENTATIONS)
+    for y in ("", "y'", "y", "y2"):
+        for xz in ("", "z", "z'", "x2", "x'", "x"):
+            codes      : tuple[int] = tuple(MOVE_TOKEN_CODES[r] for r in (y, xz) if(r != ""))
+            orientation: int        = IDENTITY_ORIENTATION
+            for code in codes:
+                orientation = ORIENTATION_PRODUCTS[orientation][ROTATION_ORIENTATIONS[code]]
+            result[orientation] = codes
+    for code in ROTATION_KEY_CODES.values():
+        if(len(result[ROTATION_ORIENTATIONS[code]]) > 1):
+            result[ROTATION_ORIENTATIONS[code]] = (code,)
+    return tuple(result)
+
+ORIENTATION_ROTATION_CODES: tuple[tuple[int]] = orientationRotationCodes()
+
+#  Returns the orientation reached by performing a list of cube rotation codes, in a single pass.
+def rotationCodesOrientation(codes: list[int]) -> int:
+    result: int = IDENTITY_ORIENTATION
+    for code in codes:
+        result = ORIENTATION_PRODUCTS[result][ROTATION_ORIENTATIONS[code]]
+    return result
+
+#  ORIENTATION_MOVE_CODES[orientation] is the table of every move code rotated by all of the rotations of an orientation:
+#  a move performed in that orientation is the same as the rotated move performed in the original orientation, followed
+#  by the rotations. The rotations (r0 r1) of an orientation rotate a move by (r0 r1 move r1' r0'), so by r1 and then by r0.
+def orientationMoveCodeTable(orientation: int) -> tuple[int]:
+    result: tuple[int] = tuple(range(len(MOVE_TOKENS)))
+    for rotation in reversed(ORIENTATION_ROTATION_CODES[orientation]):
+        result = tuple(ROTATE_MOVE_CODES[rotation][code] for code in result)
+    return result
+
+ORIENTATION_MOVE_CODES: tuple[tuple[int]] = tuple(orientationMoveCodeTable(o) for o in range(len(ORIENTATIONS)))
+
+#  ORIENTATION_PERMUTATIONS[orientation] is the permutation of stickers performed by the canonical rotations of an orientation,
+#  and ORIENTATION_GATHERS[orientation] is its gather (see Cube.performMoves()).
+ORIENTATION_PERMUTATIONS        : tuple[tuple[int]] = tuple(
+                                                               compileNormalizedMoves(concatenateStringList([MOVE_TOKENS[code] for code in codes])).permutation
+                                                               for codes in ORIENTATION_ROTATION_CODES
+                                                           )
+ORIENTATION_INVERSE_PERMUTATIONS: tuple[tuple[int]] = tuple(invertPermutation(p) for p in ORIENTATION_PERMUTATIONS)
+ORIENTATION_GATHERS             : tuple[Callable[[bytes], tuple[int]]] = tuple(itemgetter(*p) for p in ORIENTATION_PERMUTATIONS)
+
+
+#  The seed of the Zobrist keys, which is fixed so that the Zobrist hash of a state is the same in every program.
+ZOBRIST_SEED: int = 0x52554249
+
+#  ZOBRIST_KEYS[i][color] is the random 64-bit key of the sticker i having the color. The Zobrist hash of a state is the
+#  exclusive or of the keys of all of its stickers, so a move only changes the keys of the stickers that it moves.
+def generateZobristKeys() -> tuple[tuple[int]]:
+    generator: Random = Random(ZOBRIST_SEED)
+    return tuple(tuple(generator.getrandbits(64) for color in range(6)) for i in range(STICKER_COUNT))
+
+ZOBRIST_KEYS: tuple[tuple[int]] = generateZobristKeys()
+
+#  ZOBRIST_MOVE_KEYS[(36 * i) + (6 * before) + after] is the change of the Zobrist hash of a state when the color of the
+#  sticker i changes from before to after, in a single flat tuple (see CompiledMoves.frameZobristUpdates()).
+ZOBRIST_MOVE_KEYS: tuple[int] = tuple(
+                                         ZOBRIST_KEYS[i][before] ^ ZOBRIST_KEYS[i][after]
+                                         for i in range(STICKER_COUNT) for before in range(6) for after in range(6)
+                                     )
+
+#  Returns the Zobrist hash of a state (54 stickers), from all of its stickers.
+def zobristHash(state: bytes | list[int]) -> int:
+    result: int = 0
+    for i in range(STICKER_COUNT):
+        result ^= ZOBRIST_KEYS[i][state[i]]
+    return result
+
+
+#  Every token in a sequence of moves is either a single parenthesis, or a run of characters that are neither
+#  whitespace nor parentheses.
+MOVE_TOKEN_PATTERN = compileRegex(r"[()]|[^\s()]+")
+
+#  Parses a sequence of moves (a string, including parentheses) into a list of move codes in a single pass, raising
+#  an InvalidMovesError (a ValueError) with the position of the first invalid move or unmatched parenthesis if the moves
+#  are not valid. This takes linear time in the length of the string, no matter how deeply nested its parentheses are.
+def parseMoveCodes(moves: str) -> list[int]:
+    if(type(moves) != str):
+        raise TypeError(f"parseMoveCodes:\n\tparameter moves: \"{str(moves)}\" is not a string.")
+    else:
+        codes: list[int] = list(map(MOVE_TOKEN_CODES.get, MOVE_TOKEN_PATTERN.findall(moves)))
+
+        #  Only look for the position of an error once it is known that there is one.
+        if(None in codes):
+            for match in MOVE_TOKEN_PATTERN.finditer(moves):
+                if(match.group() not in MOVE_TOKEN_CODES):
+                    raise InvalidMovesError(
+                        f"parseMoveCodes:\n\tin parameter moves: \"{match.group()}\" at position {match.start()} is not a valid move.",
+                        match.start()
+                    )
+
+        elif((OPEN_PAREN_CODE in codes) or (CLOSE_PAREN_CODE in codes)):
+            parenDepth: int = 0
+            for i in range(len(codes)):
+                if(codes[i] == OPEN_PAREN_CODE):
+                    parenDepth += 1
+                elif((codes[i] == CLOSE_PAREN_CODE) and ((parenDepth := parenDepth - 1) < 0)):
+                    position: int = [match.start() for match in MOVE_TOKEN_PATTERN.finditer(moves)][i]
+                    raise InvalidMovesError(
+                        f"parseMoveCodes:\n\tin parameter moves: the \")\" at position {position} is not matched.",
+                        position
+                    )
+
+            if(parenDepth != 0):
+                #  Report the first "(" that is never closed.
+                openPositions: list[int] = []
+                for match in MOVE_TOKEN_PATTERN.finditer(moves):
+                    if(match.group() == "("):
+                        openPositions.append(match.start())
+                    elif(match.group() == ")"):
+                        openPositions.pop()
+                raise InvalidMovesError(
+                    f"parseMoveCodes:\n\tin parameter moves: the \"(\" at position {openPositions[0]} is not matched.",
+                    openPositions[0]
+                )
+
+        return codes
+
+
+#  Parses a sequence of moves (a string) into a list of move codes, ignoring all of its parentheses.
+def moveCodesWithoutParens(moves: str) -> list[int]:
+    if(type(moves) != str):
+        raise TypeError(f"moveCodesWithoutParens:\n\tparameter moves: \"{str(moves)}\" is not a string.")
+    else:
+        return parseMoveCodes(moves.replace("(", " ").replace(")", " "))
+
+
+#  Parses a sequence of moves (a string) into a list of move codes in a single pass over its tokens (split on whitespace),
+#  returning the tokens along with the codes. A token with parentheses attached to it, such as "(R", is kept as it is
+#  instead of being split apart, so it is given its own code past the end of MOVE_TOKENS (its index in the tokens plus
+#  len(MOVE_TOKENS)), which is never found in a dictionary of moves. If the moves are not valid, they are parsed again
+#  with parseMoveCodes() to raise its error, with the position of the first invalid move or unmatched parenthesis.
+def tokenMoveCodes(moves: str) -> tuple[list[int], list[str]]:
+    if(type(moves) != str):
+        raise TypeError(f"tokenMoveCodes:\n\tparameter moves: \"{str(moves)}\" is not a string.")
+    else:
+        tokens    : list[str] = moves.split()
+        codes     : list[int] = list(map(MOVE_TOKEN_CODES.get, tokens))
+        isValid   : bool      = True
+        parenDepth: int       = 0
+        for i in range(len(codes)):
+            parts: list[int | None] = [codes[i]]
+            if(codes[i] is None):
+                parts    = [MOVE_TOKEN_CODES.get(part) for part in MOVE_TOKEN_PATTERN.findall(tokens[i])]
+                codes[i] = len(MOVE_TOKENS) + i
+            for part in parts:
+                if(part is None):
+                    isValid = False
+                elif(part >= OPEN_PAREN_CODE):
+                    parenDepth += (1 if(part == OPEN_PAREN_CODE) else -1)
+                    isValid     = isValid and (parenDepth >= 0)
+
+        if((not isValid) or (parenDepth != 0)):
+            parseMoveCodes(moves)
+        return codes, tokens
+
+
+#  Returns a list where the element at the index of every "(" code in a list of move codes is the index of its
+#  matching ")" code (and the other way around). All other elements of the list are -1.
+def matchingParenCodes(codes: list[int]) -> list[int]:
+    result    : list[int] = [-1] * len(codes)
+    openParens: list[int] = []
+    for i in range(len(codes)):
+        if(codes[i] == OPEN_PAREN_CODE):
+            openParens.append(i)
+        elif(codes[i] == CLOSE_PAREN_CODE):
+            result[i] = openParens.pop()
+            result[result[i]] = i
+    return result
+
+#  Formats a list of move codes as a string, in exactly the way cleanUpSpacing() formats a sequence of moves: one space
+#  between each move, with all unnecessary pairs of parentheses removed. A pair of parentheses is unnecessary if it holds
+#  no moves, exactly one move, or moves that already start and end with parentheses (once its own unnecessary pairs of
+#  parentheses are removed), or if it holds the entire sequence of moves. This takes a single pass with a stack of the
+#  pairs of parentheses that are still open, so it takes linear time no matter how deeply nested the parentheses are.
+def formatMoveCodes(codes: list[int]) -> str:
+    #  Without any parentheses, there is nothing to remove.
+    if(OPEN_PAREN_CODE not in codes):
+        return concatenateStringList([MOVE_TOKENS[code] for code in codes])
+
+    #  Every pair of parentheses becomes a list of items: move codes, and the pairs of parentheses inside it, as a tuple
+    #  holding whether the pair is kept and the list of items inside it. The items of a removed pair always start and
+    #  end with a pair of parentheses, and are only spliced into the result at the very end, so that no item is ever
+    #  copied more than once.
+    stack: list[list] = [[]]
+    for code in codes:
+        if(code == OPEN_PAREN_CODE):
+            stack.append([])
+        elif(code == CLOSE_PAREN_CODE):
+            items: list = stack.pop()
+            if(len(items) == 0):
+                continue
+            elif((len(items) == 1) and (type(items[0]) == int)):
+                stack[-1].append(items[0])
+            else:
+                stack[-1].append(((type(items[0]) != tuple) or (type(items[-1]) != tuple), items))
+        else:
+            stack[-1].append(code)
+
+    #  If the entire sequence of moves is inside a pair of parentheses, remove it too.
+    items: list = stack[0]
+    while((len(items) == 1) and (type(items[0]) == tuple)):
+        items = items[0][1]
+
+    #  Finally, write out every item, with the items of every removed pair of parentheses spliced in place.
+    tokens : list[str]                  = []
+    pending: list[tuple[Iterator, str]] = [(iter(items), "")]
+    while pending:
+        item: int | tuple | None = next(pending[-1][0], None)
+        if(item is None):
+            tokens.append(pending.pop()[1])
+        elif(type(item) == int):
+            tokens.append(MOVE_TOKENS[item])
+        else:
+            tokens.append("(" if(item[0]) else "")
+            pending.append((iter(item[1]), ")" if(item[0]) else ""))
+    return concatenateStringList([token for token in tokens if(token != "")]).replace("( ", "(").replace(" )", ")")
+
+
+#  Returns whether a list only holds integer codes of MOVE_TOKENS, with every parenthesis matched.
+def isValidMoveCodeList(codes: list[int]) -> bool:
+    if(not all(type(code) == int for code in codes)):
+        return False
+    elif(codes and ((min(codes) < 0) or (max(codes) >= len(MOVE_TOKENS)))):
+        return False
+    else:
+        parenDepth: int = 0
+        for code in codes:
+            if(code >= OPEN_PAREN_CODE):
+                parenDepth += (1 if(code == OPEN_PAREN_CODE) else -1)
+                if(parenDepth < 0):
+                    return False
+        return parenDepth == 0
+
+#  Parses a string of moves into a MoveSequence for a function of this module, raising a TypeError naming the function
+#  if the moves are not a string.
+def parseMoveSequence(moves: str, functionName: str) -> "MoveSequence":
+    if(type(moves) != str):
+        raise TypeError(f"{functionName}:\n\tparameter moves: \"{str(moves)}\" is not a string.")
+    else:
+        return MoveSequence(moves)
+
+
+#  A sequence of moves, parsed once into a list of integer move codes (including the codes of any parentheses).
+#  Every operation on a MoveSequence returns a new MoveSequence, and the moves are only formatted back into
+#  a string when the sequence is converted with str().
+class MoveSequence:
+    __slots__ = ("codes",)
+
+    #  Initializes a sequence of moves, from either a string of moves or a list of move codes (see isValidMoveCodeList()).
+    def __init__(self, moves: str | list[int] = "") -> None:
+        if(type(moves) == str):
+            self.codes: list[int] = parseMoveCodes(moves)
+        elif(type(moves) == list):
+            if(not isValidMoveCodeList(moves)):
+                raise ValueError(f"MoveSequence:\n\tparameter moves: \"{str(moves)}\" is not a valid list of move codes.")
+            self.codes: list[int] = moves
+        else:
+            raise TypeError(f"MoveSequence:\n\tparameter moves: \"{str(moves)}\" is not a string or list.")
+        return
+
+    def __str__(self) -> str:
+        return formatMoveCodes(self.codes)
+
+    def __repr__(self) -> str:
+        return f"MoveSequence(\"{str(self)}\")"
+
+    #  Returns the number of moves in the sequence, not counting parentheses.
+    def __len__(self) -> int:
+        return len(self.codes) - self.codes.count(OPEN_PAREN_CODE) - self.codes.count(CLOSE_PAREN_CODE)
+
+    #  Returns the list of move codes in the sequence, without any of its parentheses.
+    def moveCodes(self) -> list[int]:
+        return [code for code in self.codes if(code < MOVE_CODE_COUNT)]
+
+    #  Returns the parenthesis depth of every move code in the sequence.
+    def depths(self) -> list[int]:
+        result: list[int] = []
+        depth : int       = 0
+        for code in self.codes:
+            depth += (1 if(code == OPEN_PAREN_CODE) else (-1 if(code == CLOSE_PAREN_CODE) else 0))
+            if(code < MOVE_CODE_COUNT):
+                result.append(depth)
+        return result
+
+    #  Returns a (root, stem, width, parenthesis depth) tuple for every move in the sequence.
+    def tokens(self) -> list[tuple[str, str, int, int]]:
+        return [
+                   (MOVE_CODE_ROOTS[code], MOVE_CODE_STEMS[code], MOVE_CODE_WIDTHS[code], depth)
+                   for code, depth in zip(self.moveCodes(), self.depths())
+               ]
+
+    #  Returns the sequence of moves with every move code mapped through a table of move codes.
+    def mapCodes(self, table: tuple[int]) -> "MoveSequence":
+        return MoveSequence(list(map(table.__getitem__, self.codes)))
+
+    #  Returns the sequence of moves in reverse order (see reverseMoves()).
+    def reverse(self) -> "MoveSequence":
+        return MoveSequence(
+                               [
+                                   (code if(code < MOVE_CODE_COUNT) else (OPEN_PAREN_CODE + CLOSE_PAREN_CODE - code))
+                                   for code in reversed(self.codes)
+                               ]
+                           )
+
+    #  Returns the inverse of the sequence of moves (see invertMoves()).
+    def invert(self) -> "MoveSequence":
+        return self.mapCodes(INVERT_MOVE_CODES).reverse()
+
+    #  Returns the sequence of moves with every move reduced (see reduceMoves()).
+    def reduce(self) -> "MoveSequence":
+        return self.mapCodes(REDUCE_MOVE_CODES)
+
+    #  Returns the sequence of moves with every move "unreduced" (see unreduceMoves()).
+    def unreduce(self) -> "MoveSequence":
+        return self.mapCodes(UNREDUCE_MOVE_CODES)
+
+    #  Returns the sequence of moves with every move flipped across its perpendicular axis (see flipMoves()).
+    def flip(self) -> "MoveSequence":
+        return self.mapCodes(FLIP_MOVE_CODES)
+
+    #  Returns the sequence of moves rotated by a cube rotation (see rotateMoves()).
+    def rotate(self, rotation: str) -> "MoveSequence":
+        if(not isValidCubeRotation(rotation)):
+            raise ValueError(f"rotate:\n\tparameter rotation: \"{str(rotation)}\" is not a valid cube rotation.")
+        elif(rotation.strip() == ""):
+            return MoveSequence(self.codes.copy())
+        else:
+            return self.mapCodes(ROTATE_MOVE_CODES[ROTATION_KEY_CODES[MOVE_TOKEN_CODES[rotation.strip()]]])
+
+    #  Returns the sequence of moves without any cube rotations, and without any parentheses (see removeRotations()).
+    def removeRotations(self, keepOrientation: bool = True) -> "MoveSequence":
+        return MoveSequence(removeRotationCodes(self.moveCodes(), keepOrientation))
+
+    #  Returns the sequence of moves with all adjacent like terms combined, and without any parentheses (see combineMoves()).
+    def combine(self) -> "MoveSequence":
+        return MoveSequence(combineMoveCodes(self.moveCodes()))
+
+
+#  Combines all adjacent like terms in a list of move codes (without parentheses), returning the new list of move codes.
+#  The result is built as a stack, so this takes a single linear pass, and moves that only become adjacent after the
+#  moves between them cancel out are combined as well, for example R U U' R' -> (no moves).
+def combineMoveCodes(codes: list[int]) -> list[int]:
+    result: list[int] = []
+    for code in codes:
+        if((result != []) and (MOVE_CODE_ROOT_CLASSES[result[-1]] == MOVE_CODE_ROOT_CLASSES[code])):
+            top: int = result.pop()
+            if((combined := REDUCED_MOVE_CODES[top][(MOVE_CODE_TURNS[top] + MOVE_CODE_TURNS[code]) % 4]) is not None):
+                result.append(combined)
+        else:
+            result.append(code)
+
+    return result
+
+#  Splits a list of move codes (without parentheses) into a list of lists, making splits when the axis of
+#  the next move is different than the current move (see splitMovesAxes()).
+def splitMoveCodeAxes(codes: list[int]) -> list[list[int]]:
+    result     : list[list[int]] = []
+    currentList: list[int]       = []
+    for code in codes:
+        if((currentList == []) or (MOVE_CODE_AXES[currentList[0]] == MOVE_CODE_AXES[code])):
+            currentList.append(code)
+        else:
+            result.append(currentList)
+            currentList = [code]
+    return result + [currentList]
+
+#  Sorts the moves on each axis in a list of move codes (without parentheses), in the same way as sortMoveAxes().
+def sortMoveCodeAxes(codes: list[int]) -> list[int]:
+    result: list[int] = []
+    for axis in splitMoveCodeAxes(codes):
+        result += sorted(sorted(axis, key = MOVE_CODE_ROOTS.__getitem__), key = lambda code: MOVE_TOKENS[code][0].lower())
+    return result
+
+
+#  A dictionary of unordered subsequences of moves (such as REVEAL_ROTATIONS_DICTIONARY), compiled once into an index
+#  of move codes. Every subsequence is given its priority (its order in the dictionary) and its replacement, as a tuple of
+#  move codes, and its signature (the sorted tuple of its move codes) is mapped to the priorities of every subsequence
+#  with that signature. Every move code is also mapped to the lengths of the signatures that contain it, so that only
+#  the few windows that can possibly match are ever looked up.
+class CompiledMoveDictionary:
+    __slots__ = ("index", "signatures", "replacements", "reach", "partners")
+
+    def __init__(self, dictionary: dict[tuple[str], str]) -> None:
+        self.index       : dict[int, tuple[int]]       = {}
+        self.signatures  : dict[tuple[int], list[int]] = {}
+        self.replacements: list[tuple[int]]            = []     #  of every priority
+
+        for key in dictionary:
+            replacement: tuple[int] = tuple(parseMoveCodes(dictionary[key]))
+            for t in key:
+                #  A subsequence only ever matches a run of distinct moves, in the same way as replaceSubsetInList().
+                signature: tuple[int] = tuple(sorted(set(parseMoveCodes(t))))
+                self.signatures.setdefault(signature, []).append(len(self.replacements))
+                self.replacements.append(replacement)
+                for code in signature:
+                    self.index[code] = tuple(sorted(set(self.index.get(code, ())) | {len(signature)}))
+
+        #  The moves that every move can become through a chain of replacements by a single move, and the moves that are
+        #  in a subsequence with any of those moves (see canJoin()).
+        becomes : list[set[int]] = [set() for _ in range(MOVE_CODE_COUNT)]
+        together: list[set[int]] = [set() for _ in range(MOVE_CODE_COUNT)]
+        for signature, priorities in self.signatures.items():
+            for code in signature:
+                together[code].update(signature)
+                becomes[code].update(self.replacements[priority][0] for priority in priorities if(len(self.replacements[priority]) == 1))
+
+        self.reach   : list[frozenset[int]] = []
+        self.partners: list[frozenset[int]] = []
+        for code in range(MOVE_CODE_COUNT):
+            reach: set[int]  = {code}
+            stack: list[int] = [code]
+            while(stack != []):
+                for r in becomes[stack.pop()] - reach:
+                    reach.add(r)
+                    stack.append(r)
+            self.reach.append(frozenset(reach))
+            self.partners.append(frozenset(partner for r in reach for partner in together[r]))
+        return
+
+    #  Returns whether replace() could ever match a window across the boundary between two lists of move codes, given the
+    #  last move code of the first list and the first move code of the second list. Such a window holds both of the moves
+    #  at the boundary as they are by then, which are either the same moves or what they became through replacements by
+    #  a single move (a replacement of more than one move is never matched again). If it can't, replacing the moves of
+    #  both lists together is the same as replacing the moves of each list on its own.
+    def canJoin(self, left: int, right: int) -> bool:
+        return not self.partners[left].isdisjoint(self.reach[right])
+
+    #  Returns a new list of move codes, where every subsequence in the dictionary is replaced in exactly the same way as
+    #  replaceSubsetInList() replaced them one after another, in the order of the dictionary: each subsequence replaces
+    #  the windows that match it from left to right, without overlapping, and a replacement of more than one move (just
+    #  like a replacement string there) is never matched by a later subsequence. Every window that matches a subsequence
+    #  is found in a single scan of the moves, and is kept until the turn of that subsequence comes. A window is dropped
+    #  if any of its moves has been replaced by then, and only the windows around a move replaced by a single move are
+    #  ever looked up again, so this takes linear time. Elements of the list that are not move codes are never replaced.
+    def replace(self, codes: list[int]) -> list[int]:
+        element: list[int]                                = list(codes)     #  -1 - i for the replacement opaque[i]
+        opaque : list[tuple[int]]                         = []
+        end    : int                                      = len(codes)
+        prev   : list[int]                                = list(range(-1, end - 1))
+        nxt    : list[int]                                = list(range(1, end + 1))
+        changed: list[int]                                = [0] * end       #  the number of replacements when last changed
+        windows: dict[int, list[tuple[int, tuple[int]]]] = {}              #  of every priority, with the replacements so far
+        queue  : list[int]                                = []              #  a heap of the priorities of the windows
+
+        #  Keeps a window of the moves for every subsequence that it matches, which comes after a given priority.
+        def keep(window: tuple[int], made: int, after: int) -> None:
+            for priority in self.signatures.get(tuple(sorted(element[i] for i in window)), ()):
+                if(priority > after):
+                    if(priority not in windows):
+                        windows[priority] = []
+                        heappush(queue, priority)
+                    windows[priority].append((made, window))
+            return
+
+        for i in range(end):
+            for k in self.index.get(codes[i], ()):
+                if(i + k <= end):
+                    keep(tuple(range(i, i + k)), 0, -1)
+
+        made: int = 0       #  the number of replacements so far
+        while(queue != []):
+            priority   : int        = heappop(queue)
+            replacement: tuple[int] = self.replacements[priority]
+            for kept, window in sorted(windows.pop(priority), key = itemgetter(1)):
+                if(any(changed[i] > kept for i in window)):
+                    continue
+
+                made += 1
+                for i in window:
+                    changed[i] = made
+                for i in window[1:]:
+                    nxt[prev[i]] = nxt[i]
+                    if(nxt[i] != end):
+                        prev[nxt[i]] = prev[i]
+
+                start: int = window[0]
+                if(len(replacement) == 1):
+                    #  The new move can only match later subsequences in the windows around it.
+                    element[start] = replacement[0]
+                    for k in self.index.get(replacement[0], ()):
+                        run: list[int] = [start]
+                        while((len(run) < k) and (prev[run[0]] != -1)):
+                            run.insert(0, prev[run[0]])
+                        before: int = len(run) - 1
+                        while((len(run) < before + k) and (nxt[run[-1]] != end)):
+                            run.append(nxt[run[-1]])
+                        for j in range(len(run) - k + 1):
+                            keep(tuple(run[j: j + k]), made, priority)
+                else:
+                    element[start] = -1 - len(opaque)
+                    opaque.append(replacement)
+
+        result: list[int] = []
+        i     : int       = 0
+        while(i != end):
+            result += (element[i],) if(element[i] >= 0) else opaque[-1 - element[i]]
+            i = nxt[i]
+        return result
+
+REVEAL_ROTATIONS: CompiledMoveDictionary = CompiledMoveDictionary(REVEAL_ROTATIONS_DICTIONARY)
+SIMPLIFY_CLEANUP: CompiledMoveDictionary = CompiledMoveDictionary(SIMPLIFY_CLEANUP_DICTIONARY)
+
+
+#  Simplifies all subsequences of at least three cube rotations in a list of move codes (without parentheses), in the
+#  same way as simplifyRotationTriplets(). Every such subsequence, of any length, is replaced with the canonical rotations
+#  of the orientation it reaches, in a single pass.
+def simplifyRotationTripletCodes(codes: list[int]) -> list[int]:
+    result   : list[int] = []
+    rotations: list[int] = []
+    for code in codes + [OPEN_PAREN_CODE]:      #  the parenthesis ends the last subsequence of cube rotations
+        if(IS_ROTATION_MOVE_CODE[code]):
+            rotations.append(code)
+        else:
+            if(len(rotations) >= 3):
+                result += ORIENTATION_ROTATION_CODES[rotationCodesOrientation(rotations)]
+            else:
+                result += rotations
+            rotations = []
+            result.append(code)
+
+    return result[:-1]
+
+#  Simplifies all subsequences of the form (rotation moves rotation') in a list of move codes (without parentheses),
+#  in exactly the same way as simplifyRotationPairs(). When a rotation is followed by its inverse, the moves after the
+#  inverse are simplified first, on their own, and then the moves between them are rotated and simplified again along
+#  with that result. Instead of recursing, the moves are kept in a linked list, every such suffix is simplified in place,
+#  and the state of the moves before it waits on a stack. The number of each cube rotation code left in the suffix is
+#  kept, so a rotation is only ever searched for an inverse that is actually there, and the search stops at that inverse.
+#  A result in which no rotation is followed by its inverse would be left as it is, so once only (the end of) such a
+#  result is left to simplify, it is skipped at once instead of one move at a time. If a set is given as emitted, every
+#  cube rotation code that is ever kept because no inverse of it is left after it (at any depth) is added to it.
+def simplifyRotationPairCodes(codes: list[int], emitted: set[int] | None = None) -> list[int]:
+    #  The first and last nodes are sentinels, which are never moves.
+    code     : list[int]      = [OPEN_PAREN_CODE] + codes + [CLOSE_PAREN_CODE]
+    end      : int            = len(code) - 1
+    nxt      : list[int]      = list(range(1, end + 2))
+    counts   : list[int]      = [0] * MOVE_CODE_COUNT       #  of every cube rotation code in the moves left in the suffix
+    for c in codes:
+        if(IS_ROTATION_MOVE_CODE[c]):
+            counts[c] += 1
+
+    last     : int            = 0       #  the node before the next move
+    remaining: int            = len(codes)
+    unchanged: int            = 0       #  the length of the result at the end of the suffix that would be left as it is
+    rotations: dict[int, int] = {}      #  the number of each cube rotation code in the result of the suffix so far
+    stable   : bool           = True    #  whether no rotation in the result of the suffix so far is followed by its inverse
+    length   : int            = 0       #  of the result of the suffix so far
+    waiting  : list[tuple[int, int, dict[int, int], dict[int, int], bool, int]] = []
+
+    while(True):
+        if(0 < remaining <= unchanged):
+            #  Every inverse is symmetric, so the inverses of a rotation are also the rotations it is the inverse of.
+            for c in ROTATION_INVERSE_CODES:
+                if(counts[c] > 0):
+                    stable = stable and not any(rotations.get(r, 0) for r in ROTATION_INVERSE_CODES[c])
+                    rotations[c] = rotations.get(c, 0) + counts[c]
+                    counts[c] = 0
+                    if(emitted is not None):
+                        emitted.add(c)
+            length   += remaining
+            remaining = 0
+
+        if(remaining == 0):
+            if(waiting == []):
+                break
+            else:
+                #  The rotated moves and the result of the suffix after them are simplified again with the moves before them.
+                last, midLength, midRotations, outerRotations, outerStable, outerLength = waiting.pop()
+                for c in ROTATION_INVERSE_CODES:
+                    counts[c] = midRotations.get(c, 0) + rotations.get(c, 0)
+                unchanged = length if(stable) else 0
+                remaining = midLength + length
+                rotations, stable, length = outerRotations, outerStable, outerLength
+                continue
+
+        f: int = nxt[last]
+        m: int = code[f]
+        if(IS_ROTATION_MOVE_CODE[m]):
+            inverses: set[int] = ROTATION_INVERSE_CODES[m]
+            counts[m] -= 1
+            if(any(counts[c] for c in inverses)):
+                table       : tuple[int]     = ROTATE_MOVE_CODES[ROTATION_KEY_CODES[m]]
+                midRotations: dict[int, int] = {}
+                midLength   : int            = 0
+                before      : int            = last         #  the node before the last move between them
+                j           : int            = nxt[f]
+                while((c := code[j]) not in inverses):
+                    if(IS_ROTATION_MOVE_CODE[c]):
+                        counts[c] -= 1
+                    code[j] = table[c]
+                    if(IS_ROTATION_MOVE_CODE[code[j]]):
+                        midRotations[code[j]] = midRotations.get(code[j], 0) + 1
+                    midLength += 1
+                    before     = j
+                    j          = nxt[j]
+                counts[c] -= 1
+
+                nxt[last] = nxt[f]
+                nxt[before] = nxt[j]
+                remaining -= midLength + 2
+                unchanged  = min(unchanged, remaining)
+                waiting.append((last, midLength, midRotations, rotations, stable, length))
+                last = before
+                rotations, stable, length = {}, True, 0
+                continue
+            else:
+                stable = stable and not any(rotations.get(r, 0) for r in inverses)
+                rotations[m] = rotations.get(m, 0) + 1
+                if(emitted is not None):
+                    emitted.add(m)
+        length    += 1
+        remaining -= 1
+        unchanged  = min(unchanged, remaining)
+        last       = f
+
+    result: list[int] = []
+    node  : int       = nxt[0]
+    while(node != end):
+        result.append(code[node])
+        node = nxt[node]
+    return result
+
+
+#  Removes every cube rotation from a list of move codes (without parentheses) in a single pass, keeping track of the
+#  orientation of the cube reached by the rotations so far, and rotating every other move back into the original
+#  orientation (see ORIENTATION_MOVE_CODES). If keepOrientation is True, the canonical rotations of the final orientation
+#  (at most two, see ORIENTATION_ROTATION_CODES) are added to the end, so that the new moves perform exactly the same
+#  permutation as the old moves. Otherwise, the new moves only leave the cube in a different orientation.
+def removeRotationCodes(codes: list[int], keepOrientation: bool = True) -> list[int]:
+    result     : list[int] = []
+    orientation: int       = IDENTITY_ORIENTATION
+    for code in codes:
+        if(IS_ROTATION_MOVE_CODE[code]):
+            orientation = ORIENTATION_PRODUCTS[orientation][ROTATION_ORIENTATIONS[code]]
+        else:
+            result.append(ORIENTATION_MOVE_CODES[orientation][code])
+
+    return result + (list(ORIENTATION_ROTATION_CODES[orientation]) if(keepOrientation) else [])
+
+
+#  The moves simplified by simplifyMoveCodes() are split into runs of at least this many moves, each ending where the
+#  axis of the moves changes (see MoveRun).
+SIMPLIFY_RUN_LENGTH: int = 16
+
+#  A run of consecutive moves being simplified by simplifyMoveCodes(), in a doubly linked list of runs. Every run covers
+#  a range [lo, hi) of positions that is at least as long as its moves, which keeps the runs in order: the range of a run
+#  is only ever split between the runs that its moves are split into, or joined with the ranges of the runs it is merged
+#  with. During a pass that simplifies the run, before and after are its moves before and after the current stage, and
+#  emitted and rotations are the cube rotation codes that the stage of the rotation pairs kept (see the emitted parameter
+#  of simplifyRotationPairCodes()) and that it saw, before or after it. That stage also records whether it paired any
+#  rotations, and whether its result is stable (no rotation in it is followed by an inverse, so it would be left as it
+#  is if it were simplified again). Otherwise, before and after are just its codes.
+class MoveRun:
+    __slots__ = ("codes", "before", "after", "lo", "hi", "left", "right", "isMerged", "isAlive", "version", "emitted",
+                 "rotations", "isPaired", "isStable")
+
+    def __init__(self, codes: list[int], lo: int, hi: int) -> None:
+        self.codes    : list[int]        = codes
+        self.before   : list[int]        = codes
+        self.after    : list[int]        = codes
+        self.lo       : int              = lo
+        self.hi       : int              = hi
+        self.left     : "MoveRun | None" = None
+        self.right    : "MoveRun | None" = None
+        self.isMerged : bool             = False
+        self.isAlive  : bool             = True
+        self.version  : int              = 0
+        self.emitted  : set[int]         = set()
+        self.rotations: set[int]         = set()
+        self.isPaired : bool             = False
+        self.isStable : bool             = True
+        return
+
+
+#  Simplifies a list of move codes (without parentheses) with every move simplification algorithm used by simplifyMoves(),
+#  reaching exactly the same result as the pipeline of string functions did: reduceMoves(), sortMoveAxes(), combineMoves(),
+#  revealRotations(), simplifyRotationTriplets(), simplifyRotationPairs() and simplifyCleanUp() are applied in turn, and
+#  this is repeated until it no longer shortens the moves.
+#
+#  Instead of running every pass over all of the moves, the moves are split into runs (see MoveRun), and each pass only
+#  simplifies the runs that changed in the pass before, which are kept in a worklist. A run that a pass doesn't shorten is
+#  already as simple as it gets (every replacement of a stage is shorter than what it replaces), so it is never simplified
+#  again, unless the runs next to it change. Two runs are merged as soon as a stage could act across the boundary between
+#  them: moves on the same axis (sorted and combined together), a window of a dictionary that could hold moves of both
+#  (see CompiledMoveDictionary.canJoin()), cube rotations at the end of one and the start of the other (simplified as
+#  triplets together), a cube rotation kept by the pairs of one run with an inverse in any later run (paired together),
+#  and a run that paired rotations with any later run whose pairs are not stable (every pair of rotations simplifies the
+#  moves after it again). Otherwise, each stage of the pass on both runs together is the same as on each run on its own,
+#  so the result is the same as a full pass. The number of passes is still the same as the pipeline, so it can grow with
+#  the number of moves, but once only a few moves change from one pass to the next, only the runs around those moves are
+#  simplified again.
+def simplifyMoveCodes(codes: list[int]) -> list[int]:
+    #  Combines adjacent like moves in the same way as combineMoves(), which never combines a move with the moves
+    #  before it again, even when the moves between them cancel out.
+    def combine(codes: list[int]) -> list[int]:
+        result : list[int]  = []
+        current: int | None = None
+        for code in codes:
+            if(current is None):
+                current = code
+            elif(MOVE_CODE_ROOT_CLASSES[current] == MOVE_CODE_ROOT_CLASSES[code]):
+                current = REDUCED_MOVE_CODES[current][(MOVE_CODE_TURNS[current] + MOVE_CODE_TURNS[code]) % 4]
+            else:
+                result.append(current)
+                current = code
+        return result + ([] if(current is None) else [current])
+
+    #  Simplifies rotations in the same way as simplifyRotationTriplets(), which replaces the first three rotations in
+    #  a row with at most two rotations, and then carries on from the start of those.
+    def triplets(codes: list[int]) -> list[int]:
+        result   : list[int] = []
+        rotations: list[int] = []
+        for code in codes + [OPEN_PAREN_CODE]:      #  the parenthesis ends the last subsequence of cube rotations
+            if(IS_ROTATION_MOVE_CODE[code]):
+                rotations.append(code)
+                if(len(rotations) == 3):
+                    rotations = list(ORIENTATION_ROTATION_CODES[rotationCodesOrientation(rotations)])
+            else:
+                result += rotations + [code]
+                rotations = []
+        return result[:-1]
+
+    #  The stages of a pass, where None stands for the rotation pairs (see simplify()).
+    pairsStage: int                                            = 5
+    stages    : tuple[Callable[[list[int]], list[int]] | None] = (
+                                                                 lambda codes: [REDUCE_MOVE_CODES[code] for code in codes],
+                                                                 sortMoveCodeAxes,
+                                                                 combine,
+                                                                 REVEAL_ROTATIONS.replace,
+                                                                 triplets,
+                                                                 None,
+                                                                 SIMPLIFY_CLEANUP.replace
+                                                             )
+
+    #  The runs of every cube rotation code, ordered by the start of their ranges, for every run that kept the code
+    #  (earliest) and every run that saw it (latest), and the runs that paired rotations (paired) or whose pairs are not
+    #  stable (unstable), as heaps of (lo or -lo, version, run). An entry is only current if its run is alive and still
+    #  has the same version.
+    earliest: dict[int, list[tuple[int, int, MoveRun]]] = {}
+    latest  : dict[int, list[tuple[int, int, MoveRun]]] = {}
+    paired  : list[tuple[int, int, MoveRun]]            = []
+    unstable: list[tuple[int, int, MoveRun]]            = []
+    versions: Iterator[int]                            = countFrom(1)
+
+    #  Applies a stage to a run.
+    def simplify(run: MoveRun, stage: int) -> None:
+        if(stage != pairsStage):
+            run.after = stages[stage](run.before)
+        else:
+            run.emitted   = set()
+            run.after     = simplifyRotationPairCodes(run.before, run.emitted)
+            run.rotations = {code for code in run.before + run.after if(IS_ROTATION_MOVE_CODE[code])}
+            run.version   = next(versions)
+            run.isPaired  = len(run.after) < len(run.before)
+            run.isStable  = True
+            later: set[int] = set()     #  the rotations after each move
+            for code in reversed(run.after):
+                if(IS_ROTATION_MOVE_CODE[code]):
+                    run.isStable = run.isStable and later.isdisjoint(ROTATION_INVERSE_CODES[code])
+                    later.add(code)
+
+            if(run.isPaired):
+                heappush(paired, (run.lo, run.version, run))
+            if(not run.isStable):
+                heappush(unstable, (-run.lo, run.version, run))
+            for code in run.emitted:
+                heappush(earliest.setdefault(code, []), (run.lo, run.version, run))
+            for code in run.rotations:
+                heappush(latest.setdefault(code, []), (-run.lo, run.version, run))
+        return
+
+    #  Returns the first run of a heap that is current, or None if there isn't one.
+    def current(heap: list[tuple[int, int, MoveRun]]) -> MoveRun | None:
+        while((heap != []) and ((not heap[0][2].isAlive) or (heap[0][1] != heap[0][2].version))):
+            heappop(heap)
+        return heap[0][2] if(heap != []) else None
+
+    #  Returns whether a stage (other than the rotation pairs) could act across the boundary between two runs.
+    def isJoined(left: MoveRun, right: MoveRun, stage: int) -> bool:
+        x: int = left.before[-1]
+        y: int = right.before[0]
+        if(stages[stage] in (sortMoveCodeAxes, combine)):
+            return MOVE_CODE_AXES[x] == MOVE_CODE_AXES[y]
+        elif(stages[stage] == REVEAL_ROTATIONS.replace):
+            return REVEAL_ROTATIONS.canJoin(x, y)
+        elif(stages[stage] == triplets):
+            return IS_ROTATION_MOVE_CODE[x] and IS_ROTATION_MOVE_CODE[y]
+        elif(stages[stage] == SIMPLIFY_CLEANUP.replace):
+            return SIMPLIFY_CLEANUP.canJoin(x, y)
+        else:
+            return False
+
+    #  Merges the runs from first to last into a new run in their place, and applies the current stage to it.
+    def merge(first: MoveRun, last: MoveRun, stage: int) -> MoveRun:
+        parts: list[MoveRun] = [first]
+        while(parts[-1] is not last):
+            parts.append(parts[-1].right)
+        run: MoveRun = MoveRun([code for part in parts for code in part.codes], first.lo, last.hi)
+        run.before   = [code for part in parts for code in part.before]
+        run.isMerged = True
+        run.left, run.right = first.left, last.right
+        run.left.right = run.right.left = run
+        for part in parts:
+            part.isAlive = False
+        simplify(run, stage)
+        return run
+
+    #  Splits a list of move codes, covering the range [lo, hi), into new runs linked in place of a run.
+    def split(codes: list[int], lo: int, hi: int, left: MoveRun, right: MoveRun) -> list[MoveRun]:
+        pieces: list[list[int]] = [[]]
+        for i in range(len(codes)):
+            if((len(pieces[-1]) >= SIMPLIFY_RUN_LENGTH) and (MOVE_CODE_AXES[codes[i]] != MOVE_CODE_AXES[codes[i - 1]])):
+                pieces.append([])
+            pieces[-1].append(codes[i])
+
+        runs: list[MoveRun] = []
+        for piece in pieces:
+            runs.append(MoveRun(piece, lo, hi if(len(runs) == len(pieces) - 1) else lo + len(piece)))
+            lo += len(piece)
+        for run in runs:
+            run.left, left.right = left, run
+            left = run
+        left.right, right.left = right, left
+        return runs
+
+    moves: list[int] = [code for code in codes if(code < MOVE_CODE_COUNT)]
+    if(moves == []):
+        return []
+    head  : MoveRun       = MoveRun([], -1, 0)
+    tail  : MoveRun       = MoveRun([], len(moves), len(moves))
+    active: list[MoveRun] = split(moves, 0, len(moves), head, tail)
+
+    touched  : list[MoveRun] = []       #  the runs that were next to a run that was removed in the pass before
+    firstPass: bool          = True
+    while((active != []) or (touched != [])):
+        for run in active:
+            run.before = run.after = run.codes
+
+        shrank   : bool          = False
+        neighbors: list[MoveRun] = touched
+        touched                  = []       #  the runs that are next to a run that is removed in this pass
+        for stage in range(len(stages)):
+            for run in active:
+                if(run.isAlive):
+                    run.before = run.after
+                    simplify(run, stage)
+
+            if(stage == pairsStage):
+                #  A run is merged with every run before it that kept an inverse of a rotation it saw, and with every run
+                #  after it that saw an inverse of a rotation it kept, as well as with every run before it that paired
+                #  rotations if it is not stable, and with every run after it that is not stable if it paired rotations.
+                queue: list[MoveRun] = [run for run in active if(run.isAlive and run.rotations)]
+                while(queue != []):
+                    run: MoveRun = queue.pop()
+                    if(not run.isAlive):
+                        continue
+                    first: MoveRun = run
+                    last : MoveRun = run
+                    for code in run.rotations:
+                        for inverse in ROTATION_INVERSE_CODES[code]:
+                            if(((other := current(earliest.get(inverse, []))) is not None) and (other.lo < first.lo)):
+                                first = other
+                    for code in run.emitted:
+                        for inverse in ROTATION_INVERSE_CODES[code]:
+                            if(((other := current(latest.get(inverse, []))) is not None) and (other.lo > last.lo)):
+                                last = other
+                    if((not run.isStable) and ((other := current(paired)) is not None) and (other.lo < first.lo)):
+                        first = other
+                    if(run.isPaired and ((other := current(unstable)) is not None) and (other.lo > last.lo)):
+                        last = other
+                    if((first is not run) or (last is not run)):
+                        active.append(merged := merge(first, last, stage))
+                        queue.append(merged)
+            else:
+                queue: list[MoveRun] = [run for run in active + neighbors + touched if(run.isAlive)]
+                while(queue != []):
+                    run: MoveRun = queue.pop()
+                    if(not run.isAlive):
+                        continue
+                    elif((run.left is not head) and isJoined(run.left, run, stage)):
+                        active.append(merged := merge(run.left, run, stage))
+                        queue.append(merged)
+                    elif((run.right is not tail) and isJoined(run, run.right, stage)):
+                        active.append(merged := merge(run, run.right, stage))
+                        queue.append(merged)
+
+            #  The runs left with no moves are removed, and the runs around them are checked again from then on.
+            for run in active:
+                if(run.isAlive and (run.after == [])):
+                    run.isAlive = False
+                    run.left.right, run.right.left = run.right, run.left
+                    touched += [other for other in (run.left, run.right) if((other is not head) and (other is not tail))]
+                    shrank = True
+            active = [run for run in active if(run.isAlive)]
+
+        shrank = shrank or any(len(run.after) < len(run.codes) for run in active)
+        if((not firstPass) and (not shrank)):
+            break
+
+        #  The runs that changed are split again, and simplified in the next pass, while every other run is left as it is.
+        changed: list[MoveRun] = []
+        for run in active:
+            if(run.isMerged or (len(run.after) < len(run.codes))):
+                run.isAlive = False
+                changed += split(run.after, run.lo, run.hi, run.left, run.right)
+            else:
+                run.codes = run.before = run.after
+        touched   = [run for run in touched if(run.isAlive)]
+        active    = changed
+        firstPass = False
+
+    result: list[int] = []
+    run   : MoveRun   = head.right
+    while(run is not tail):
+        result += run.codes
+        run = run.right
+    return result
+
+
+#  The stickers of every edge slot and corner slot of a cube (such as the stickers of edgeA, at the top of the up face and
+#  the top of the back face), in the same order as the pieces in the edges and corners attributes of a cube object.
+EDGE_SLOT_STICKERS: dict[str, tuple[int]] = \
+{
+    "edgeA": (9*UP    + 1, 9*BACK  + 1),
+    "edgeB": (9*UP    + 5, 9*RIGHT + 1),
+    "edgeC": (9*UP    + 7, 9*FRONT + 1),
+    "edgeD": (9*UP    + 3, 9*LEFT  + 1),
+
+    "edgeE": (9*LEFT  + 1, 9*UP    + 3),
+    "edgeF": (9*LEFT  + 5, 9*FRONT + 3),
+    "edgeG": (9*LEFT  + 7, 9*DOWN  + 3),
+    "edgeH": (9*LEFT  + 3, 9*BACK  + 5),
+
+    "edgeI": (9*FRONT + 1, 9*UP    + 7),
+    "edgeJ": (9*FRONT + 5, 9*RIGHT + 3),
+    "edgeK": (9*FRONT + 7, 9*DOWN  + 1),
+    "edgeL": (9*FRONT + 3, 9*LEFT  + 5),
+
+    "edgeM": (9*RIGHT + 1, 9*UP    + 5),
+    "edgeN": (9*RIGHT + 5, 9*BACK  + 3),
+    "edgeO": (9*RIGHT + 7, 9*DOWN  + 5),
+    "edgeP": (9*RIGHT + 3, 9*FRONT + 5),
+
+    "edgeQ": (9*BACK  + 1, 9*UP    + 1),
+    "edgeR": (9*BACK  + 5, 9*LEFT  + 3),
+    "edgeS": (9*BACK  + 7, 9*DOWN  + 7),
+    "edgeT": (9*BACK  + 3, 9*RIGHT + 5),
+
+    "edgeU": (9*DOWN  + 1, 9*FRONT + 7),
+    "edgeV": (9*DOWN  + 5, 9*RIGHT + 7),
+    "edgeW": (9*DOWN  + 7, 9*BACK  + 7),
+    "edgeX": (9*DOWN  + 3, 9*LEFT  + 7)
+}
+
+CORNER_SLOT_STICKERS: dict[str, tuple[int]] = \
+{
+    "cornerA": (9*UP    + 0, 9*LEFT  + 0, 9*BACK  + 2),
+    "cornerB": (9*UP    + 2, 9*BACK  + 0, 9*RIGHT + 2),
+    "cornerC": (9*UP    + 8, 9*RIGHT + 0, 9*FRONT + 2),
+    "cornerD": (9*UP    + 6, 9*FRONT + 0, 9*LEFT  + 2),
+
+    "cornerE": (9*LEFT  + 0, 9*BACK  + 2, 9*UP    + 0),
+    "cornerF": (9*LEFT  + 2, 9*UP    + 6, 9*FRONT + 0),
+    "cornerG": (9*LEFT  + 8, 9*FRONT + 6, 9*DOWN  + 0),
+    "cornerH": (9*LEFT  + 6, 9*DOWN  + 6, 9*BACK  + 8),
+
+    "cornerI": (9*FRONT + 0, 9*LEFT  + 2, 9*UP    + 6),
+    "cornerJ": (9*FRONT + 2, 9*UP    + 8, 9*RIGHT + 0),
+    "cornerK": (9*FRONT + 8, 9*RIGHT + 6, 9*DOWN  + 2),
+    "cornerL": (9*FRONT + 6, 9*DOWN  + 0, 9*LEFT  + 8),
+
+    "cornerM": (9*RIGHT + 0, 9*FRONT + 2, 9*UP    + 8),
+    "cornerN": (9*RIGHT + 2, 9*UP    + 2, 9*BACK  + 0),
+    "cornerO": (9*RIGHT + 8, 9*BACK  + 6, 9*DOWN  + 8),
+    "cornerP": (9*RIGHT + 6, 9*DOWN  + 2, 9*FRONT + 8),
+
+    "cornerQ": (9*BACK  + 0, 9*RIGHT + 2, 9*UP    + 2),
+    "cornerR": (9*BACK  + 2, 9*UP    + 0, 9*LEFT  + 0),
+    "cornerS": (9*BACK  + 8, 9*LEFT  + 6, 9*DOWN  + 6),
+    "cornerT": (9*BACK  + 6, 9*DOWN  + 8, 9*RIGHT + 8),
+
+    "cornerU": (9*DOWN  + 0, 9*LEFT  + 8, 9*FRONT + 6),
+    "cornerV": (9*DOWN  + 2, 9*FRONT + 8, 9*RIGHT + 6),
+    "cornerW": (9*DOWN  + 8, 9*RIGHT + 8, 9*BACK  + 6),
+    "cornerX": (9*DOWN  + 6, 9*BACK  + 8, 9*LEFT  + 6)
+}
+
+CENTER_SLOT_STICKERS: dict[str, int] = {f"center{FACES[face].upper()}": (9*face) + 4 for face in range(6)}
+
+#  The 8 corner slots and the 12 edge slots of the cubie view of a cube (see Cube.cubies()), one name for each physical
+#  slot. The first sticker of every one of these slots is on the up or down face, or else on the front or back face.
+CUBIE_CORNER_SLOTS: tuple[str] = ("cornerA", "cornerB", "cornerC", "cornerD", "cornerU", "cornerV", "cornerW", "cornerX")
+CUBIE_EDGE_SLOTS  : tuple[str] = ("edgeA", "edgeB", "edgeC", "edgeD", "edgeL", "edgeJ", "edgeT", "edgeR",
+                                  "edgeU", "edgeV", "edgeW", "edgeX")
+
+#  The stickers of the 20 slots of the cubie view, corners first.
+CUBIE_SLOT_STICKERS: tuple[tuple[int]] = tuple(CORNER_SLOT_STICKERS[slot] for slot in CUBIE_CORNER_SLOTS) + \
+                                         tuple(EDGE_SLOT_STICKERS[slot]   for slot in CUBIE_EDGE_SLOTS)
+CUBIE_SLOT_NAMES   : tuple[str]        = CUBIE_CORNER_SLOTS + CUBIE_EDGE_SLOTS
+
+#  Returns the cubie (piece, orientation) of every way the colors of a slot of the cubie view can be read: piece is the
+#  index of the slot that the piece is in on a solved cube, and orientation is the index of the first color of the piece
+#  in the colors of the slot. Twisting a corner (or flipping an edge) in its slot cycles the order of its colors.
+def generateCubiePieces() -> dict[tuple[int], tuple[int, int]]:
+    result: dict[tuple[int], tuple[int, int]] = {}
+    for slots in (CUBIE_SLOT_STICKERS[:8], CUBIE_SLOT_STICKERS[8:]):
+        for piece, slot in enumerate(slots):
+            colors: tuple[int] = tuple(SOLVED_STATE[i] for i in slot)
+            for orientation in range(len(colors)):
+                result[colors[len(colors) - orientation:] + colors[:len(colors) - orientation]] = (piece, orientation)
+    return result
+
+CUBIE_PIECES: dict[tuple[int], tuple[int, int]] = generateCubiePieces()
+
+
+#  A cube is packed into an integer of 109 bits (see encodeCube()) made of 21 fields of CUBIE_FIELD_BITS bits: one
+#  field for each slot of the cubie view (its piece and orientation, as piece * 3 + orientation for corners and
+#  piece * 2 + orientation for edges), and one field for the orientation of the whole cube (see ORIENTATIONS). The first
+#  CUBIE_LOW_FIELDS fields are in the low 64 bits and every other field is in the high 64 bits, so that no field crosses
+#  the two halves, and every packed cube is also a pair of unsigned 64-bit integers (see CubeBatch.encode()).
+CUBIE_FIELD_BITS: int = 5
+CUBIE_LOW_FIELDS: int = 12
+
+#  Returns the field of every way the colors of a slot of the cubie view can be read (see CUBIE_PIECES).
+def generateCubieFields() -> dict[tuple[int], int]:
+    return {colors: (piece * len(colors)) + orientation for colors, (piece, orientation) in CUBIE_PIECES.items()}
+
+CUBIE_FIELDS: dict[tuple[int], int] = generateCubieFields()
+
+#  CUBIE_CORNER_COLORS[field] and CUBIE_EDGE_COLORS[field] are the colors of a corner slot or an edge slot holding the
+#  piece and orientation of the field.
+CUBIE_CORNER_COLORS: tuple[tuple[int]] = tuple(sorted((colors for colors in CUBIE_FIELDS if(len(colors) == 3)), key = CUBIE_FIELDS.get))
+CUBIE_EDGE_COLORS  : tuple[tuple[int]] = tuple(sorted((colors for colors in CUBIE_FIELDS if(len(colors) == 2)), key = CUBIE_FIELDS.get))
+
+#  The orientation of a cube with the given colors on the centers of its up face and its front face, at the index
+#  (6 * up) + front, or -1 if no orientation has these colors (see CubeBatch.encode()).
+ORIENTATION_CENTER_INDICES: tuple[int] = tuple(
+                                                  next((o for o in range(len(ORIENTATIONS)) if(ORIENTATIONS[o][UP] == up and ORIENTATIONS[o][FRONT] == front)), -1)
+                                                  for up in range(6) for front in range(6)
+                                              )
+
+
+#  Cube objects are fully validated when they are created, and whenever Cube.validate() is called directly. Every other
+#  method of the Cube class only checks the cheap invariants of the state of the cube, unless DEBUG_VALIDATION is True,
+#  in which case every validation is a full validation.
+DEBUG_VALIDATION: bool = False
+
+#  Turns the debug mode of cube validation on or off (see DEBUG_VALIDATION).
+def setDebugValidation(debug: bool) -> None:
+    global DEBUG_VALIDATION
+    if(type(debug) != bool):
+        raise TypeError(f"setDebugValidation:\n\tparameter debug: \"{str(debug)}\" is not a bool.")
+    else:
+        DEBUG_VALIDATION = debug
+        return
+
+
+#  The number of pushed moves that every cube object remembers, so that they can be undone (see Cube.pushMoves()).
+#  Older pushed moves are forgotten, so that the history of a cube never grows without a bound.
+UNDO_HISTORY_LIMIT: int = 1024
+
+#  Changes the number of pushed moves that cube objects remember (see UNDO_HISTORY_LIMIT), for every cube object that
+#  pushes its first moves after this change.
+def setUndoHistoryLimit(limit: int) -> None:
+    global UNDO_HISTORY_LIMIT
+    if(type(limit) != int):
+        raise TypeError(f"setUndoHistoryLimit:\n\tparameter limit: \"{str(limit)}\" is not an integer.")
+    elif(limit < 1):
+        raise ValueError(f"setUndoHistoryLimit:\n\tparameter limit: \"{str(limit)}\" is not a positive integer.")
+    else:
+        UNDO_HISTORY_LIMIT = limit
+        return
+
+
 #  Each Rubik's Cube is represented by an instance of the object class "Cube"
 class Cube:
+    #  A cube object only has its state, its orientation, its pending moves, its cache of pieces, its history of pushed
+    #  moves and its Zobrist hash, so that millions of cube objects can be kept in memory.
+    __slots__ = ("__state", "__orientation", "__pending", "__pieces", "__history", "__zobrist")
+
     #  Initializes a cube object (its state, edges, corners, and centers attributes).
-    def __init__(self, moves: str = "") -> None:
-        #  The state of the cube is initially solved
-        self.__state: list[list[int]] = (s := deepcopy(SOLVED_CUBE))
+    #  If lazy is True, the moves performed on the cube are only performed once the state of the cube is observed.
+    def __init__(self, moves: str = "", lazy: bool = False) -> None:
+        if(type(lazy) != bool):
+            raise TypeError(f"Cube:\n\tparameter lazy: \"{str(lazy)}\" is not a bool.")
+
+        #  The state of the cube is initially solved. States are immutable, so every solved cube shares the same state.
+        self.__state: bytes = SOLVED_STATE
 
+        #  Cube rotations only change the orientation of the cube (see ORIENTATIONS), and every other move is performed on
+        #  the stickers in the frame of that orientation. The stickers are only rotated into the orientation of the cube
+        #  when the state of the cube is actually observed (see __observe()).
+        self.__orientation: int = IDENTITY_ORIENTATION
 
-        #  The following three attributes are "two-way" dictionaries, so that the location of every piece on the cube
-        #  is stored, but also what piece is currently at every specific location on the cube.
+        #  The moves performed on a lazy cube (already validated and compiled) that haven't been performed on its stickers
+        #  yet, or None if the cube isn't lazy. They are all performed at once, with a single gather, when the state of the
+        #  cube is observed (see __observe()), so a lazy cube always behaves exactly like any other cube.
+        self.__pending: list[CompiledMoves] | None = [] if(lazy) else None
+
+        #  The edges, corners, and centers attributes are "two-way" dictionaries, so that the location of every piece on
+        #  the cube is stored, but also what piece is currently at every specific location on the cube.
 
         #  In other words, the following two actions can be used with a cube object's attributes:
         #       - Give me a piece on the cube, and I can immediately tell you where that piece is
         #       - Give me a location on the cube, and I can immediately tell you what piece is at that location
         #  In these two ways, the unique locations of all (3**2 * 6) = 54 stickers on every cube are accounted for.
 
-        self.__edges: dict[str, tuple[int]] = \
-        {
-            "edgeA": (s[UP][1]   , s[BACK][1]),
-            "edgeB": (s[UP][5]   , s[RIGHT][1]),
-            "edgeC": (s[UP][7]   , s[FRONT][1]),
-            "edgeD": (s[UP][3]   , s[LEFT][1]),
-
-            "edgeE": (s[LEFT][1] , s[UP][3]),
-            "edgeF": (s[LEFT][5] , s[FRONT][3]),
-            "edgeG": (s[LEFT][7] , s[DOWN][3]),
-            "edgeH": (s[LEFT][3] , s[BACK][5]),
-
-            "edgeI": (s[FRONT][1], s[UP][7]),
-            "edgeJ": (s[FRONT][5], s[RIGHT][3]),
-            "edgeK": (s[FRONT][7], s[DOWN][1]),
-            "edgeL": (s[FRONT][3], s[LEFT][5]),
-
-            "edgeM": (s[RIGHT][1], s[UP][5]),
-            "edgeN": (s[RIGHT][5], s[BACK][3]),
-            "edgeO": (s[RIGHT][7], s[DOWN][5]),
-            "edgeP": (s[RIGHT][3], s[FRONT][5]),
-
-            "edgeQ": (s[BACK][1] , s[UP][1]),
-            "edgeR": (s[BACK][5] , s[LEFT][3]),
-            "edgeS": (s[BACK][7] , s[DOWN][7]),
-            "edgeT": (s[BACK][3] , s[RIGHT][5]),
-
-            "edgeU": (s[DOWN][1] , s[FRONT][7]),
-            "edgeV": (s[DOWN][5] , s[RIGHT][7]),
-            "edgeW": (s[DOWN][7] , s[BACK][7]),
-            "edgeX": (s[DOWN][3] , s[LEFT][7])
-        }
-        
-        self.__corners: dict[str, tuple[int]] = \
-        {
-            "cornerA": (s[UP][0]   , s[LEFT][0] , s[BACK][2]),
-            "cornerB": (s[UP][2]   , s[BACK][0] , s[RIGHT][2]),
-            "cornerC": (s[UP][8]   , s[RIGHT][0], s[FRONT][2]),
-            "cornerD": (s[UP][6]   , s[FRONT][0], s[LEFT][2]),
-
-            "cornerE": (s[LEFT][0] , s[BACK][2] , s[UP][0]),
-            "cornerF": (s[LEFT][2] , s[UP][6]   , s[FRONT][0]),
-            "cornerG": (s[LEFT][8] , s[FRONT][6], s[DOWN][0]),
-            "cornerH": (s[LEFT][6] , s[DOWN][6] , s[BACK][8]),
-
-            "cornerI": (s[FRONT][0], s[LEFT][2] , s[UP][6]),
-            "cornerJ": (s[FRONT][2], s[UP][8]   , s[RIGHT][0]),
-            "cornerK": (s[FRONT][8], s[RIGHT][6], s[DOWN][2]),
-            "cornerL": (s[FRONT][6], s[DOWN][0] , s[LEFT][8]),
-
-            "cornerM": (s[RIGHT][0], s[FRONT][2], s[UP][8]),
-            "cornerN": (s[RIGHT][2], s[UP][2]   , s[BACK][0]),
-            "cornerO": (s[RIGHT][8], s[BACK][6] , s[DOWN][8]),
-            "cornerP": (s[RIGHT][6], s[DOWN][2] , s[FRONT][8]),
-
-            "cornerQ": (s[BACK][0] , s[RIGHT][2], s[UP][2]),
-            "cornerR": (s[BACK][2] , s[UP][0]   , s[LEFT][0]),
-            "cornerS": (s[BACK][8] , s[LEFT][6] , s[DOWN][6]),
-            "cornerT": (s[BACK][6] , s[DOWN][8] , s[RIGHT][8]),
-
-            "cornerU": (s[DOWN][0] , s[LEFT][8] , s[FRONT][6]),
-            "cornerV": (s[DOWN][2] , s[FRONT][8], s[RIGHT][6]),
-            "cornerW": (s[DOWN][8] , s[RIGHT][8], s[BACK][6]),
-            "cornerX": (s[DOWN][6] , s[BACK][8] , s[LEFT][8])
-        }
-        
-        self.__centers: dict[str, int] = \
-        {
-            "centerUP"   : s[UP][4],
-            "centerLEFT" : s[LEFT][4],
-            "centerFRONT": s[FRONT][4],
-            "centerRIGHT": s[RIGHT][4],
-            "centerBACK" : s[BACK][4],
-            "centerDOWN" : s[DOWN][4]
-        }
-
-        #  The following three for-loops make the three attribute dictionaries go
-        #  from regular "one-sided" dicitonaries to "two-sided" dictionaries.
-        for key in self.__edges.copy():
-            self.__edges[self.__edges[key]] = key
-        for key in self.__corners.copy():
-            self.__corners[self.__corners[key]] = key
-        for key in self.__centers.copy():
-            self.__centers[self.__centers[key]] = key
-            
+        #  These dictionaries are only built when they are actually used, and are then kept in this cache until the state
+        #  of the cube changes. Locating a single piece doesn't build any of them (see __findSlot()).
+        self.__pieces: dict[str, dict] | None = None
+
+        #  The history of the moves pushed on the cube (see pushMoves()), created when the first moves are pushed.
+        self.__history: deque[tuple] | None = None
+
+        #  The Zobrist hash of the cube (see zobristHash()), or None until it is first needed. Once it is known, every move
+        #  updates it with only the stickers that the move changes.
+        self.__zobrist: int | None = None
 
         #  Perform the moves on the cube that were specified during initalization, if any.
-        #  Its attributes are automatically updated if needed, in the performMoves() function.
         self.performMoves(moves)
+        self.validate()
         return
 
 
+    #  Returns a copy of a cube object. The state of the cube is immutable, so the copy shares it (and its cache of
+    #  pieces, which is only ever replaced, never changed, once the state of either cube changes).
+    def copy(self) -> "Cube":
+        result: Cube = Cube.__new__(Cube)
+        result.__state       = self.__state
+        result.__orientation = self.__orientation
+        result.__pending     = None if(self.__pending is None) else self.__pending.copy()
+        result.__pieces      = self.__pieces
+        result.__history     = None
+        result.__zobrist     = self.__zobrist
+        return result
+
+    def __copy__(self) -> "Cube":
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict) -> "Cube":
+        return self.copy()
+
+    #  Two cube objects are equal if their states are equal, so cube objects can be used as keys of dictionaries and sets.
+    def __eq__(self, other: object) -> bool:
+        if(type(other) != Cube):
+            return NotImplemented
+        else:
+            return (self.__observe() == other.__observe())
+
+    def __hash__(self) -> int:
+        return hash(self.__observe())
+
+    #  Returns the state of the cube, first performing its pending moves (if it is lazy), and then rotating its stickers
+    #  into the orientation of the cube if needed. This doesn't change the cube, only how its stickers are stored.
+    def __observe(self) -> bytes:
+        self.__flush()
+        if(self.__orientation != IDENTITY_ORIENTATION):
+            self.__state       = bytes(ORIENTATION_GATHERS[self.__orientation](self.__state))
+            self.__orientation = IDENTITY_ORIENTATION
+        return self.__state
+
+    #  The state of the cube: its 54 stickers (see STICKER_COUNT), as an immutable string of bytes.
+    @property
+    def state(self) -> bytes:
+        return self.__observe()
+
+    #  Returns a new cube object with the given state (54 stickers, as bytes or any other sequence of integers).
+    @classmethod
+    def fromState(cls, state: bytes | list[int]) -> "Cube":
+        result: Cube = Cube.__new__(cls)
+        try:
+            result.__state = bytes(state)
+        except (TypeError, ValueError):
+            raise TypeError(f"fromState:\n\tparameter state: \"{str(state)}\" is not a sequence of bytes.")
+        result.__orientation = IDENTITY_ORIENTATION
+        result.__pending     = None
+        result.__pieces      = None
+        result.__history     = None
+        result.__zobrist     = None
+        result.validate()
+        return result
+
+    #  Returns the state of the cube as a list of its six faces, each face being a list of its nine stickers.
+    def __faces(self) -> list[list[int]]:
+        state: bytes = self.__observe()
+        return [list(state[(9 * face): (9 * face) + 9]) for face in range(6)]
+
+    #  Returns the cubie view of the cube: a (piece, orientation) pair for each of its 8 corner slots and then each of its
+    #  12 edge slots, in the order of CUBIE_CORNER_SLOTS and CUBIE_EDGE_SLOTS (see CUBIE_PIECES). The cube is solved if
+    #  its centers are solved and every slot has the pair (slot, 0). The view is built when needed, like the pieces.
+    def cubies(self) -> tuple[tuple[int, int]]:
+        self.validate(full = False)
+        if(self.__pieces is None):
+            self.__pieces = {}
+        if("cubies" not in self.__pieces):
+            state : bytes                 = self.__observe()
+            result: list[tuple[int, int]] = []
+            for k, slot in enumerate(CUBIE_SLOT_STICKERS):
+                if((cubie := CUBIE_PIECES.get(tuple(state[i] for i in slot))) is None):
+                    raise ValueError(f"cubies:\n\tself.__state: \"{str(state)}\" has an invalid piece in slot {k} ({CUBIE_SLOT_NAMES[k]}).")
+                result.append(cubie)
+            self.__pieces["cubies"] = tuple(result)
+        return self.__pieces["cubies"]
+
+    #  Returns a "two-way" dictionary of pieces (the colors of the stickers of every slot, and the slot of every piece),
+    #  building it from the state of the cube only if it isn't already in the cache.
+    def __pieceDictionary(self, name: str, slots: dict[str, tuple[int] | int]) -> dict:
+        if(self.__pieces is None):
+            self.__pieces = {}
+        if(name not in self.__pieces):
+            state : bytes = self.__observe()
+            result: dict  = \
+            {
+                key: (tuple(state[i] for i in slot) if(type(slot) == tuple) else state[slot])
+                for key, slot in slots.items()
+            }
+            for key in slots:
+                result[result[key]] = key
+            self.__pieces[name] = result
+        return self.__pieces[name]
+
+    @property
+    def __edges(self) -> dict[str | tuple[int], tuple[int] | str]:
+        return self.__pieceDictionary("edges", EDGE_SLOT_STICKERS)
+
+    @property
+    def __corners(self) -> dict[str | tuple[int], tuple[int] | str]:
+        return self.__pieceDictionary("corners", CORNER_SLOT_STICKERS)
+
+    @property
+    def __centers(self) -> dict[str | int, int | str]:
+        return self.__pieceDictionary("centers", CENTER_SLOT_STICKERS)
+
+    #  Returns the name of the slot (such as "edgeA") whose stickers have the given colors, scanning the slots directly
+    #  on the state of the cube, or None if no slot has these colors.
+    def __findSlot(self, colors: tuple[int] | int, slots: dict[str, tuple[int] | int]) -> str | None:
+        state: bytes = self.__observe()
+        for key, slot in slots.items():
+            if((tuple(state[i] for i in slot) if(type(slot) == tuple) else state[slot]) == colors):
+                return key
+        return None
+
+
     #  Validates a cube object, checking that its state, edges, corners, and centers attributes are of the correct form.
-    def validate(self) -> bool:
-        s: list[list[int]] = self.__state
-        if(type(self.__state) != list):
-            raise TypeError(f"validate:\n\tself.__state: \"{str(self.__state)}\" is not a list.")
-        elif(len(self.__state) != 6):
-            raise ValueError(f"validate:\n\tself.__state: \"{str(self.__state)}\" does not have a length of 6.")
+    #  The edges, corners, and centers attributes are only checked if they have been built since the last moves.
+    #  If full is False (and DEBUG_VALIDATION is False), only the length of the state and its checksum are checked,
+    #  which is enough to catch a corrupted state without checking every sticker.
+    def validate(self, full: bool = True) -> bool:
+        if((not full) and (not DEBUG_VALIDATION)):
+            if((type(self.__state) != bytes) or (len(self.__state) != STICKER_COUNT) or (sum(self.__state) != STATE_CHECKSUM)):
+                raise ValueError(f"validate:\n\tself.__state: \"{str(self.__state)}\" is not a valid state.")
+            return True
+        elif(type(self.__state) != bytes):
+            raise TypeError(f"validate:\n\tself.__state: \"{str(self.__state)}\" is not bytes.")
+        elif(len(self.__state) != STICKER_COUNT):
+            raise ValueError(f"validate:\n\tself.__state: \"{str(self.__state)}\" does not have a length of {STICKER_COUNT}.")
         else:
-            for face in self.__state:
-                if(type(face) != list):
-                    raise TypeError(f"validate:\n\tin self.__state: \"{str(face)}\" is not a list.")
-                elif(len(face) != 9):
-                    raise ValueError(f"validate:\n\tin self.__state: \"{str(face)}\" does not have a length of 9.")
-                else:
-                    for sticker in face:
-                        if(type(sticker) != int):
-                            raise TypeError(f"validate:\n\tin self.__state, in \"{str(face)}\": \"{str(sticker)}\" is not an integer.")
-                        elif(sticker not in range(6)):
-                            raise ValueError(f"validate:\n\tin self.__state, in \"{str(face)}\": \"{str(sticker)}\" is not a valid integer.")
-            
+            for sticker in self.__state:
+                if(sticker not in range(6)):
+                    raise ValueError(f"validate:\n\tin self.__state: \"{str(sticker)}\" is not a valid integer.")
+            for color in range(6):
+                if(self.__state.count(color) != 9):
+                    raise ValueError(f"validate:\n\tself.__state: \"{str(self.__state)}\" does not have nine stickers of every color.")
+
+            s     : list[list[int]] = self.__faces()
+            pieces: dict[str, dict] = self.__pieces or {}
 
-            if(type(self.__edges) != dict):
+            if(("edges" in pieces) and (type(self.__edges) != dict)):
                 raise TypeError(f"validate:\n\tself.__edges: \"{str(self.__edges)}\" is not a dictionary.")
-            elif(set(self.__edges.keys()) != \
+            elif(("edges" in pieces) and set(self.__edges.keys()) != \
                                              set(
                                                     [("edge" + chr(letter)) for letter in range(65, 89)] + \
                                                     [
@@ -1540,13 +2821,13 @@ class Cube:
                                                 )
                 ):
                 raise ValueError(f"validate:\n\self.__edges: \"{str(self.__edges)}\" does not have valid dictionary keys.")
-            elif(set(self.__edges.keys()) != set(self.__edges.values())):
+            elif(("edges" in pieces) and set(self.__edges.keys()) != set(self.__edges.values())):
                 raise ValueError(f"validate:\n\self.__edges: \"{str(self.__edges)}\" does not have valid dictionary values.")
 
             
-            elif(type(self.__corners) != dict):
+            elif(("corners" in pieces) and (type(self.__corners) != dict)):
                 raise TypeError(f"validate:\n\tself.__corners: \"{str(self.__corners)}\" is not a dictionary.")
-            elif(set(self.__corners.keys()) != \
+            elif(("corners" in pieces) and set(self.__corners.keys()) != \
                                                set(
                                                       [("corner" + chr(letter)) for letter in range(65, 89)] + \
                                                       [
@@ -1578,359 +2859,190 @@ class Cube:
                                                           (s[DOWN][0] , s[LEFT][8] , s[FRONT][6]),
                                                           (s[DOWN][2] , s[FRONT][8], s[RIGHT][6]),
                                                           (s[DOWN][8] , s[RIGHT][8], s[BACK][6]),
-                                                          (s[DOWN][6] , s[BACK][8] , s[LEFT][8])
+                                                          (s[DOWN][6] , s[BACK][8] , s[LEFT][6])
                                                       ]
                                                   )
                 ):
                 raise ValueError(f"validate:\n\tself.__corners: \"{str(self.__corners)}\" does not have valid dictionary keys.")
-            elif(set(self.__corners.keys()) != set(self.__corners.values())):
+            elif(("corners" in pieces) and set(self.__corners.keys()) != set(self.__corners.values())):
                 raise ValueError(f"validate:\n\tself.__corners: \"{str(self.__edges)}\" does not have valid dictionary values.")
 
 
-            elif(type(self.__centers) != dict):
+            elif(("centers" in pieces) and (type(self.__centers) != dict)):
                 raise TypeError(f"validate:\n\tself.__centers: \"{str(self.__centers)}\" is not a dictionary.")
-            elif(set(self.__centers.keys()) != set([(f"center{SIDE}") for SIDE in ("UP", "LEFT", "FRONT", "RIGHT", "BACK", "DOWN")]   +   [s[SIDE][4] for SIDE in range(6)])):
+            elif(("centers" in pieces) and set(self.__centers.keys()) != set([(f"center{SIDE}") for SIDE in ("UP", "LEFT", "FRONT", "RIGHT", "BACK", "DOWN")]   +   [s[SIDE][4] for SIDE in range(6)])):
                 raise ValueError(f"validate:\n\tself.__centers: \"{str(self.__centers)}\" does not have valid dictionary keys.")
-            elif(set(self.__centers.keys()) != set(self.__centers.values())):
+            elif(("centers" in pieces) and set(self.__centers.keys()) != set(self.__centers.values())):
                 raise ValueError(f"validate:\n\tself.__centers: \"{str(self.__centers)}\" does not have valid dictionary values.")
 
+            return True
+
 
     #  Prints out the state of the cube, printing out colored letters instead if colorBlindMode is set to True.
     def printCube(self, colorBlindMode: bool = False) -> None:
-        self.validate()
+        self.validate(full = False)
 
         if(type(colorBlindMode) != bool):
             raise TypeError(f"printCube:\n\tparameter colorBlindMode: \"{str(colorBlindMode)}\" is not a bool.")
         else:
             print(DEFAULT, end = "")
+            faces: list[list[int]] = self.__faces()
 
             if(not colorBlindMode):
-                for i in range(len(self.__state)):
+                for i in range(len(faces)):
                     print(FACES[i] + " face:")
-                    for j in range(len(self.__state[i])):
-                        cc: int = self.__state[i][j]   #  current color
+                    for j in range(len(faces[i])):
+                        cc: int = faces[i][j]   #  current color
                         print(
                                 (" " if(j % 3 == 0) else "") + EMOJI_SQUARES[cc],
                                 end = (" " if(((j + 1) % 3) != 0) else "\n")
                              )
-                    print(end = ("\n" if(i < len(self.__state) - 1) else ""))
+                    print(end = ("\n" if(i < len(faces) - 1) else ""))
             else:
-                for i in range(len(self.__state)):
+                for i in range(len(faces)):
                     print(FACES[i] + " face:" + BOLD)
-                    for j in range(len(self.__state[i])):
-                        cc: int = self.__state[i][j]   #  current color
+                    for j in range(len(faces[i])):
+                        cc: int = faces[i][j]   #  current color
                         print(
                                 (" " if(j % 3 == 0) else "") + (RGB_COLORS[cc] + STR_COLORS[cc]),
                                 end = (" " if(((j + 1) % 3) != 0) else "\n")
                              )
-                    print(DEFAULT, end = ("\n" if(i < len(self.__state) - 1) else ""))
+                    print(DEFAULT, end = ("\n" if(i < len(faces) - 1) else ""))
 
             return
 
 
     #  Returns whether or not a cube object is solved (each side has the same color).
     def isSolved(self) -> bool:
-        self.validate()
-        return (self.__state == SOLVED_CUBE)
+        self.validate(full = False)
+        return (self.__observe() == SOLVED_STATE)
 
 
-    #  Performs a sequence of moves (a string) on a Cube.
+    #  Performs a sequence of moves (a string, or a sequence of moves already compiled by compileMoves()) on a Cube.
     #  On success, the function returns the entire sequence of given moves that were performed on the Cube.
-    def performMoves(self, moves: str) -> str:
+    def performMoves(self, moves: str | CompiledMoves) -> str:
 
-        #  The helper function below is recursive, but the entire function only validates once to save some time.
-        self.validate()
+        #  The cube is only validated once (cheaply), before any of the moves are performed.
+        self.validate(full = False)
 
-        def performMovesHelper(self, moves: str) -> str:
-            #  First, check that moves is actually of type string.
-            if(type(moves) != str):
+        def performMovesHelper(self, moves: str | CompiledMoves) -> str:
+            #  First, check that moves is actually of type string, or already compiled.
+            if(type(moves) == CompiledMoves):
+                compiled: CompiledMoves = moves
+            elif(type(moves) != str):
                 raise TypeError(f"performMovesHelper:\n\tparameter moves: \"{str(moves)}\" is not a string.")
-            
-            #  Check that all the moves are valid.
-            for move in (tokens := moves.replace("(", " ").replace(")", " ").split()):
-                if(not isValidMove(move)):
-                    raise ValueError(f"performMovesHelper:\n\tin parameter moves: \"{move}\" is not a valid move.")
-
-            #  This is a mutually recursive helper function inside this helper function that performs a single move on
-            #  a cube object.
-            def performMove(self, move: str) -> str:                    
-                if(type(move) != str):
-                    raise TypeError(f"performMove:\n\tparameter move: \"{str(move)}\" is not a string.")
-                elif(not isValidMove(move)):
-                    raise ValueError(f"performMove:\n\tparameter move: \"{move}\" is not a valid move.")
-                elif(((m := move.strip()) != "") and (m[0] + m[-1] == "()")):
-                    return performMove(self, m[1: -1])
-                elif(m != ""):
-
-                    #  Helper function that rotates all of the stickers on a face of a cube by some increment of 90 degrees.
-                    #  Turns is any of {-1, 0, 1, 2}.
-                    def rotateFace(face: int, turns: int) -> None:
-                        if(type(face) != int):
-                            raise TypeError(f"rotateFace:\n\tparameter face: \"{str(move)}\" is not an int.")
-                        elif(type(turns) != int):
-                            raise TypeError(f"rotateFace:\n\tparameter turns: \"{str(turns)}\" is not an int.")
-                        st: list[list[int]] = deepcopy(self.__state)
-                        match turns:
-                            case 1:
-                                for i in range(len(self.__state[face])):
-                                    self.__state[face][i] = st[face][((-3 * i) + 6) % 10]
-                            case -1:
-                                for i in range(len(self.__state[face])):
-                                    self.__state[face][((-3 * i) + 6) % 10] = st[face][i]
-                            case 2:
-                                for i in range(len(self.__state[face])):
-                                    self.__state[face][i] = st[face][8 - i]
-                            case _:
-                                if(turns != 0):
-                                    raise ValueError(f"rotateFace:\n\tparameter turns: \"{str(turns)}\" is not a valid number of turns.")
-                        return
-                    
-
-                    s        : list[list[int]] = deepcopy(self.__state)
-                    reduced  : str             = reduceMove(m)
-                    moveList : str             = moveSplit(reduced)
-                    root     : str             = moveList[0]
-                    stem     : str             = moveList[1]
-
-                    match root:
-                        case "R":
-                            #  All moves internally reduce to some combination of R moves and cube rotations.
-                            match stem:
-                                case "":
-                                    self.__state[UP][2] = s[FRONT][2]
-                                    self.__state[UP][5] = s[FRONT][5]
-                                    self.__state[UP][8] = s[FRONT][8]
-
-                                    self.__state[FRONT][2] = s[DOWN][2]
-                                    self.__state[FRONT][5] = s[DOWN][5]
-                                    self.__state[FRONT][8] = s[DOWN][8]
-
-                                    rotateFace(RIGHT, 1)
-                                    
-                                    self.__state[BACK][0] = s[UP][8]
-                                    self.__state[BACK][3] = s[UP][5]
-                                    self.__state[BACK][6] = s[UP][2]
-
-                                    self.__state[DOWN][2] = s[BACK][6]
-                                    self.__state[DOWN][5] = s[BACK][3]
-                                    self.__state[DOWN][8] = s[BACK][0]
-                                case "'":
-                                    self.__state[UP][2] = s[BACK][6]
-                                    self.__state[UP][5] = s[BACK][3]
-                                    self.__state[UP][8] = s[BACK][0]
-
-                                    self.__state[FRONT][2] = s[UP][2]
-                                    self.__state[FRONT][5] = s[UP][5]
-                                    self.__state[FRONT][8] = s[UP][8]
-
-                                    rotateFace(RIGHT, -1)
-
-                                    self.__state[BACK][0] = s[DOWN][8]
-                                    self.__state[BACK][3] = s[DOWN][5]
-                                    self.__state[BACK][6] = s[DOWN][2]
-
-                                    self.__state[DOWN][2] = s[FRONT][2]
-                                    self.__state[DOWN][5] = s[FRONT][5]
-                                    self.__state[DOWN][8] = s[FRONT][8]
-                                case _:     #  case "2":
-                                    self.__state[UP][2] = s[DOWN][2]
-                                    self.__state[UP][5] = s[DOWN][5]
-                                    self.__state[UP][8] = s[DOWN][8]
-
-                                    self.__state[FRONT][2] = s[BACK][6]
-                                    self.__state[FRONT][5] = s[BACK][3]
-                                    self.__state[FRONT][8] = s[BACK][0]
-
-                                    rotateFace(RIGHT, 2)
-
-                                    self.__state[BACK][0] = s[FRONT][8]
-                                    self.__state[BACK][3] = s[FRONT][5]
-                                    self.__state[BACK][6] = s[FRONT][2]
-
-                                    self.__state[DOWN][2] = s[UP][2]
-                                    self.__state[DOWN][5] = s[UP][5]
-                                    self.__state[DOWN][8] = s[UP][8]
-                        
-                        case "L":
-                            performMovesHelper(self, f"y2 R{stem} y2")
-                        case "U":
-                            performMovesHelper(self, f"z R{stem} z'")
-                        case "D":
-                            performMovesHelper(self, f"z' R{stem} z")
-                        case "F":
-                            performMovesHelper(self, f"y' R{stem} y")
-                        case "B":
-                            performMovesHelper(self, f"y R{stem} y'")
-
-
-                        case "r" | "Rw":
-                            performMovesHelper(self, f"L{stem} x{stem}")
-                        case "l" | "Lw":
-                            performMovesHelper(self, f"R{stem} " + invertMove(f"x{stem}"))
-                        case "u" | "Uw":
-                            performMovesHelper(self, f"D{stem} y{stem}")
-                        case "d" | "Dw":
-                            performMovesHelper(self, "U" + stem + " " + invertMove(f"y{stem}"))
-                        case "f" | "Fw":
-                            performMovesHelper(self, f"B{stem} z{stem}")
-                        case "b" | "Bw":
-                            performMovesHelper(self, "F" + stem + " " + invertMove(f"z{stem}"))
-
-
-                        case "M":
-                            performMovesHelper(self, "Lw" + stem + " " + invertMove(f"L{stem}"))
-                        case "E":
-                            performMovesHelper(self, "d" + stem + " " + invertMove(f"D{stem}"))
-                        case "S":
-                            performMovesHelper(self, invertMove(f"b{stem}") + f" B{stem}")
-
-
-                        case _:
-                            match reduced.lower():
-                                case "x":
-                                    self.__state = [s[FRONT], s[LEFT], s[DOWN], s[RIGHT], s[UP], s[BACK]]
-                                    rotateFace(LEFT, -1)
-                                    rotateFace(RIGHT, 1)
-                                    rotateFace(BACK,  2)
-                                    rotateFace(DOWN,  2)
-                                case "x'":
-                                    self.__state = [s[BACK], s[LEFT], s[UP], s[RIGHT], s[DOWN], s[FRONT]]
-                                    rotateFace(LEFT,   1)
-                                    rotateFace(RIGHT, -1)
-                                    rotateFace(UP,     2)
-                                    rotateFace(BACK,   2)
-                                case "x2":
-                                    self.__state = [s[DOWN], s[LEFT], s[BACK], s[RIGHT], s[FRONT], s[UP]]
-                                    rotateFace(LEFT,  2)
-                                    rotateFace(RIGHT, 2)
-                                    rotateFace(BACK,  2)
-                                    rotateFace(FRONT,  2)
-                                
-                                case "y":
-                                    self.__state = [s[UP], s[FRONT], s[RIGHT], s[BACK], s[LEFT], s[DOWN]]
-                                    rotateFace(UP,    1)
-                                    rotateFace(DOWN, -1)
-                                case "y'":
-                                    self.__state = [s[UP], s[BACK], s[LEFT], s[FRONT], s[RIGHT], s[DOWN]]
-                                    rotateFace(UP,  -1)
-                                    rotateFace(DOWN, 1)
-                                case "y2":
-                                    self.__state = [s[UP], s[RIGHT], s[BACK], s[LEFT], s[FRONT], s[DOWN]]
-                                    rotateFace(UP,   2)
-                                    rotateFace(DOWN, 2)
-                                
-                                case "z":
-                                    self.__state = [s[LEFT], s[DOWN], s[FRONT], s[UP], s[BACK], s[RIGHT]]
-                                    for face in range(6):
-                                        rotateFace(face, 1)
-                                    rotateFace(BACK, 2)
-                                case "z'":
-                                    self.__state = [s[RIGHT], s[UP], s[FRONT], s[DOWN], s[BACK], s[LEFT]]
-                                    for face in range(6):
-                                        rotateFace(face, -1)
-                                    rotateFace(BACK, 2)
-                                case _:    #  case "z2":
-                                    self.__state = [s[DOWN], s[RIGHT], s[FRONT], s[LEFT], s[BACK], s[UP]]
-                                    for face in range(6):
-                                        rotateFace(face, 2)
-
-                return
-
-            #  If a non-zero number of moves were performed on the Cube, update its attributes
-            if(tokens != []):
-                for move in tokens:
-                    performMove(self, move)
-                    
-                s: list[list[int]] = self.__state
-
-                self.__edges = \
-                {
-                    "edgeA": (s[UP][1]   , s[BACK][1]),
-                    "edgeB": (s[UP][5]   , s[RIGHT][1]),
-                    "edgeC": (s[UP][7]   , s[FRONT][1]),
-                    "edgeD": (s[UP][3]   , s[LEFT][1]),
-
-                    "edgeE": (s[LEFT][1] , s[UP][3]),
-                    "edgeF": (s[LEFT][5] , s[FRONT][3]),
-                    "edgeG": (s[LEFT][7] , s[DOWN][3]),
-                    "edgeH": (s[LEFT][3] , s[BACK][5]),
-
-                    "edgeI": (s[FRONT][1], s[UP][7]),
-                    "edgeJ": (s[FRONT][5], s[RIGHT][3]),
-                    "edgeK": (s[FRONT][7], s[DOWN][1]),
-                    "edgeL": (s[FRONT][3], s[LEFT][5]),
-
-                    "edgeM": (s[RIGHT][1], s[UP][5]),
-                    "edgeN": (s[RIGHT][5], s[BACK][3]),
-                    "edgeO": (s[RIGHT][7], s[DOWN][5]),
-                    "edgeP": (s[RIGHT][3], s[FRONT][5]),
-
-                    "edgeQ": (s[BACK][1] , s[UP][1]),
-                    "edgeR": (s[BACK][5] , s[LEFT][3]),
-                    "edgeS": (s[BACK][7] , s[DOWN][7]),
-                    "edgeT": (s[BACK][3] , s[RIGHT][5]),
-
-                    "edgeU": (s[DOWN][1] , s[FRONT][7]),
-                    "edgeV": (s[DOWN][5] , s[RIGHT][7]),
-                    "edgeW": (s[DOWN][7] , s[BACK][7]),
-                    "edgeX": (s[DOWN][3] , s[LEFT][7])
-                }
-
-                self.__corners = \
-                {
-                    "cornerA": (s[UP][0]   , s[LEFT][0] , s[BACK][2]),
-                    "cornerB": (s[UP][2]   , s[BACK][0] , s[RIGHT][2]),
-                    "cornerC": (s[UP][8]   , s[RIGHT][0], s[FRONT][2]),
-                    "cornerD": (s[UP][6]   , s[FRONT][0], s[LEFT][2]),
-
-                    "cornerE": (s[LEFT][0] , s[BACK][2] , s[UP][0]),
-                    "cornerF": (s[LEFT][2] , s[UP][6]   , s[FRONT][0]),
-                    "cornerG": (s[LEFT][8] , s[FRONT][6], s[DOWN][0]),
-                    "cornerH": (s[LEFT][6] , s[DOWN][6] , s[BACK][8]),
-
-                    "cornerI": (s[FRONT][0], s[LEFT][2] , s[UP][6]),
-                    "cornerJ": (s[FRONT][2], s[UP][8]   , s[RIGHT][0]),
-                    "cornerK": (s[FRONT][8], s[RIGHT][6], s[DOWN][2]),
-                    "cornerL": (s[FRONT][6], s[DOWN][0] , s[LEFT][8]),
-
-                    "cornerM": (s[RIGHT][0], s[FRONT][2], s[UP][8]),
-                    "cornerN": (s[RIGHT][2], s[UP][2]   , s[BACK][0]),
-                    "cornerO": (s[RIGHT][8], s[BACK][6] , s[DOWN][8]),
-                    "cornerP": (s[RIGHT][6], s[DOWN][2] , s[FRONT][8]),
-
-                    "cornerQ": (s[BACK][0] , s[RIGHT][2], s[UP][2]),
-                    "cornerR": (s[BACK][2] , s[UP][0]   , s[LEFT][0]),
-                    "cornerS": (s[BACK][8] , s[LEFT][6] , s[DOWN][6]),
-                    "cornerT": (s[BACK][6] , s[DOWN][8] , s[RIGHT][8]),
-
-                    "cornerU": (s[DOWN][0] , s[LEFT][8] , s[FRONT][6]),
-                    "cornerV": (s[DOWN][2] , s[FRONT][8], s[RIGHT][6]),
-                    "cornerW": (s[DOWN][8] , s[RIGHT][8], s[BACK][6]),
-                    "cornerX": (s[DOWN][6] , s[BACK][8] , s[LEFT][8])
-                }
-
-                self.__centers: dict[str, int] = \
-                {
-                    "centerUP"   : s[UP][4],
-                    "centerLEFT" : s[LEFT][4],
-                    "centerFRONT": s[FRONT][4],
-                    "centerRIGHT": s[RIGHT][4],
-                    "centerBACK" : s[BACK][4],
-                    "centerDOWN" : s[DOWN][4]
-                }
-
-                for key in self.__edges.copy():
-                    self.__edges[self.__edges[key]] = key
-                for key in self.__corners.copy():
-                    self.__corners[self.__corners[key]] = key
-                for key in self.__centers.copy():
-                    self.__centers[self.__centers[key]] = key
-            
+            else:
+                compiled: CompiledMoves = compileMoves(moves)
+
+            #  If the moves actually change the state of the Cube, update its attributes
+            if(compiled.permutation != IDENTITY_PERMUTATION):
+                #  A lazy cube only performs the moves once its state is observed.
+                if(self.__pending is not None):
+                    self.__pending.append(compiled)
+                else:
+                    self.__apply(compiled)
+
+                #  The pieces are located again only when they are needed.
+                self.__pieces = None
+
             return
         
         #  Call the helper in the wrapper function
         performMovesHelper(self, moves)
-        return moves
+        return moves if(type(moves) == str) else moves.moves
+
+    #  Performs the pending moves of a lazy cube on its stickers. The permutations of the pending moves, which are already
+    #  compiled, are composed into a single permutation, without parsing the moves again or adding them to the cache.
+    def __flush(self) -> None:
+        if(self.__pending):
+            if(len(self.__pending) == 1):
+                self.__apply(self.__pending[0])
+            else:
+                permutation: tuple[int] = self.__pending[0].permutation
+                for compiled in self.__pending[1:]:
+                    permutation = composePermutations(permutation, compiled.permutation)
+                self.__apply(CompiledMoves(concatenateStringList([compiled.moves for compiled in self.__pending]), permutation))
+            self.__pending = []
+        return
+
+    #  Performs compiled moves on the stickers of the cube. The entire sequence of moves (without its cube rotations) is a
+    #  single gather over the stickers of the cube, in the frame of the orientation of the cube. Cube rotations only change
+    #  the orientation.
+    def __apply(self, compiled: CompiledMoves) -> None:
+        if(self.__zobrist is not None):
+            state  : bytes = self.__state
+            zobrist: int   = self.__zobrist
+            for offset, before, after in compiled.frameZobristUpdates(self.__orientation):
+                zobrist ^= ZOBRIST_MOVE_KEYS[offset + (6 * state[before]) + state[after]]
+            self.__zobrist = zobrist
+
+        gather: Callable[[bytes], tuple[int]] | None = compiled.frameGather(self.__orientation)
+        if(gather is not None):
+            self.__state = bytes(gather(self.__state))
+        self.__orientation = ORIENTATION_PRODUCTS[self.__orientation][compiled.orientation]
+        return
+
+    #  Performs a sequence of moves on a Cube (see performMoves()), remembering how the cube was before, so that the moves can
+    #  be undone with popMoves(). The cube is never copied: its state is immutable, so the history only keeps a reference
+    #  to the previous state. Only the last UNDO_HISTORY_LIMIT pushed moves are remembered.
+    def pushMoves(self, moves: str | CompiledMoves) -> str:
+        self.__flush()
+        if(self.__history is None):
+            self.__history = deque(maxlen = UNDO_HISTORY_LIMIT)
+
+        previous: tuple = (self.__state, self.__orientation, self.__pieces, self.__zobrist)
+        result  : str   = self.performMoves(moves)
+        self.__history.append(previous + (result,))
+        return result
+
+    #  Undoes the last moves pushed on a Cube with pushMoves(), restoring the cube to exactly how it was before they were
+    #  pushed (including any moves performed since then), and returns the moves that were undone.
+    def popMoves(self) -> str:
+        if(not self.__history):
+            raise IndexError("popMoves:\n\tthere are no pushed moves to undo.")
+        else:
+            self.__state, self.__orientation, self.__pieces, self.__zobrist, result = self.__history.pop()
+            if(self.__pending is not None):
+                self.__pending = []
+            return result
+
+    #  Returns the 64-bit Zobrist hash of the state of the cube (see ZOBRIST_KEYS). Unlike hash(), it is the same in every
+    #  program, so it can be stored with the state, for example in a transposition table. It is only computed from every
+    #  sticker the first time it is needed, and is then updated by every move, from only the stickers that moved.
+    def zobristHash(self) -> int:
+        self.__flush()
+        if(self.__zobrist is None):
+            self.__zobrist = zobristHash(self.__observe())
+        return self.__zobrist
+
+    #  Returns the state of the cube as a record of bytes: its 54 stickers, or its packed cubie code (see encodeCube()) as
+    #  16 bytes (its low and then its high 64 bits, little-endian) if packed is True.
+    def toBytes(self, packed: bool = False) -> bytes:
+        if(type(packed) != bool):
+            raise TypeError(f"toBytes:\n\tparameter packed: \"{str(packed)}\" is not a bool.")
+        else:
+            return encodeCube(self).to_bytes(PACKED_RECORD_SIZE, "little") if(packed) else self.state
+
+    #  Returns a new cube object from a record written by toBytes(), at the given offset of any buffer (such as bytes, a
+    #  bytearray, a memoryview or a memory-mapped file), without copying anything but the record itself.
+    @classmethod
+    def fromBuffer(cls, buffer: bytes | bytearray | memoryview | mmap, offset: int = 0, packed: bool = False) -> "Cube":
+        try:
+            view: memoryview = memoryview(buffer)
+        except TypeError:
+            raise TypeError(f"fromBuffer:\n\tparameter buffer: \"{str(buffer)}\" is not a buffer.")
+        size: int = PACKED_RECORD_SIZE if(packed) else STICKER_COUNT
+        if(type(offset) != int):
+            raise TypeError(f"fromBuffer:\n\tparameter offset: \"{str(offset)}\" is not an integer.")
+        elif(offset < 0 or offset + size > view.nbytes):
+            raise ValueError(f"fromBuffer:\n\tparameter offset: \"{str(offset)}\" is not the offset of a record in the buffer.")
+        else:
+            record: memoryview = view.cast("B")[offset: offset + size]
+            return decodeCube(int.from_bytes(record, "little")) if(packed) else cls.fromState(record)
+
+    #  Returns the number of pushed moves that can currently be undone with popMoves().
+    def undoDepth(self) -> int:
+        return 0 if(self.__history is None) else len(self.__history)
 
     #  Returns the string of cube rotations needed to rotate the cube such that the color0 face is on top,
     #  and the color1 face is on the front. color0 and color1 must be distinct adjacent faces on the cube.
@@ -1946,7 +3058,7 @@ class Cube:
             result: str = ""
 
             #  Rotate the cube so the desired color is on the top using only x and z rotations.
-            match self.__centers[color0].split("r")[1]:
+            match self.__findSlot(color0, CENTER_SLOT_STICKERS).split("r")[1]:
                 case "UP":
                     pass
                 case "LEFT":
@@ -1964,7 +3076,7 @@ class Cube:
             self.performMoves(firstRotation)
 
             #  Rotate the cube so the desired color is on the front using only y rotations, preserving the color on the top.
-            match self.__centers[color1].split("r")[1]:
+            match self.__findSlot(color1, CENTER_SLOT_STICKERS).split("r")[1]:
                 case "LEFT":
                     result += " y'"
                 case "FRONT":
@@ -1983,11 +3095,11 @@ class Cube:
     #  preserved. After performing this sequence of moves on the cube, crossColor would be at the edgeV position,
     #  and adjColor would be at the edgeO position. Returns -1 if the given edge is not found on the cube.
     def insertCrossEdge(self, crossColor: int, adjColor: int) -> str | int:
-        self.validate()
+        self.validate(full = False)
         if(not isValidEdge(crossColor, adjColor)):
             raise ValueError(f"insertCrossPiece:\n\parameters color0 and color1: \"({crossColor}, {adjColor})\" is not a valid edge.")
         else:
-            match self.__edges[crossColor, adjColor][-1]:
+            match (self.__findSlot((crossColor, adjColor), EDGE_SLOT_STICKERS) or "")[-1:]:
                 case "A":
                     return "U R2"
                 case "B":
@@ -2050,11 +3162,11 @@ class Cube:
     #  color1 would be at the cornerK position, and color2 would be at the cornerP position. Returns -1 if the given edge is
     #  not found on the cube.
     def insertFirstCorner(self, color0: int, color1: int, color2: int) -> str | int:
-        self.validate()
+        self.validate(full = False)
         if(not isValidCorner(color0, color1, color2)):
             raise ValueError(f"insertCrossPiece:\n\parameters color0 and color1: \"({color0}, {color1}, {color2})\" is not a valid corner.")
         else:
-            match self.__corners[color0, color1, color2][-1]:
+            match (self.__findSlot((color0, color1, color2), CORNER_SLOT_STICKERS) or "")[-1:]:
                 case "A":
                     return "(L U' L') (R U R')"
                 case "B":
@@ -2115,82 +3227,1294 @@ class Cube:
 #  end: class Cube
 
 
+#  Returns the orientation of a state (from the colors of the centers of its up face and its front face), along with the
+#  state rotated back to the orientation with its centers solved, or None if the centers of the state aren't valid.
+def centeredState(state: bytes) -> tuple[int, bytes] | None:
+    orientation: int = ORIENTATION_CENTER_INDICES[(6 * state[(9*UP) + 4]) + state[(9*FRONT) + 4]]
+    if(orientation == -1):
+        return None
+    else:
+        return orientation, bytes(map(state.__getitem__, ORIENTATION_INVERSE_PERMUTATIONS[orientation]))
 
+#  Packs a cube object into a single integer of at most 109 bits (see CUBIE_FIELD_BITS): the cubie view of the cube in
+#  its canonical orientation (with its up and front centers solved), along with its orientation.
+def encodeCube(cube: Cube) -> int:
+    if(type(cube) != Cube):
+        raise TypeError(f"encodeCube:\n\tparameter cube: \"{str(cube)}\" is not a cube object.")
+    else:
+        if((centered := centeredState(cube.state)) is None):
+            raise ValueError(f"encodeCube:\n\tparameter cube: \"{str(cube)}\" doesn't have valid centers.")
+        orientation, base = centered
+
+        low : int = 0
+        high: int = orientation
+        for k in reversed(range(len(CUBIE_SLOT_STICKERS))):
+            if((field := CUBIE_FIELDS.get(tuple(base[i] for i in CUBIE_SLOT_STICKERS[k]))) is None):
+                raise ValueError(f"encodeCube:\n\tparameter cube: \"{str(cube)}\" has an invalid piece in slot {k} ({CUBIE_SLOT_NAMES[k]}).")
+            if(k < CUBIE_LOW_FIELDS):
+                low  = (low  << CUBIE_FIELD_BITS) | field
+            else:
+                high = (high << CUBIE_FIELD_BITS) | field
+        return (high << 64) | low
+
+#  Unpacks an integer packed by encodeCube() into a new cube object.
+def decodeCube(code: int) -> Cube:
+    if(type(code) != int):
+        raise TypeError(f"decodeCube:\n\tparameter code: \"{str(code)}\" is not an integer.")
+    elif(code < 0 or code >= (1 << 128)):
+        raise ValueError(f"decodeCube:\n\tparameter code: \"{str(code)}\" is not a packed cube.")
+    else:
+        fields: list[int] = []
+        for half, count in ((code & ((1 << 64) - 1), CUBIE_LOW_FIELDS), (code >> 64, len(CUBIE_SLOT_STICKERS) - CUBIE_LOW_FIELDS + 1)):
+            for _ in range(count):
+                fields.append(half & ((1 << CUBIE_FIELD_BITS) - 1))
+                half >>= CUBIE_FIELD_BITS
+            if(half != 0):
+                raise ValueError(f"decodeCube:\n\tparameter code: \"{str(code)}\" is not a packed cube.")
+
+        base: bytearray = bytearray(SOLVED_STATE)
+        for k, field in enumerate(fields[:-1]):
+            colors: tuple[tuple[int]] = CUBIE_CORNER_COLORS if(k < 8) else CUBIE_EDGE_COLORS
+            if(field >= len(colors)):
+                raise ValueError(f"decodeCube:\n\tparameter code: \"{str(code)}\" is not a packed cube.")
+            for i, color in zip(CUBIE_SLOT_STICKERS[k], colors[field]):
+                base[i] = color
+        if(fields[-1] >= len(ORIENTATIONS)):
+            raise ValueError(f"decodeCube:\n\tparameter code: \"{str(code)}\" is not a packed cube.")
+        return Cube.fromState(bytes(map(base.__getitem__, ORIENTATION_PERMUTATIONS[fields[-1]])))
+
+
+#  A state file holds a number of cube states as records of a fixed size (see Cube.toBytes()), after a header of
+#  STATE_FILE_HEADER.size bytes: the magic bytes, whether the records are packed, and the number of records. The header
+#  is a multiple of 8 bytes, so the records of a memory-mapped state file are viewed as an array without being parsed.
+STATE_FILE_MAGIC  : bytes  = b"RUBIKCUB"
+STATE_FILE_HEADER : Struct = Struct("<8s?7xQ")
+PACKED_RECORD_SIZE: int    = 16
+
+#  Writes cube objects (an iterable of cube objects, or a batch of cubes) to a new state file, as stickers or packed
+#  (see encodeCube()), and returns the number of cubes written.
+def writeStateFile(path: str, cubes: "list[Cube] | CubeBatch", packed: bool = False) -> int:
+    if(type(packed) != bool):
+        raise TypeError(f"writeStateFile:\n\tparameter packed: \"{str(packed)}\" is not a bool.")
+
+    with open(path, "wb") as file:
+        file.write(STATE_FILE_HEADER.pack(STATE_FILE_MAGIC, packed, 0))
+        if(type(cubes) == CubeBatch):
+            file.write((cubes.encode().astype("<u8") if(packed) else cubes.states).tobytes())
+            count: int = len(cubes)
+        else:
+            count: int = 0
+            for cube in cubes:
+                if(type(cube) != Cube):
+                    raise TypeError(f"writeStateFile:\n\tin parameter cubes: \"{str(cube)}\" is not a cube object.")
+                file.write(cube.toBytes(packed))
+                count += 1
+        file.seek(0)
+        file.write(STATE_FILE_HEADER.pack(STATE_FILE_MAGIC, packed, count))
+    return count
+
+#  Memory-maps a state file, and returns the map along with whether its records are packed and the number of records.
+def mapStateFile(path: str) -> tuple[mmap, bool, int]:
+    with open(path, "rb") as file:
+        mapped: mmap = mmap(file.fileno(), 0, access = ACCESS_READ)
+    if(len(mapped) < STATE_FILE_HEADER.size):
+        raise ValueError(f"mapStateFile:\n\tparameter path: \"{path}\" is not a state file.")
+    magic, packed, count = STATE_FILE_HEADER.unpack_from(mapped)
+    if((magic != STATE_FILE_MAGIC) or
+       (len(mapped) != STATE_FILE_HEADER.size + (count * (PACKED_RECORD_SIZE if(packed) else STICKER_COUNT)))):
+        raise ValueError(f"mapStateFile:\n\tparameter path: \"{path}\" is not a state file.")
+    return mapped, packed, count
+
+#  Opens a state file as a read-only array over its memory-mapped records, without reading or parsing them: an N x 54
+#  array of bytes, or an N x 2 array of unsigned 64-bit integers if its records are packed (see CubeBatch.decode()).
+def openStateFile(path: str) -> "numpy.ndarray":
+    if(numpy is None):
+        raise ImportError("openStateFile:\n\tNumPy is not installed.")
+    else:
+        mapped, packed, count = mapStateFile(path)
+        return numpy.frombuffer(
+                                   mapped, dtype = (numpy.dtype("<u8") if(packed) else numpy.uint8),
+                                   count = count * (2 if(packed) else STICKER_COUNT), offset = STATE_FILE_HEADER.size
+                               ).reshape(count, 2 if(packed) else STICKER_COUNT)
+
+#  Yields the cube object of every record of a state file, one at a time, from the memory-mapped file.
+def iterateStateFile(path: str) -> Iterator[Cube]:
+    mapped, packed, count = mapStateFile(path)
+    size: int = PACKED_RECORD_SIZE if(packed) else STICKER_COUNT
+    for i in range(count):
+        yield Cube.fromBuffer(mapped, STATE_FILE_HEADER.size + (i * size), packed)
+
+
+#  A batch of N cube objects, stored as an N x 54 array of bytes (one row of stickers per cube, see Cube.state), so that a
+#  sequence of moves is performed on every cube of the batch at once with a single gather. This requires NumPy.
+class CubeBatch:
+    __slots__ = ("states",)
+
+    #  Initializes a batch of cubes, either from a number of solved cubes, or from an iterable of cube objects.
+    def __init__(self, cubes: int | list[Cube] = 0) -> None:
+        if(numpy is None):
+            raise ImportError("CubeBatch:\n\tNumPy is not installed.")
+        elif(type(cubes) == int):
+            if(cubes < 0):
+                raise ValueError(f"CubeBatch:\n\tparameter cubes: \"{str(cubes)}\" is not a valid number of cubes.")
+            self.states: numpy.ndarray = numpy.tile(numpy.frombuffer(SOLVED_STATE, dtype = numpy.uint8), (cubes, 1))
+        else:
+            cubes = list(cubes)
+            for cube in cubes:
+                if(type(cube) != Cube):
+                    raise TypeError(f"CubeBatch:\n\tin parameter cubes: \"{str(cube)}\" is not a cube object.")
+            self.states: numpy.ndarray = numpy.frombuffer(b"".join(cube.state for cube in cubes), dtype = numpy.uint8) \
+                                              .reshape(len(cubes), STICKER_COUNT).copy()
+        return
 
+    def __len__(self) -> int:
+        return len(self.states)
 
+    #  Returns the cube object of a single row of the batch.
+    def __getitem__(self, i: int) -> Cube:
+        return Cube.fromState(self.states[i].tobytes())
 
-#  The first function called when the main program is run
-def runMain() -> None:
-    CCN: str = STR_COLORS_FULL.index("green".strip().lower())   #  Cross Color Number
+    #  Replaces a single row of the batch with the state of a cube object.
+    def __setitem__(self, i: int, cube: Cube) -> None:
+        if(type(cube) != Cube):
+            raise TypeError(f"CubeBatch.__setitem__:\n\tparameter cube: \"{str(cube)}\" is not a cube object.")
+        else:
+            self.states[i] = numpy.frombuffer(cube.state, dtype = numpy.uint8)
+            return
+
+    #  Returns the cube objects of every row of the batch.
+    def toCubes(self) -> list[Cube]:
+        return [Cube.fromState(row.tobytes()) for row in self.states]
+
+    #  Returns a copy of the batch, which doesn't share its array of states.
+    def copy(self) -> "CubeBatch":
+        result: CubeBatch = CubeBatch.__new__(CubeBatch)
+        result.states = self.states.copy()
+        return result
+
+    #  Performs a sequence of moves (a string, or a sequence of moves already compiled by compileMoves()) on every cube
+    #  of the batch, and returns the entire sequence of given moves (see Cube.performMoves()).
+    def performMoves(self, moves: str | CompiledMoves) -> str:
+        if(type(moves) == CompiledMoves):
+            compiled: CompiledMoves = moves
+        elif(type(moves) != str):
+            raise TypeError(f"CubeBatch.performMoves:\n\tparameter moves: \"{str(moves)}\" is not a string.")
+        else:
+            compiled: CompiledMoves = compileMoves(moves)
+
+        if(compiled.permutation != IDENTITY_PERMUTATION):
+            self.states = self.states[:, compiled.permutation]
+        return compiled.moves if(type(moves) == CompiledMoves) else moves
+
+    #  Returns an array of whether or not each cube of the batch is solved.
+    def isSolved(self) -> "numpy.ndarray":
+        return (self.states == numpy.frombuffer(SOLVED_STATE, dtype = numpy.uint8)).all(axis = 1)
+
+    #  Returns an array of whether or not each cube of the batch is equal to the cube in the same row of another batch
+    #  (of the same length), or to a single cube object.
+    def __eq__(self, other: object) -> "numpy.ndarray":
+        if(type(other) == Cube):
+            return (self.states == numpy.frombuffer(other.state, dtype = numpy.uint8)).all(axis = 1)
+        elif(type(other) != CubeBatch):
+            return NotImplemented
+        elif(len(other) != len(self)):
+            raise ValueError(f"CubeBatch.__eq__:\n\tparameter other: \"{str(other)}\" does not have {len(self)} cubes.")
+        else:
+            return (self.states == other.states).all(axis = 1)
+
+    def __ne__(self, other: object) -> "numpy.ndarray":
+        result: numpy.ndarray = self.__eq__(other)
+        return result if(result is NotImplemented) else ~result
+
+    #  Batches are mutable, and compare row by row, so they can't be hashed.
+    __hash__ = None
+
+    #  Packs every cube of the batch (see encodeCube()) into an N x 2 array of unsigned 64-bit integers: the low 64 bits
+    #  and then the high 64 bits of every packed cube, so that a batch takes 16 bytes per cube. Just like encodeCube(),
+    #  this raises a ValueError (with the row of the first such cube) if any cube has invalid centers or an invalid piece.
+    def encode(self) -> "numpy.ndarray":
+        states: numpy.ndarray = self.states
+        if((invalid := numpy.flatnonzero((states >= 6).any(axis = 1))).size > 0):
+            raise ValueError(f"CubeBatch.encode:\n\tthe cube in row {int(invalid[0])} of the batch does not have valid colors.")
+
+        orientation: numpy.ndarray = numpy.asarray(ORIENTATION_CENTER_INDICES)[
+                                                                                (6 * states[:, (9*UP) + 4].astype(numpy.intp)) +
+                                                                                states[:, (9*FRONT) + 4]
+                                                                            ]
+        if((invalid := numpy.flatnonzero(orientation == -1)).size > 0):
+            raise ValueError(f"CubeBatch.encode:\n\tthe cube in row {int(invalid[0])} of the batch doesn't have valid centers.")
+        base: numpy.ndarray = numpy.take_along_axis(states, numpy.asarray(ORIENTATION_INVERSE_PERMUTATIONS)[orientation], axis = 1)
+
+        #  The field of every way the colors of a corner slot (or an edge slot) can be read, at the index of its colors as
+        #  a number in base 6. Every other index holds invalidField, which doesn't fit in a field.
+        invalidField: int                  = 1 << CUBIE_FIELD_BITS
+        fieldTables  : tuple[numpy.ndarray] = (
+                                                  numpy.full(6**2, invalidField, dtype = numpy.uint64),
+                                                  numpy.full(6**3, invalidField, dtype = numpy.uint64)
+                                              )
+        for colors, field in CUBIE_FIELDS.items():
+            fieldTables[len(colors) - 2][sum(color * (6**j) for j, color in enumerate(colors))] = field
+
+        result: numpy.ndarray = numpy.zeros((len(states), 2), dtype = numpy.uint64)
+        result[:, 1] = orientation.astype(numpy.uint64) << numpy.uint64(CUBIE_FIELD_BITS * (len(CUBIE_SLOT_STICKERS) - CUBIE_LOW_FIELDS))
+        for k, slot in enumerate(CUBIE_SLOT_STICKERS):
+            key  : numpy.ndarray = sum(base[:, i].astype(numpy.intp) * (6**j) for j, i in enumerate(slot))
+            field: numpy.ndarray = fieldTables[len(slot) - 2][key]
+            shift: int           = CUBIE_FIELD_BITS * (k if(k < CUBIE_LOW_FIELDS) else k - CUBIE_LOW_FIELDS)
+            if((invalid := numpy.flatnonzero(field == invalidField)).size > 0):
+                raise ValueError(f"CubeBatch.encode:\n\tthe cube in row {int(invalid[0])} of the batch has an invalid piece in slot {k} ({CUBIE_SLOT_NAMES[k]}).")
+            result[:, int(k >= CUBIE_LOW_FIELDS)] |= field << numpy.uint64(shift)
+        return result
+
+    #  Returns a new batch of the cubes packed in an N x 2 array of unsigned 64-bit integers by encode().
+    @classmethod
+    def decode(cls, codes: "numpy.ndarray") -> "CubeBatch":
+        if(numpy is None):
+            raise ImportError("CubeBatch.decode:\n\tNumPy is not installed.")
+        codes = numpy.asarray(codes)
+        if(codes.dtype != numpy.uint64 or codes.ndim != 2 or codes.shape[1] != 2):
+            raise TypeError(f"CubeBatch.decode:\n\tparameter codes: \"{str(codes)}\" is not an N x 2 array of unsigned 64-bit integers.")
+
+        mask: numpy.uint64  = numpy.uint64((1 << CUBIE_FIELD_BITS) - 1)
+        base: numpy.ndarray = numpy.tile(numpy.frombuffer(SOLVED_STATE, dtype = numpy.uint8), (len(codes), 1))
+        for k, slot in enumerate(CUBIE_SLOT_STICKERS):
+            shift : int           = CUBIE_FIELD_BITS * (k if(k < CUBIE_LOW_FIELDS) else k - CUBIE_LOW_FIELDS)
+            field : numpy.ndarray = ((codes[:, int(k >= CUBIE_LOW_FIELDS)] >> numpy.uint64(shift)) & mask).astype(numpy.intp)
+            colors: numpy.ndarray = numpy.asarray(CUBIE_CORNER_COLORS if(k < 8) else CUBIE_EDGE_COLORS, dtype = numpy.uint8)
+            if((field >= len(colors)).any()):
+                raise ValueError("CubeBatch.decode:\n\tparameter codes: has an invalid packed cube.")
+            base[:, slot] = colors[field]
+
+        orientation: numpy.ndarray = (codes[:, 1] >> numpy.uint64(CUBIE_FIELD_BITS * (len(CUBIE_SLOT_STICKERS) - CUBIE_LOW_FIELDS))) \
+                                     .astype(numpy.intp)
+        if((orientation >= len(ORIENTATIONS)).any()):
+            raise ValueError("CubeBatch.decode:\n\tparameter codes: has an invalid packed cube.")
+
+        result: CubeBatch = CubeBatch.__new__(cls)
+        result.states = numpy.take_along_axis(base, numpy.asarray(ORIENTATION_PERMUTATIONS)[orientation], axis = 1)
+        return result
+
+    def __repr__(self) -> str:
+        return f"CubeBatch({len(self)} cubes)"
+
+#  end: class CubeBatch
+
+
+
+
+
+
+#  The sticker that every piece of the cubie view (corners and then edges, see CUBIE_SLOT_STICKERS) has the first color of
+#  on a solved cube. The location of a piece on any cube is the sticker that has this color of the piece.
+PIECE_HOME_STICKERS: tuple[int] = tuple(slot[0] for slot in CUBIE_SLOT_STICKERS)
+
+#  Returns the location of every piece of the cubie view of a state with its centers solved (see PIECE_HOME_STICKERS).
+def pieceLocations(state: bytes) -> list[int]:
+    result: list[int] = [0] * len(CUBIE_SLOT_STICKERS)
+    for k, slot in enumerate(CUBIE_SLOT_STICKERS):
+        piece, orientation = CUBIE_PIECES[tuple(state[i] for i in slot)]
+        result[piece + (8 if(k >= 8) else 0)] = slot[orientation]
+    return result
+
+
+#  The recognition table of a stage of solve(): the signature of every case of the stage (the locations of some pieces,
+#  in order, or as a sorted tuple if the pieces don't need to be told apart), and the generator (a sequence of moves)
+#  that takes each case one step closer to the solved case. The table is generated by a breadth-first search from the
+#  solved case, so every case that the generators can solve is in the table. A sequence of moves with the permutation P
+#  moves a piece from the location j to the location P'[j], where P' is the inverse of P.
+class StageTable:
+    __slots__ = ("generators", "locationMaps", "signature", "ordered", "goal", "steps")
+
+    def __init__(self, pieces: tuple[int], generators: tuple[str], ordered: bool = True) -> None:
+        #  Every generator needs its inverse, so that the table leads back to the solved case.
+        permutations: list[tuple[int]] = [compileMoves(g).permutation for g in generators]
+        generators = list(generators)
+        for g, p in list(zip(generators, permutations)):
+            if(invertPermutation(p) not in permutations):
+                generators.append(invertMoves(g))
+                permutations.append(invertPermutation(p))
+
+        self.generators  : tuple[str]                        = tuple(generators)
+        self.locationMaps: tuple[tuple[int]]                 = tuple(invertPermutation(p) for p in permutations)
+        self.signature   : Callable[[list[int]], tuple[int]] = itemgetter(*pieces)
+        self.ordered     : bool                              = ordered
+        self.goal        : tuple[int]                        = self.key(list(PIECE_HOME_STICKERS))
+
+        inverses: list[int] = [permutations.index(invertPermutation(p)) for p in permutations]
+        self.steps: dict[tuple[int], int] = {self.goal: -1}
+        frontier: list[tuple[int]] = [self.goal]
+        while frontier:
+            newFrontier: list[tuple[int]] = []
+            for case in frontier:
+                for g, locationMap in enumerate(self.locationMaps):
+                    newCase: tuple[int] = tuple(locationMap[location] for location in case)
+                    if(not ordered):
+                        newCase = tuple(sorted(newCase))
+                    if(newCase not in self.steps):
+                        self.steps[newCase] = inverses[g]
+                        newFrontier.append(newCase)
+            frontier = newFrontier
+        return
+
+    #  Returns the signature of the case of the stage, from the locations of every piece.
+    def key(self, locations: list[int]) -> tuple[int]:
+        return self.signature(locations) if(self.ordered) else tuple(sorted(self.signature(locations)))
+
+    #  Appends a generator to moves, updating the locations of every piece.
+    def perform(self, g: int, locations: list[int], moves: list[str]) -> None:
+        moves.append(self.generators[g])
+        locations[:] = map(self.locationMaps[g].__getitem__, locations)
+        return
+
+    #  Solves the stage, appending the generators to moves and updating the locations of every piece.
+    def solve(self, locations: list[int], moves: list[str]) -> None:
+        case: tuple[int] = self.key(locations)
+        while case != self.goal:
+            if(case not in self.steps):
+                raise ValueError(f"StageTable.solve:\n\tthe case \"{str(case)}\" can't be solved.")
+            self.perform(self.steps[case], locations, moves)
+            case = self.key(locations)
+        return
+
+
+#  Every face move, which are the generators of the first two edges of the cross.
+FACE_TURNS: tuple[str] = tuple(root + stem for root in POSSIBLE_FACE_MOVE_ROOTS for stem in ("", "'", "2"))
+
+#  The pieces of the first layer (on the down face) and of the last layer (on the up face) of the cubie view.
+CROSS_PIECES     : tuple[int] = (16, 17, 18, 19)
+LAST_LAYER_PIECES: tuple[int] = (0, 1, 2, 3, 8, 9, 10, 11)
 
-    myCube         : Cube = Cube(moves := generateRandomMoves(10))
-    isValidScramble: bool = True
+#  The corner and edge of every slot of the second layer (FR, FL, BL and BR), in the order that they are solved, and the
+#  triggers that only move the pieces of the slot and of the up face (so that the cross and every other slot are preserved).
+F2L_SLOTS: tuple[tuple[int, int, tuple[str]]] = \
+(
+    (5, 13, ("R U R'", "R U' R'", "R U2 R'", "F' U F", "F' U' F", "F' U2 F")),
+    (4, 12, ("L' U L", "L' U' L", "L' U2 L", "F U F'", "F U' F'", "F U2 F'")),
+    (7, 15, ("L U L'", "L U' L'", "L U2 L'", "B' U B", "B' U' B", "B' U2 B")),
+    (6, 14, ("R' U R", "R' U' R", "R' U2 R", "B U B'", "B U' B'", "B U2 B'"))
+)
+
+#  The turns of the up face, the first generators of the stages of the first two layers and of the last layer.
+U_TURNS: tuple[str] = ("U", "U'", "U2")
+
+#  The algorithms used to orient and then to permute the last layer, all of which preserve the first two layers.
+OLL_ALGORITHMS: tuple[str] = ("R U R' U R U2 R'", "R U2 R' U' R U' R'", "F R U R' U' F'", "F U R U' R' F'")
+PLL_ALGORITHMS: tuple[str] = \
+(
+    "R U R' U' R' F R2 U' R' U' R U R' F'",
+    "R2 U R U R' U' R' U' R' U R'",
+    "R' U R' U' R' U' R' U R U R2",
+    "R' F R' B2 R F' R' B2 R2",
+    "R B' R F2 R' B R F2 R2"
+)
 
-    for i in range(1):
-        if(not
+#  Returns the recognition tables of every stage of solve(), generating them the first time that they are needed:
+#  the first two edges of the cross, the last two edges of the cross (with moves that preserve the first two), each
+#  slot of the first two layers (with the triggers of that slot and of every slot that is solved after it, so that a
+#  piece stuck in a later slot is taken out of it), the orientation of the last layer, and the permutation of the last layer.
+@lru_cache(maxsize = None)
+def solveStageTables() -> tuple[StageTable]:
+    return (
+               StageTable(CROSS_PIECES[:2], FACE_TURNS),
+               StageTable(CROSS_PIECES, U_TURNS + ("L", "L'", "L2", "B", "B'", "B2") +
+                                        tuple(f"{a} U{stem} {b}" for a, b in (("R", "R'"), ("R'", "R"), ("F", "F'"), ("F'", "F"))
+                                                                 for stem in ("", "'", "2"))),
+           ) +  \
+           tuple(
+                    StageTable(F2L_SLOTS[i][:2], U_TURNS + tuple(trigger for slot in F2L_SLOTS[i:] for trigger in slot[2]))
+                    for i in range(len(F2L_SLOTS))
+                ) +  \
            (
-               myCube._Cube__centers["centerUP"   ] == FLIP_COLOR[myCube._Cube__centers["centerDOWN"]] and  \
-               myCube._Cube__centers["centerRIGHT"] == FLIP_COLOR[myCube._Cube__centers["centerLEFT"]] and  \
-               myCube._Cube__centers["centerFRONT"] == FLIP_COLOR[myCube._Cube__centers["centerBACK"]] and  \
-               isValidCorner(myCube._Cube__centers["centerUP"   ],
-                             myCube._Cube__centers["centerRIGHT"],
-                             myCube._Cube__centers["centerFRONT"])
+               StageTable(LAST_LAYER_PIECES, U_TURNS + OLL_ALGORITHMS, ordered = False),
+               StageTable(LAST_LAYER_PIECES, U_TURNS + PLL_ALGORITHMS)
            )
-        ):
-            isValidScramble = False
-            print("Sorry, the colors you entered don't make a valid Rubik's cube, the center pieces are incorrect.\n" +  \
-                  "Remember that this program only solves Rubik's cubes that use the standard western (\"BOY\") color scheme.\nTry again:")
-            break
-        
-        initialRotations: str = myCube.rotatePosition(FLIP_COLOR[CCN], BLUE if(CCN not in [BLUE, GREEN]) else WHITE)
-        print(f"{moves} {initialRotations}".strip())
-        myCube.performMoves(initialRotations)       #  rotate the cube so that the cross color is on the bottom
-        myCube.printCube()
-        print("\n" * 5)
-
-        COLOR_SCHEME: dict[str, list[Any]] = {
-            "integer": [
-                CCN,
-                myCube._Cube__centers["centerRIGHT"],
-                myCube._Cube__centers["centerBACK"],
-                myCube._Cube__centers["centerLEFT"],
-                myCube._Cube__centers["centerFRONT"],
-                FLIP_COLOR[CCN]
-            ]
-        }
-        COLOR_SCHEME["word"]: list[str] = [STR_COLORS_FULL[x] for x in COLOR_SCHEME["integer"]]
-        COLOR_SCHEME["RGB" ]: list[str] = [RGB_COLORS     [x] for x in COLOR_SCHEME["integer"]]
-        
-        solveBreakdown: list[str]  = [f"{BOLD}{UNDERLINE}Solve Breakdown{DEFAULT}{BOLD}:{DEFAULT}\n"]
-        fullSolution  : str        = ""
-        indent        : int        = 0
-
-        solveBreakdown.append(f"{BOLD}Rotate the entire cube so that the face with the cross color is on the bottom:{DEFAULT} {initialRotations}\n\n" +  \
-                            f"{BOLD}The first (bottom) layer:")
-        indent += 1
-        solveBreakdown.append(("   " * indent) + f"{ITALICS}Solving the cross:{DEFAULT}")
-        indent += 1
-
-
-        #  Solving the cross of the first layer
-        for i in range(len(COLOR_SCHEME["integer"][1: 5])):
-            if((newPart := myCube.insertCrossEdge(CCN, COLOR_SCHEME["integer"][i + 1])) == -1):
-                isValidScramble = False
-                print("Sorry, the colors you entered don't make a valid Rubik's cube, the edge pieces are incorrect.\n" +  \
-                      "Remember that this program only solves Rubik's cubes that use the standard western (\"BOY\") color scheme.\nTry again:")
+
+#  Returns the moves of every stage of the layer by layer method for a cube object: the rotation back to the orientation
+#  with the centers solved, the first two and the last two edges of the cross on the down face, each of the four slots
+#  of the first two layers (FR, FL, BL and BR), and then the orientation and the permutation of the last layer. The
+#  corners of the first layer aren't a stage of their own: each one is solved with the edge of the second layer above
+#  it, as a pair of its slot (see F2L_SLOTS). Every stage is solved from its recognition table (see StageTable), and the
+#  cube object itself is never changed.
+def solveStages(cube: Cube) -> list[str]:
+    if(type(cube) != Cube):
+        raise TypeError(f"solveStages:\n\tparameter cube: \"{str(cube)}\" is not a cube object.")
+
+    #  First, rotate the cube back to the orientation with its centers solved.
+    if((centered := centeredState(cube.state)) is None):
+        raise ValueError(f"solveStages:\n\tparameter cube: \"{str(cube)}\" doesn't have valid centers.")
+    orientation, base = centered
+    stages: list[str] = [invertMoves(concatenateStringList([MOVE_TOKENS[code] for code in ORIENTATION_ROTATION_CODES[orientation]]))]
+    try:
+        locations: list[int] = pieceLocations(base)
+    except KeyError:
+        raise ValueError(f"solveStages:\n\tparameter cube: \"{str(cube)}\" doesn't have valid pieces.")
+
+    try:
+        for table in solveStageTables():
+            moves: list[str] = []
+            table.solve(locations, moves)
+            stages.append(concatenateStringList(moves))
+    except ValueError:
+        raise ValueError(f"solveStages:\n\tparameter cube: \"{str(cube)}\" can't be solved.")
+
+    return stages
+
+#  Returns a sequence of moves that solves a cube object with the layer by layer method (see solveStages()), and the
+#  cube object itself is never changed.
+def solve(cube: Cube) -> str:
+    if(type(cube) != Cube):
+        raise TypeError(f"solve:\n\tparameter cube: \"{str(cube)}\" is not a cube object.")
+
+    #  Adjacent moves of the stages are combined (see combineMoves()), which is nearly as short as simplifyMoves() would be.
+    return combineMoves(concatenateStringList(solveStages(cube)))
+
+
+#  The two-phase solver (Kociemba's algorithm) solves a cube with the face turns in two phases. The first phase brings
+#  the cube into the subgroup <U, D, R2, L2, F2, B2>, where every corner and edge is oriented and the four edges of the
+#  middle layer (between the up and down faces) are in the middle layer. The second phase solves the cube with only the
+#  moves of that subgroup. Both phases search on coordinates of the cubie view of the cube (see Cube.cubies()), with
+#  move tables (the coordinate reached by every move from every coordinate) and pruning tables (the number of moves
+#  needed to solve every pair of coordinates), which are generated once and then saved to TWO_PHASE_TABLES_PATH.
+TWO_PHASE_TABLES_PATH: str = joinPath(expanduser("~"), ".cache", "rubiksCubeSolver", "twoPhaseTables.bin")
+
+#  The moves of the second phase, as indices of FACE_TURNS.
+PHASE_2_MOVES: tuple[int] = tuple(FACE_TURNS.index(move) for move in ("U", "U'", "U2", "D", "D'", "D2", "R2", "L2", "F2", "B2"))
+
+#  The edges of the middle layer, and the edges of the up and down faces, in the cubie view.
+SLICE_EDGES: tuple[int] = (4, 5, 6, 7)
+UD_EDGES   : tuple[int] = (0, 1, 2, 3, 8, 9, 10, 11)
+
+#  The number of values of every coordinate: the orientations of the corners (twist) and of the edges (flip), the slots
+#  of the middle layer edges (slice), the permutation of the corners, the permutation of the edges of the up and down
+#  faces, and the permutation of the middle layer edges (the last three are only coordinates of the second phase).
+TWIST_COUNT       : int = 3**7
+FLIP_COUNT        : int = 2**11
+SLICE_COUNT       : int = comb(12, 4)
+CORNER_PERM_COUNT : int = 40320
+UD_EDGE_PERM_COUNT: int = 40320
+SLICE_PERM_COUNT  : int = 24
+
+#  The cubie view of every face turn, as four tuples: the piece that every corner slot receives, the orientation that it
+#  receives, and the same for every edge slot.
+def generateFaceTurnCubies() -> tuple[tuple[tuple[int]]]:
+    result: list[tuple[tuple[int]]] = []
+    for move in FACE_TURNS:
+        cubies: tuple[tuple[int, int]] = Cube(move).cubies()
+        result.append((
+                          tuple(piece for piece, _ in cubies[:8]), tuple(orientation for _, orientation in cubies[:8]),
+                          tuple(piece for piece, _ in cubies[8:]), tuple(orientation for _, orientation in cubies[8:])
+                      ))
+    return tuple(result)
+
+FACE_TURN_CUBIES: tuple[tuple[tuple[int]]] = generateFaceTurnCubies()
+
+#  Returns the rank of a permutation of range(n) among all of the permutations of range(n), and the permutation of a rank.
+#  A shorter p (len(p) distinct values of range(n)) is ranked among all of the sequences of len(p) distinct values of
+#  range(n), in the order of itertools.permutations(range(n), len(p)).
+def permutationRank(p: list[int], n: int | None = None) -> int:
+    result: int = 0
+    for i in range(len(p)):
+        result = (result * ((len(p) if(n is None) else n) - i)) + p[i] - sum(1 for j in range(i) if(p[j] < p[i]))
+    return result
+
+def permutationFromRank(rank: int, n: int) -> list[int]:
+    digits: list[int] = [0] * n
+    for i in reversed(range(n)):
+        rank, digits[i] = divmod(rank, n - i)
+    available: list[int] = list(range(n))
+    return [available.pop(digit) for digit in digits]
+
+#  Returns the parity of a permutation (0 if it is even, and 1 if it is odd).
+def permutationParity(p: list[int]) -> int:
+    return sum(1 for i in range(len(p)) for j in range(i + 1, len(p)) if(p[i] > p[j])) % 2
+
+#  Returns the rank of the (sorted) slots of the middle layer edges among all of the sets of four of the twelve edge
+#  slots, and the slots of a rank.
+def sliceRank(slots: list[int]) -> int:
+    return sum(comb(slot, i + 1) for i, slot in enumerate(sorted(slots)))
+
+def sliceFromRank(rank: int) -> list[int]:
+    slots: list[int] = []
+    for i in reversed(range(4)):
+        slot: int = i
+        while comb(slot + 1, i + 1) <= rank:
+            slot += 1
+        rank -= comb(slot, i + 1)
+        slots.append(slot)
+    return sorted(slots)
+
+#  The slice coordinate of a solved cube, which is the goal of the first phase (as are a twist and a flip of 0).
+SLICE_GOAL: int = sliceRank(list(SLICE_EDGES))
+
+#  The coordinates of the cubie view of a cube (the pieces and orientations of its corner slots and edge slots).
+def twistCoordinate(co: list[int]) -> int:
+    return sum(co[k] * (3**k) for k in range(7))
+
+def flipCoordinate(eo: list[int]) -> int:
+    return sum(eo[k] * (2**k) for k in range(11))
+
+def sliceCoordinate(ep: list[int]) -> int:
+    return sliceRank([k for k in range(12) if(ep[k] in SLICE_EDGES)])
+
+def udEdgePermCoordinate(ep: list[int]) -> int:
+    return permutationRank([UD_EDGES.index(ep[k]) for k in UD_EDGES])
+
+def slicePermCoordinate(ep: list[int]) -> int:
+    return permutationRank([SLICE_EDGES.index(ep[k]) for k in SLICE_EDGES])
+
+
+#  The move tables and pruning tables of the two-phase solver. A move table holds the coordinate reached by the move m
+#  from the coordinate c at the index (c * moveCount) + m, for all 18 face turns in the first phase, and for the 10
+#  moves of PHASE_2_MOVES in the second phase. A pruning table holds the number of moves needed to solve the pair of
+#  coordinates (a, b) at the index (a * countB) + b.
+class TwoPhaseTables:
+    TABLES: tuple[str] = (
+                             "twistMove", "flipMove", "sliceMove", "cornerPermMove", "udEdgePermMove", "slicePermMove",
+                             "twistSlicePrune", "flipSlicePrune", "cornerSlicePermPrune", "udEdgeSlicePermPrune"
+                         )
+    __slots__ = ("mapping",) + TABLES
+
+    #  The magic bytes of the file that the tables are saved to (see writeTableFile()).
+    FILE_MAGIC: bytes = b"TWOPHAS2"
+
+    #  Holds the tables of a dictionary, read from mapping (a memory-mapped file or a shared memory block, which is kept
+    #  open for as long as the tables are), or generated if mapping is None.
+    def __init__(self, mapping: Any, tables: dict[str, "array | bytearray | memoryview"]) -> None:
+        self.mapping = mapping
+        for name in TwoPhaseTables.TABLES:
+            setattr(self, name, tables[name])
+        return
+
+    #  Generates every table from scratch, which takes a while (see twoPhaseTables()), with a pool of processes worker
+    #  processes (one per CPU by default) for the pruning tables, which resume from the checkpoints next to the file path
+    #  if they were interrupted (see generatePruningTable()).
+    @classmethod
+    def generate(cls, path: str = TWO_PHASE_TABLES_PATH, processes: int | None = None) -> "TwoPhaseTables":
+        result: TwoPhaseTables = cls.__new__(cls)
+        result.mapping         = None
+
+        result.twistMove = array("H")
+        for twist in range(TWIST_COUNT):
+            co: list[int] = [(twist // (3**k)) % 3 for k in range(7)]
+            co.append(-sum(co) % 3)
+            for cp, turnCo, _, _ in FACE_TURN_CUBIES:
+                result.twistMove.append(twistCoordinate([(co[cp[k]] + turnCo[k]) % 3 for k in range(8)]))
+
+        result.flipMove = array("H")
+        for flip in range(FLIP_COUNT):
+            eo: list[int] = [(flip >> k) & 1 for k in range(11)]
+            eo.append(sum(eo) % 2)
+            for _, _, ep, turnEo in FACE_TURN_CUBIES:
+                result.flipMove.append(flipCoordinate([(eo[ep[k]] + turnEo[k]) % 2 for k in range(12)]))
+
+        result.sliceMove = array("H")
+        for rank in range(SLICE_COUNT):
+            slots: list[int] = sliceFromRank(rank)
+            for _, _, ep, _ in FACE_TURN_CUBIES:
+                result.sliceMove.append(sliceRank([k for k in range(12) if(ep[k] in slots)]))
+
+        phase2Cubies: list[tuple[tuple[int]]] = [FACE_TURN_CUBIES[m] for m in PHASE_2_MOVES]
+
+        result.cornerPermMove = array("H")
+        for rank in range(CORNER_PERM_COUNT):
+            corners: list[int] = permutationFromRank(rank, 8)
+            for cp, _, _, _ in phase2Cubies:
+                result.cornerPermMove.append(permutationRank([corners[cp[k]] for k in range(8)]))
+
+        result.udEdgePermMove = array("H")
+        for rank in range(UD_EDGE_PERM_COUNT):
+            edges: list[int] = list(range(12))
+            for k, i in zip(UD_EDGES, permutationFromRank(rank, 8)):
+                edges[k] = UD_EDGES[i]
+            for _, _, ep, _ in phase2Cubies:
+                result.udEdgePermMove.append(udEdgePermCoordinate([edges[ep[k]] for k in range(12)]))
+
+        result.slicePermMove = array("H")
+        for rank in range(SLICE_PERM_COUNT):
+            edges: list[int] = list(range(12))
+            for k, i in zip(SLICE_EDGES, permutationFromRank(rank, 4)):
+                edges[k] = SLICE_EDGES[i]
+            for _, _, ep, _ in phase2Cubies:
+                result.slicePermMove.append(slicePermCoordinate([edges[ep[k]] for k in range(12)]))
+
+        processes = (cpu_count() or 1) if(processes is None) else processes
+        for name, moveA, moveB, countB, moveCount, goal in (
+                ("twistSlicePrune"     , result.twistMove     , result.sliceMove    , SLICE_COUNT     , len(FACE_TURNS)   , SLICE_GOAL),
+                ("flipSlicePrune"      , result.flipMove      , result.sliceMove    , SLICE_COUNT     , len(FACE_TURNS)   , SLICE_GOAL),
+                ("cornerSlicePermPrune", result.cornerPermMove, result.slicePermMove, SLICE_PERM_COUNT, len(PHASE_2_MOVES), 0),
+                ("udEdgeSlicePermPrune", result.udEdgePermMove, result.slicePermMove, SLICE_PERM_COUNT, len(PHASE_2_MOVES), 0)):
+            setattr(result, name, generatePruningTable(moveA, moveB, countB, moveCount, goal, path + f".{name}.checkpoint", processes))
+        return result
+
+    #  Removes the checkpoints of generate() next to the file path, once the tables are saved to it.
+    @classmethod
+    def removeCheckpoints(cls, path: str) -> None:
+        for name in cls.TABLES:
+            if(exists(path + f".{name}.checkpoint")):
+                remove(path + f".{name}.checkpoint")
+        return
+
+    #  Saves every table to a binary file (see writeTableFile()).
+    def save(self, path: str) -> None:
+        writeTableFile(path, TwoPhaseTables.FILE_MAGIC, {name: getattr(self, name) for name in TwoPhaseTables.TABLES})
+        return
+
+    #  Memory-maps every table of a binary file saved by save().
+    @classmethod
+    def load(cls, path: str) -> "TwoPhaseTables":
+        mapping, tables = mapTableFile(path, cls.FILE_MAGIC)
+        for name in cls.TABLES:
+            if(name not in tables):
+                raise ValueError(f"TwoPhaseTables.load:\n\tparameter path: \"{path}\" doesn't have the table \"{name}\".")
+        return cls(mapping, tables)
+
+
+#  Generates a pruning table with a breadth-first search from the goal, over the pairs of coordinates of two move tables.
+#  Every entry that can't be reached keeps the value 255. With NumPy, the search is the one of the pattern databases (see
+#  generatePatternDatabase()), split across processes processes and resumed from the file checkpointPath. Otherwise, it
+#  runs in this process alone, without any checkpoint.
+def generatePruningTable(moveA: array, moveB: array, countB: int, moveCount: int, goal: int, checkpointPath: str, processes: int) -> bytearray:
+    if(numpy is not None):
+        size  : int           = (len(moveA) // moveCount) * countB
+        packed: numpy.ndarray = numpy.frombuffer(generatePatternDatabase("pruning", size, goal,
+                                                                         {"moveA": numpy.frombuffer(moveA, numpy.uint16).reshape(-1, moveCount),
+                                                                          "moveB": numpy.frombuffer(moveB, numpy.uint16).reshape(-1, moveCount)},
+                                                                         checkpointPath, processes), numpy.uint8)
+        depths: numpy.ndarray = numpy.empty(len(packed) * 2, numpy.uint8)
+        depths[0::2] = packed & 15
+        depths[1::2] = packed >> 4
+        depths       = depths[:size]
+        depths[depths == 15] = 255
+        return bytearray(depths.tobytes())
+
+    result  : bytearray = bytearray(b"\xff") * ((len(moveA) // moveCount) * countB)
+    frontier: list[int] = [goal]
+    depth   : int       = 0
+    result[goal] = 0
+    while frontier:
+        depth += 1
+        newFrontier: list[int] = []
+        for index in frontier:
+            a, b = divmod(index, countB)
+            a *= moveCount
+            b *= moveCount
+            for m in range(moveCount):
+                newIndex: int = (moveA[a + m] * countB) + moveB[b + m]
+                if(result[newIndex] == 255):
+                    result[newIndex] = depth
+                    newFrontier.append(newIndex)
+        frontier = newFrontier
+    return result
+
+#  Returns the tables of the two-phase solver, loading them from a file if it exists, or else generating them once (which
+#  takes a while) and saving them to the file, so that they are only ever generated once. If the file can't be written,
+#  the generated tables are still returned. In a worker process of solveInParallel(), the tables are the ones that it
+#  attached from shared memory instead.
+@lru_cache(maxsize = None)
+def twoPhaseTables(path: str = TWO_PHASE_TABLES_PATH) -> TwoPhaseTables:
+    if("twoPhase" in SHARED_SOLVER_TABLES):
+        return SHARED_SOLVER_TABLES["twoPhase"]
+    elif(exists(path)):
+        return TwoPhaseTables.load(path)
+    else:
+        tables: TwoPhaseTables = TwoPhaseTables.generate(path)
+        try:
+            tables.save(path)
+            TwoPhaseTables.removeCheckpoints(path)
+        except OSError:
+            pass
+        return tables
+
+#  Returns the orientation of a cube object (see centeredState()) and the cubie view of the cube with its centers solved,
+#  as four lists: the piece of every corner slot, the orientation of every corner slot, and the same for every edge slot.
+#  Raises a ValueError naming the function functionName if the cube can't be solved.
+def solvableCubies(cube: Cube, functionName: str) -> tuple[int, list[int], list[int], list[int], list[int]]:
+    if((centered := centeredState(cube.state)) is None):
+        raise ValueError(f"{functionName}:\n\tparameter cube: \"{str(cube)}\" doesn't have valid centers.")
+    orientation, base = centered
+    try:
+        cubies: list[tuple[int, int]] = [CUBIE_PIECES[tuple(base[i] for i in slot)] for slot in CUBIE_SLOT_STICKERS]
+    except KeyError:
+        raise ValueError(f"{functionName}:\n\tparameter cube: \"{str(cube)}\" doesn't have valid pieces.")
+    cp: list[int] = [piece for piece, _ in cubies[:8]]
+    co: list[int] = [orientation for _, orientation in cubies[:8]]
+    ep: list[int] = [piece for piece, _ in cubies[8:]]
+    eo: list[int] = [orientation for _, orientation in cubies[8:]]
+    if((sorted(cp) != list(range(8))) or (sorted(ep) != list(range(12))) or (sum(co) % 3 != 0) or (sum(eo) % 2 != 0) or
+       ((permutationParity(cp) != permutationParity(ep)))):
+        raise ValueError(f"{functionName}:\n\tparameter cube: \"{str(cube)}\" can't be solved.")
+    return orientation, cp, co, ep, eo
+
+#  Returns a sequence of at most maxLength face turns (after any cube rotations needed to solve the orientation of the
+#  cube) that solves a cube object, found with the two-phase solver. The cube object itself is never changed.
+def solveTwoPhase(cube: Cube, maxLength: int = 22) -> str:
+    if(type(cube) != Cube):
+        raise TypeError(f"solveTwoPhase:\n\tparameter cube: \"{str(cube)}\" is not a cube object.")
+    elif(type(maxLength) != int):
+        raise TypeError(f"solveTwoPhase:\n\tparameter maxLength: \"{str(maxLength)}\" is not an integer.")
+    orientation, cp, co, ep, eo = solvableCubies(cube, "solveTwoPhase")
+    t                   : TwoPhaseTables = twoPhaseTables()
+    twistMove, flipMove, sliceMove       = t.twistMove, t.flipMove, t.sliceMove
+    cornerPermMove, udEdgePermMove       = t.cornerPermMove, t.udEdgePermMove
+    slicePermMove                        = t.slicePermMove
+    twistSlicePrune, flipSlicePrune      = t.twistSlicePrune, t.flipSlicePrune
+    cornerSlicePrune, udEdgeSlicePrune   = t.cornerSlicePermPrune, t.udEdgeSlicePermPrune
+    moveCount1          : int            = len(FACE_TURNS)
+    moveCount2          : int            = len(PHASE_2_MOVES)
+    path                : list[int]      = []
+
+    #  A face is never turned twice in a row, and of two opposite faces turned in a row, only one order is searched.
+    def isRedundant(face: int, lastFace: int) -> bool:
+        return (face == lastFace) or (face == lastFace - 3)
+
+    def phase2(cornerPerm: int, udEdgePerm: int, slicePerm: int, depth: int, lastFace: int) -> bool:
+        if(depth == 0):
+            return (cornerPerm == 0) and (udEdgePerm == 0) and (slicePerm == 0)
+        for i in range(moveCount2):
+            m: int = PHASE_2_MOVES[i]
+            if(isRedundant(m // 3, lastFace)):
+                continue
+            newCornerPerm: int = cornerPermMove[(cornerPerm * moveCount2) + i]
+            newUdEdgePerm: int = udEdgePermMove[(udEdgePerm * moveCount2) + i]
+            newSlicePerm : int = slicePermMove [(slicePerm  * moveCount2) + i]
+            if((cornerSlicePrune[(newCornerPerm * SLICE_PERM_COUNT) + newSlicePerm] < depth) and
+               (udEdgeSlicePrune[(newUdEdgePerm * SLICE_PERM_COUNT) + newSlicePerm] < depth)):
+                path.append(m)
+                if(phase2(newCornerPerm, newUdEdgePerm, newSlicePerm, depth - 1, m // 3)):
+                    return True
+                path.pop()
+        return False
+
+    #  Starts the second phase from the end of a solution of the first phase, which must not end with a move of the
+    #  second phase (or else a shorter solution of the first phase would already have been searched).
+    def startPhase2() -> bool:
+        if(path and (path[-1] in PHASE_2_MOVES)):
+            return False
+        corners: list[int] = cp
+        edges  : list[int] = ep
+        for m in path:
+            turnCp, _, turnEp, _ = FACE_TURN_CUBIES[m]
+            corners = [corners[turnCp[k]] for k in range(8)]
+            edges   = [edges[turnEp[k]] for k in range(12)]
+        cornerPerm: int = permutationRank(corners)
+        udEdgePerm: int = udEdgePermCoordinate(edges)
+        slicePerm : int = slicePermCoordinate(edges)
+        length1   : int = len(path)
+        lastFace  : int = (path[-1] // 3) if(path) else -1
+        for depth in range(max(cornerSlicePrune[(cornerPerm * SLICE_PERM_COUNT) + slicePerm],
+                               udEdgeSlicePrune[(udEdgePerm * SLICE_PERM_COUNT) + slicePerm]), maxLength - length1 + 1):
+            if(phase2(cornerPerm, udEdgePerm, slicePerm, depth, lastFace)):
+                return True
+        return False
+
+    def phase1(twist: int, flip: int, slice: int, depth: int, lastFace: int) -> bool:
+        if(depth == 0):
+            return (twist == 0) and (flip == 0) and (slice == SLICE_GOAL) and startPhase2()
+        for m in range(moveCount1):
+            if(isRedundant(m // 3, lastFace)):
+                continue
+            newTwist: int = twistMove[(twist * moveCount1) + m]
+            newFlip : int = flipMove [(flip  * moveCount1) + m]
+            newSlice: int = sliceMove[(slice * moveCount1) + m]
+            if((twistSlicePrune[(newTwist * SLICE_COUNT) + newSlice] < depth) and
+               (flipSlicePrune [(newFlip  * SLICE_COUNT) + newSlice] < depth)):
+                path.append(m)
+                if(phase1(newTwist, newFlip, newSlice, depth - 1, m // 3)):
+                    return True
+                path.pop()
+        return False
+
+    twist: int = twistCoordinate(co)
+    flip : int = flipCoordinate(eo)
+    slice: int = sliceCoordinate(ep)
+    for depth in range(max(twistSlicePrune[(twist * SLICE_COUNT) + slice], flipSlicePrune[(flip * SLICE_COUNT) + slice]),
+                       maxLength + 1):
+        if(phase1(twist, flip, slice, depth, -1)):
+            rotations: str = invertMoves(concatenateStringList([MOVE_TOKENS[code] for code in ORIENTATION_ROTATION_CODES[orientation]]))
+            return concatenateStringList([rotations] + [FACE_TURNS[m] for m in path]).strip()
+    raise ValueError(f"solveTwoPhase:\n\tparameter cube: \"{str(cube)}\" can't be solved in {maxLength} moves.")
+
+#  The optimal solver finds a shortest sequence of face turns that solves a cube, with an iterative deepening A* search
+#  (IDA*) bounded by pattern databases: the number of moves needed to solve the corners alone, and to solve each half of
+#  the edges alone (the edges of PATTERN_EDGE_SETS), which never exceed the number of moves needed to solve the cube.
+#  The databases hold 4 bits per entry, and are generated once (with NumPy) and saved to PATTERN_DATABASES_PATH, along
+#  with their move tables. The file is then memory-mapped (see PatternDatabases), so every process that opens it shares
+#  a single copy of it. A random cube needs 17 or 18 moves, which can take hours to search in Python, while cubes that
+#  are 14 moves or so from solved are solved within seconds to a minute.
+PATTERN_DATABASES_PATH: str = joinPath(expanduser("~"), ".cache", "rubiksCubeSolver", "patternDatabases.bin")
+
+#  The two halves of the edges of the edge databases, in the cubie view.
+PATTERN_EDGE_SETS: tuple[tuple[int]] = ((0, 1, 2, 3, 4, 5), (6, 7, 8, 9, 10, 11))
+
+#  The number of values of the coordinates of the pattern databases: the corners are a corner permutation (as in the
+#  two-phase solver) and a twist, and a half of the edges are the rank of the slots of its six edges (see
+#  permutationRank()) and the orientations of its six edges, one bit per edge.
+EDGE_SLOTS_COUNT      : int = perm(12, 6)
+EDGE_ORIENTATION_COUNT: int = 2**6
+
+#  Writes tables to a binary file that can be memory-mapped (see mapTableFile()): the magic bytes, the number of tables,
+#  and then the name, type code, CRC-32 checksum, offset and length of every table, followed by the little-endian
+#  contents of every table, each at an offset that is a multiple of 8. The file is written under a temporary name first,
+#  so that an interrupted write never leaves a partial file at path.
+TABLE_FILE_ENTRY: Struct = Struct("<32sc3xIQQ")
+
+def writeTableFile(path: str, magic: bytes, tables: dict[str, "array | bytes | bytearray"]) -> None:
+    if(dirname(path) != ""):
+        makedirs(dirname(path), exist_ok = True)
+    offset  : int         = len(magic) + 8 + (len(tables) * TABLE_FILE_ENTRY.size)
+    entries : list[bytes] = []
+    contents: list[array | bytes | bytearray] = []
+    for name, table in tables.items():
+        if((type(table) == array) and (byteorder == "big")):
+            table = array(table.typecode, table)
+            table.byteswap()
+        length: int = len(table) * (table.itemsize if(type(table) == array) else 1)
+        offset = (offset + 7) & ~7
+        entries.append(TABLE_FILE_ENTRY.pack(name.encode(), (table.typecode if(type(table) == array) else "B").encode(),
+                                             crc32(table), offset, length))
+        contents.append(table)
+        offset += length
+    with open(path + ".tmp", "wb") as file:
+        file.write(magic + len(tables).to_bytes(8, "little") + b"".join(entries))
+        for entry, table in zip(entries, contents):
+            file.write(bytes(TABLE_FILE_ENTRY.unpack(entry)[3] - file.tell()))
+            file.write(table)
+    replace(path + ".tmp", path)
+    return
+
+#  Memory-maps a binary file written by writeTableFile(), and returns the map along with a read-only view of every table
+#  (see tableViews()).
+def mapTableFile(path: str, magic: bytes) -> tuple[mmap, dict[str, "memoryview | array"]]:
+    with open(path, "rb") as file:
+        mapping: mmap = mmap(file.fileno(), 0, access = ACCESS_READ)
+    return mapping, tableViews(mapping, magic, path)
+
+#  Returns a read-only view of every table (indexed like the array it was written from) of the contents of a file written
+#  by writeTableFile(), held in a buffer (a memory-mapped file, or a shared memory block, see SharedSolverTables). On a
+#  big-endian machine the tables are copied instead. Raises a ValueError if the checksum of any table doesn't match its
+#  contents, unless verify is False. path only names the file in the errors.
+def tableViews(buffer: "mmap | memoryview", magic: bytes, path: str, verify: bool = True) -> dict[str, "memoryview | array"]:
+    contents: memoryview = memoryview(buffer).toreadonly()
+    if(contents[:len(magic)] != magic):
+        raise ValueError(f"tableViews:\n\tparameter path: \"{path}\" is not a table file of \"{magic.decode()}\".")
+    tables: dict[str, memoryview | array] = {}
+    for i in range(int.from_bytes(contents[len(magic):len(magic) + 8], "little")):
+        name, typecode, checksum, offset, length = TABLE_FILE_ENTRY.unpack_from(contents, len(magic) + 8 + (i * TABLE_FILE_ENTRY.size))
+        name                                     = name.rstrip(b"\0").decode()
+        view: memoryview = contents[offset:offset + length]
+        if((len(view) != length) or (verify and (crc32(view) != checksum))):
+            raise ValueError(f"tableViews:\n\tparameter path: \"{path}\" has a corrupted table \"{name}\".")
+        view = view.cast(typecode.decode())
+        if(byteorder == "big"):
+            view = array(typecode.decode(), view.tobytes())
+            view.byteswap()
+        tables[name] = view
+    return tables
+
+#  Returns the rank of every row of a NumPy array of distinct values of range(n) (see permutationRank()).
+def permutationRanks(rows: "numpy.ndarray", n: int) -> "numpy.ndarray":
+    rows  : numpy.ndarray = rows.astype(numpy.int64)
+    result: numpy.ndarray = numpy.zeros(len(rows), numpy.int64)
+    for i in range(rows.shape[1]):
+        result = (result * (n - i)) + rows[:, i] - (rows[:, :i] < rows[:, i:i + 1]).sum(axis = 1)
+    return result
+
+#  The kind of pattern database ("corners" or "edges", or "pruning" for a pruning table of the two-phase solver, see
+#  generatePruningTable()) that a process expands (see expandPatternDatabase()), along with its move tables and its
+#  depths, set by attachPatternWorker().
+PATTERN_WORKER: dict[str, Any] = {}
+
+#  Sets the tables of a process that expands a pattern database: either the NumPy arrays themselves (in the process that
+#  generates it), or the name, shape and type of the shared memory block of every array (in a worker process). A worker
+#  process ignores interrupts, so that only the process that generates the pattern database is interrupted, and stops
+#  its workers (see generatePatternDatabase()). Otherwise, a worker could be interrupted while it holds the lock of the
+#  queue of tasks, which would keep the pool from ever being terminated.
+def attachPatternWorker(kind: str, tables: dict[str, "numpy.ndarray | tuple[str, tuple[int], str]"]) -> None:
+    if(any(type(table) == tuple for table in tables.values())):
+        signal(SIGINT, SIG_IGN)
+    PATTERN_WORKER.clear()
+    PATTERN_WORKER["kind"]     = kind
+    PATTERN_WORKER["memories"] = []
+    for name, table in tables.items():
+        if(type(table) == tuple):
+            memory: SharedMemory = SharedMemory(table[0])
+            PATTERN_WORKER["memories"].append(memory)
+            table = numpy.ndarray(table[1], table[2], memory.buf)
+        PATTERN_WORKER[name] = table
+    return
+
+#  Expands the entries from start to stop of a pattern database that are depth moves from the goal: every entry that they
+#  reach with a face turn, and that isn't reached yet (15), is depth + 1 moves from the goal. Several processes can
+#  expand different entries at the same time, since they only ever write the same value to the entries that aren't
+#  reached yet. Returns the number of entries expanded.
+def expandPatternDatabase(task: tuple[int, int, int]) -> int:
+    start, stop, depth = task
+    depths  : numpy.ndarray = PATTERN_WORKER["depths"]
+    frontier: numpy.ndarray = numpy.flatnonzero(depths[start:stop] == depth) + start
+    for m in range(PATTERN_WORKER["moveA"].shape[1] if(PATTERN_WORKER["kind"] == "pruning") else len(FACE_TURNS)):
+        if(PATTERN_WORKER["kind"] == "pruning"):
+            countB : int           = PATTERN_WORKER["moveB"].shape[0]
+            entries: numpy.ndarray = (PATTERN_WORKER["moveA"][frontier // countB, m].astype(numpy.int64) * countB) +  \
+                                     PATTERN_WORKER["moveB"][frontier % countB, m]
+        elif(PATTERN_WORKER["kind"] == "corners"):
+            entries: numpy.ndarray = (PATTERN_WORKER["cornerPermMove"][frontier // TWIST_COUNT, m].astype(numpy.int64) * TWIST_COUNT) +  \
+                                     PATTERN_WORKER["twistMove"][frontier % TWIST_COUNT, m]
+        else:
+            slots  : numpy.ndarray = frontier // EDGE_ORIENTATION_COUNT
+            entries: numpy.ndarray = (PATTERN_WORKER["edgeSlotsMove"][slots, m].astype(numpy.int64) * EDGE_ORIENTATION_COUNT) +  \
+                                     ((frontier % EDGE_ORIENTATION_COUNT) ^ PATTERN_WORKER["edgeFlipMove"][slots, m])
+        depths[entries[depths[entries] == 15]] = depth + 1
+    return len(frontier)
+
+#  The magic bytes of the checkpoint files of generatePatternDatabase(), and the number of entries in every range of
+#  entries that a process expands at a time.
+PATTERN_CHECKPOINT_MAGIC: bytes = b"PATTERNC"
+PATTERN_TASK_ENTRIES    : int   = 1 << 22
+
+#  Generates a pattern database of a kind ("corners", "edges" or "pruning", with the move tables of that kind) with a
+#  breadth-first search from the goal, over the entries numbered from 0 to size - 1. Every layer of the search is split
+#  into ranges of entries that a pool of processes expands (or this process alone, if processes is 1), with the depths and
+#  the move tables in shared memory. After every layer, the depths are saved to the file checkpointPath (unless it can't
+#  be written), from which an interrupted search resumes (a checkpoint that doesn't match its checksum is ignored). The
+#  number of moves of every entry is then packed 4 bits per entry, the entry 2i in the low bits of byte i.
+def generatePatternDatabase(kind: str, size: int, goal: int, tables: dict[str, "numpy.ndarray"], checkpointPath: str, processes: int) -> bytes:
+    if(numpy is None):
+        raise ImportError("generatePatternDatabase:\n\tNumPy is not installed.")
+    depths  : numpy.ndarray      = numpy.full(size + (size % 2), 15, numpy.uint8)
+    depth   : int                = 0
+    memories: list[SharedMemory] = []
+    pool    : Pool | None        = None
+    depths[goal] = 0
+    if(exists(checkpointPath)):
+        try:
+            checkpoint: dict[str, memoryview | array] = mapTableFile(checkpointPath, PATTERN_CHECKPOINT_MAGIC)[1]
+            if(len(checkpoint["depths"]) * 2 == len(depths)):
+                depths[0::2] = numpy.frombuffer(checkpoint["depths"], numpy.uint8) & 15
+                depths[1::2] = numpy.frombuffer(checkpoint["depths"], numpy.uint8) >> 4
+                depth        = checkpoint["depth"][0]
+        except (ValueError, KeyError):
+            pass
+
+    try:
+        if(processes == 1):
+            attachPatternWorker(kind, dict(tables, depths = depths))
+        else:
+            shared: dict[str, tuple[str, tuple[int], str]] = {}
+            for name, table in dict(tables, depths = depths).items():
+                memories.append(SharedMemory(create = True, size = table.nbytes))
+                numpy.ndarray(table.shape, table.dtype, memories[-1].buf)[...] = table
+                shared[name] = (memories[-1].name, table.shape, table.dtype.str)
+            depths = numpy.ndarray(depths.shape, depths.dtype, memories[-1].buf)
+            pool   = Pool(processes, attachPatternWorker, (kind, shared))
+        while True:
+            tasks: list[tuple[int, int, int]] = [(start, min(start + PATTERN_TASK_ENTRIES, len(depths)), depth)
+                                                 for start in range(0, len(depths), PATTERN_TASK_ENTRIES)]
+            if(sum(map(expandPatternDatabase, tasks) if(pool is None) else pool.imap_unordered(expandPatternDatabase, tasks)) == 0):
                 break
-            fullSolution += f"{newPart} D' "
-            myCube.performMoves(newPart + " D'")
-            solveBreakdown.append(
-                ("   " * indent) + "Insert the " + COLOR_SCHEME["RGB"][0] + COLOR_SCHEME["word"][0] + DEFAULT + "-" +  \
-                COLOR_SCHEME["RGB"][i + 1] + (COLOR_SCHEME["word"][i + 1] + "    ")[:7] + DEFAULT + f"cross piece:   " + cleanUpSpacing(f"({newPart}) D'")
-            )
+            depth += 1
+            try:
+                writeTableFile(checkpointPath, PATTERN_CHECKPOINT_MAGIC, {"depth": array("I", [depth]), "depths": (depths[0::2] | (depths[1::2] << 4)).tobytes()})
+            except OSError:
+                pass
+        result: bytes = (depths[0::2] | (depths[1::2] << 4)).tobytes()
+        if(pool is not None):
+            pool.close()
+    except BaseException:
+        #  The workers may never finish their tasks after an interruption or a failed task, so they are stopped at once.
+        if(pool is not None):
+            pool.terminate()
+        raise
+    finally:
+        if(pool is not None):
+            pool.join()
+        depths = None
+        PATTERN_WORKER.clear()
+        for memory in memories:
+            memory.close()
+            memory.unlink()
+    return result
+
+
+#  The pattern databases of the optimal solver, and their move tables, all read from the memory-mapped file (see
+#  patternDatabases()). A move table holds the coordinate reached by the move m from the coordinate c at the index
+#  (c * 18) + m, and edgeFlipMove holds the bits to flip in the orientations of a half of the edges in its slots c.
+class PatternDatabases:
+    __slots__ = ("mapping", "cornerPermMove", "twistMove", "edgeSlotsMove", "edgeFlipMove", "corners", "edges")
+
+    FILE_MAGIC: bytes = b"PATTERN2"
+
+    #  Generates the move tables and the pattern databases with a pool of processes worker processes (one per CPU by
+    #  default), and writes them to a file. This takes a few minutes on a single CPU, and resumes from the checkpoints
+    #  next to the file if it was interrupted (see generatePatternDatabase()).
+    @staticmethod
+    def generate(path: str, processes: int | None = None) -> None:
+        if(numpy is None):
+            raise ImportError("PatternDatabases.generate:\n\tNumPy is not installed.")
+        moveCount : int           = len(FACE_TURNS)
+        corners   : numpy.ndarray = numpy.array(list(permutations(range(8))), numpy.uint8)
+        twists    : numpy.ndarray = numpy.array([[(twist // (3**k)) % 3 for k in range(7)] for twist in range(TWIST_COUNT)], numpy.int64)
+        twists                    = numpy.hstack((twists, (-twists.sum(axis = 1) % 3)[:, None]))
+        edgeSlots : numpy.ndarray = numpy.array(list(permutations(range(12), 6)), numpy.uint8)
+        tables    : dict[str, array | bytes] = {}
+
+        #  A piece in the slot j of a cube is moved by the move m to the slot k, where ep[k] == j.
+        cornerPermMove: numpy.ndarray = numpy.empty((CORNER_PERM_COUNT, moveCount), numpy.uint16)
+        twistMove     : numpy.ndarray = numpy.empty((TWIST_COUNT, moveCount), numpy.uint16)
+        edgeSlotsMove : numpy.ndarray = numpy.empty((EDGE_SLOTS_COUNT, moveCount), numpy.uint32)
+        edgeFlipMove  : numpy.ndarray = numpy.zeros((EDGE_SLOTS_COUNT, moveCount), numpy.uint8)
+        for m, (cp, co, ep, eo) in enumerate(FACE_TURN_CUBIES):
+            cornerPermMove[:, m] = permutationRanks(corners[:, cp], 8)
+            twistMove[:, m]      = ((twists[:, cp] + co) % 3)[:, :7] @ (3**numpy.arange(7))
+            slotMoves: numpy.ndarray = numpy.array([ep.index(j) for j in range(12)], numpy.uint8)[edgeSlots]
+            edgeSlotsMove[:, m]  = permutationRanks(slotMoves, 12)
+            for i in range(6):
+                edgeFlipMove[:, m] |= numpy.array(eo, numpy.uint8)[slotMoves[:, i]] << i
+        for name, table, typecode in (("cornerPermMove", cornerPermMove, "H"), ("twistMove", twistMove, "H"),
+                                      ("edgeSlotsMove", edgeSlotsMove, "I"), ("edgeFlipMove", edgeFlipMove, "B")):
+            tables[name] = array(typecode, table.tobytes())
+
+        processes = (cpu_count() or 1) if(processes is None) else processes
+        tables["corners"] = generatePatternDatabase("corners", CORNER_PERM_COUNT * TWIST_COUNT, 0,
+                                                    {"cornerPermMove": cornerPermMove, "twistMove": twistMove},
+                                                    path + ".corners.checkpoint", processes)
+        for i, edges in enumerate(PATTERN_EDGE_SETS):
+            tables[f"edges{i}"] = generatePatternDatabase("edges", EDGE_SLOTS_COUNT * EDGE_ORIENTATION_COUNT,
+                                                          permutationRank(list(edges), 12) * EDGE_ORIENTATION_COUNT,
+                                                          {"edgeSlotsMove": edgeSlotsMove, "edgeFlipMove": edgeFlipMove},
+                                                          path + f".edges{i}.checkpoint", processes)
+        writeTableFile(path, PatternDatabases.FILE_MAGIC, tables)
+        for name in ["corners"] + [f"edges{i}" for i in range(len(PATTERN_EDGE_SETS))]:
+            if(exists(path + f".{name}.checkpoint")):
+                remove(path + f".{name}.checkpoint")
+        return
 
-        if(not isValidScramble):
-            break
+    #  Holds the tables of a dictionary, read from mapping (a memory-mapped file or a shared memory block, which is kept
+    #  open for as long as the tables are).
+    def __init__(self, mapping: Any, tables: dict[str, "memoryview | array"]) -> None:
+        self.mapping         = mapping
+        self.cornerPermMove  = tables["cornerPermMove"]
+        self.twistMove       = tables["twistMove"]
+        self.edgeSlotsMove   = tables["edgeSlotsMove"]
+        self.edgeFlipMove    = tables["edgeFlipMove"]
+        self.corners         = tables["corners"]
+        self.edges           = tuple(tables[f"edges{i}"] for i in range(len(PATTERN_EDGE_SETS)))
+        return
+
+    #  Memory-maps a file written by generate().
+    @classmethod
+    def load(cls, path: str) -> "PatternDatabases":
+        return cls(*mapTableFile(path, cls.FILE_MAGIC))
+
+#  Returns the pattern databases of the optimal solver, generating them first if their file doesn't exist yet. In a worker
+#  process of solveInParallel(), the databases are the ones that it attached from shared memory instead.
+@lru_cache(maxsize = None)
+def patternDatabases(path: str = PATTERN_DATABASES_PATH) -> PatternDatabases:
+    if("patterns" in SHARED_SOLVER_TABLES):
+        return SHARED_SOLVER_TABLES["patterns"]
+    elif(not exists(path)):
+        PatternDatabases.generate(path)
+    return PatternDatabases.load(path)
+
+#  Returns a shortest sequence of face turns (after any cube rotations needed to solve the orientation of the cube) that
+#  solves a cube object. If a dictionary is given as statistics, the search writes to it the length of the solution
+#  ("length"), the number of nodes expanded ("nodes"), the time taken in seconds ("seconds") and the number of nodes
+#  expanded per second ("nodesPerSecond"). The cube object itself is never changed.
+def solveOptimal(cube: Cube, statistics: dict[str, int | float] | None = None) -> str:
+    if(type(cube) != Cube):
+        raise TypeError(f"solveOptimal:\n\tparameter cube: \"{str(cube)}\" is not a cube object.")
+    elif((statistics is not None) and (type(statistics) != dict)):
+        raise TypeError(f"solveOptimal:\n\tparameter statistics: \"{str(statistics)}\" is not a dictionary.")
+    orientation, cp, co, ep, eo = solvableCubies(cube, "solveOptimal")
+
+    d                  : PatternDatabases = patternDatabases()
+    cornerPermMove, twistMove             = d.cornerPermMove, d.twistMove
+    edgeSlotsMove, edgeFlipMove           = d.edgeSlotsMove, d.edgeFlipMove
+    corners                               = d.corners
+    edges0, edges1                        = d.edges
+    moveCount          : int              = len(FACE_TURNS)
+    path               : list[int]        = []
+    nodes              : int              = 0
+
+    #  The moves of the search are pruned as in the two-phase solver, and then by every database in turn. A database holds
+    #  the number of moves of the entry i in the bits (i & 1) * 4 of its byte i >> 1.
+    def search(cornerPerm: int, twist: int, slots0: int, flip0: int, slots1: int, flip1: int, depth: int, lastFace: int) -> bool:
+        nonlocal nodes
+        nodes += 1
+        if(depth == 0):
+            return True
+        cornerPerm *= moveCount
+        twist      *= moveCount
+        slots0     *= moveCount
+        slots1     *= moveCount
+        for m in range(moveCount):
+            face: int = m // 3
+            if((face == lastFace) or (face == lastFace - 3)):
+                continue
+            newCornerPerm: int = cornerPermMove[cornerPerm + m]
+            newTwist     : int = twistMove[twist + m]
+            entry        : int = (newCornerPerm * TWIST_COUNT) + newTwist
+            if(((corners[entry >> 1] >> ((entry & 1) << 2)) & 15) >= depth):
+                continue
+            newSlots0: int = edgeSlotsMove[slots0 + m]
+            newFlip0 : int = flip0 ^ edgeFlipMove[slots0 + m]
+            entry          = (newSlots0 * EDGE_ORIENTATION_COUNT) + newFlip0
+            if(((edges0[entry >> 1] >> ((entry & 1) << 2)) & 15) >= depth):
+                continue
+            newSlots1: int = edgeSlotsMove[slots1 + m]
+            newFlip1 : int = flip1 ^ edgeFlipMove[slots1 + m]
+            entry          = (newSlots1 * EDGE_ORIENTATION_COUNT) + newFlip1
+            if(((edges1[entry >> 1] >> ((entry & 1) << 2)) & 15) >= depth):
+                continue
+            path.append(m)
+            if(search(newCornerPerm, newTwist, newSlots0, newFlip0, newSlots1, newFlip1, depth - 1, face)):
+                return True
+            path.pop()
+        return False
+
+    #  Every coordinate of the cube, and the number of moves that the databases need at least.
+    coordinates: list[int] = [permutationRank(cp), twistCoordinate(co)]
+    bound      : int       = 0
+    for edges in PATTERN_EDGE_SETS:
+        slots: list[int] = [ep.index(edge) for edge in edges]
+        coordinates += [permutationRank(slots, 12), sum(eo[slot] << i for i, slot in enumerate(slots))]
+    for database, entry in ((corners, (coordinates[0] * TWIST_COUNT) + coordinates[1]),
+                            (edges0, (coordinates[2] * EDGE_ORIENTATION_COUNT) + coordinates[3]),
+                            (edges1, (coordinates[4] * EDGE_ORIENTATION_COUNT) + coordinates[5])):
+        bound = max(bound, (database[entry >> 1] >> ((entry & 1) << 2)) & 15)
+
+    start: float = perf_counter()
+    while not search(*coordinates, bound, -1):
+        bound += 1
+    if(statistics is not None):
+        seconds: float = perf_counter() - start
+        statistics.update(length = len(path), nodes = nodes, seconds = seconds, nodesPerSecond = (nodes / seconds) if(seconds > 0) else 0.0)
+    rotations: str = invertMoves(concatenateStringList([MOVE_TOKENS[code] for code in ORIENTATION_ROTATION_CODES[orientation]]))
+    return concatenateStringList([rotations] + [FACE_TURNS[m] for m in path]).strip()
+
+
+#  A pool of worker processes shares a single copy of the solver tables: they are read once from their files into shared
+#  memory blocks (see SharedSolverTables), which every worker then attaches to read-only (see attachSolverTables()), so
+#  that the memory of a worker doesn't depend on the size of the tables. SHARED_SOLVER_TABLES holds the tables that a
+#  worker attached, by kind ("twoPhase" or "patterns"), which twoPhaseTables() and patternDatabases() return.
+SHARED_SOLVER_TABLES: dict[str, "TwoPhaseTables | PatternDatabases"] = {}
+
+#  The table class, the file and the loading function of every kind of solver tables.
+SOLVER_TABLE_FILES: dict[str, tuple[type, str, Callable[[str], Any]]] = \
+{
+    "twoPhase": (TwoPhaseTables  , TWO_PHASE_TABLES_PATH , twoPhaseTables  ),
+    "patterns": (PatternDatabases, PATTERN_DATABASES_PATH, patternDatabases)
+}
+
+#  The solvers of solveInParallel(), and the kinds of solver tables that each of them needs.
+SOLVERS: dict[str, tuple[Callable[[Cube], str], tuple[str]]] = \
+{
+    "layers"  : (solve        , ()           ),
+    "twoPhase": (solveTwoPhase, ("twoPhase",)),
+    "optimal" : (solveOptimal , ("patterns",))
+}
+
+#  The shared memory blocks that hold the files of some kinds of solver tables, generating the files first if they don't
+#  exist yet. The blocks are owned by the process that creates them, and are freed by close() (or at the end of a with
+#  statement). blocks holds the name of the block and the file of every kind, to pass to attachSolverTables().
+class SharedSolverTables:
+    __slots__ = ("memories", "blocks")
+
+    def __init__(self, kinds: tuple[str] = ("twoPhase",)) -> None:
+        self.memories: list[SharedMemory]         = []
+        self.blocks  : dict[str, tuple[str, str]] = {}
+        for kind in kinds:
+            if(kind not in SOLVER_TABLE_FILES):
+                raise ValueError(f"SharedSolverTables:\n\tparameter kinds: \"{str(kind)}\" is not a kind of solver tables.")
+        try:
+            for kind in kinds:
+                _, path, loader = SOLVER_TABLE_FILES[kind]
+                loader(path)
+                with open(path, "rb") as file:
+                    self.memories.append(SharedMemory(create = True, size = file.seek(0, 2)))
+                    file.seek(0)
+                    file.readinto(self.memories[-1].buf)
+                self.blocks[kind] = (self.memories[-1].name, path)
+        except BaseException:
+            self.close()
+            raise
+        return
+
+    def close(self) -> None:
+        for memory in self.memories:
+            memory.close()
+            memory.unlink()
+        self.memories = []
+        return
+
+    def __enter__(self) -> "SharedSolverTables":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+        return
+
+#  Attaches a worker process to the solver tables of SharedSolverTables.blocks, without copying or checking them again
+#  (the process that created the blocks already checked their files).
+def attachSolverTables(blocks: dict[str, tuple[str, str]]) -> None:
+    for kind, (name, path) in blocks.items():
+        memory: SharedMemory = SharedMemory(name)
+        SHARED_SOLVER_TABLES[kind] = SOLVER_TABLE_FILES[kind][0](memory, tableViews(memory.buf, SOLVER_TABLE_FILES[kind][0].FILE_MAGIC, path, verify = False))
+    twoPhaseTables.cache_clear()
+    patternDatabases.cache_clear()
+    return
+
+#  Solves the cube of a state with a solver of SOLVERS, in a worker process of solveInParallel().
+def solveSharedState(task: tuple[str, bytes]) -> str:
+    solver, state = task
+    return SOLVERS[solver][0](Cube.fromState(state))
+
+#  Returns the solutions of a list of cube objects, found with a solver of SOLVERS by a pool of processes worker processes
+#  (one per CPU by default), which all share a single copy of the solver tables. The cube objects themselves are never
+#  changed.
+def solveInParallel(cubes: list[Cube], solver: str = "twoPhase", processes: int | None = None) -> list[str]:
+    if(solver not in SOLVERS):
+        raise ValueError(f"solveInParallel:\n\tparameter solver: \"{str(solver)}\" is not a solver.")
+    for cube in cubes:
+        if(type(cube) != Cube):
+            raise TypeError(f"solveInParallel:\n\tparameter cubes: \"{str(cube)}\" is not a cube object.")
+    with SharedSolverTables(SOLVERS[solver][1]) as shared:
+        with Pool(processes, attachSolverTables, (shared.blocks,)) as pool:
+            return pool.map(solveSharedState, [(solver, cube.state) for cube in cubes])
+
+
+#  The first function called when the main program is run
+def runMain() -> None:
+    myCube: Cube = Cube(moves := generateRandomMoves(10))
+
+    print(moves)
+    myCube.printCube()
+    print("\n" * 5)
+
+    #  The cube object is checked when it is made, so the solver only fails on a cube that can't be solved.
+    try:
+        stages: list[str] = solveStages(myCube)
+    except ValueError as error:
+        print(f"Sorry, the colors you entered don't make a valid Rubik's cube:\n{error}\n" +  \
+              "Remember that this program only solves Rubik's cubes that use the standard western (\"BOY\") color scheme.\nTry again:")
+        return
+
+    fullSolution  : str       = concatenateStringList(stages)
+    solveBreakdown: list[str] = [f"{BOLD}{UNDERLINE}Solve Breakdown{DEFAULT}{BOLD}:{DEFAULT}\n"]
+
+    solveBreakdown.append(f"{BOLD}Rotate the entire cube so that the face with the cross color is on the bottom:{DEFAULT} {stages[0]}\n\n" +  \
+                          f"{BOLD}The first two layers:{DEFAULT}")
+    solveBreakdown.append("   " + f"{ITALICS}Solving the cross:{DEFAULT}")
+    solveBreakdown.append("      " + f"The first two cross pieces:   {stages[1]}")
+    solveBreakdown.append("      " + f"The last two cross pieces:    {stages[2]}")
+    #  The corners of the first layer are solved together with the edges of the second layer, as the pairs of the slots.
+    solveBreakdown.append("   " + f"{ITALICS}Solving the corners of the first layer and the edges of the second layer:{DEFAULT}")
+    for name, slotMoves in zip(("front right", "front left", "back left", "back right"), stages[3: 7]):
+        solveBreakdown.append("      " + (f"The {name} slot:" + 20 * " ")[:30] + slotMoves)
+    solveBreakdown.append(f"\n{BOLD}The last (top) layer:{DEFAULT}")
+    solveBreakdown.append("   " + f"{ITALICS}Orienting the last layer:{DEFAULT}    {stages[7]}")
+    solveBreakdown.append("   " + f"{ITALICS}Permuting the last layer:{DEFAULT}    {stages[8]}")
 
-        #  Solving the corners of the first layer
-        0
+    myCube.performMoves(fullSolution)
 
 
 
@@ -2201,15 +4525,14 @@ def runMain() -> None:
 
 
 
-    if(isValidScramble):
-        #  Print out the final results of the solve
-        solveBreakdown.append(CROSSED + (177 * " ") + DEFAULT)
-        solveBreakdown.append(f"\nHolding the cube with the {G}{BOLD}GREEN{DEFAULT} side on the {BOLD}{UNDERLINE}BOTTOM{DEFAULT} and the " +  \
-                            f"{BOLD}WHITE{DEFAULT} side in {BOLD}{UNDERLINE}FRONT{DEFAULT} (facing you), here is the solution to solve your cube!" +  \
-                            "\nRemember that the color of a side is determined by the color of its center.")
-        solveBreakdown.append(f"{BOLD}{UNDERLINE}Full (simplified) solution{DEFAULT}{BOLD}:    {simplifyMoves(fullSolution)}{DEFAULT}")
-        for i in range(len(solveBreakdown)):
-            print(solveBreakdown[i])
+    #  Print out the final results of the solve
+    solveBreakdown.append(CROSSED + (177 * " ") + DEFAULT)
+    solveBreakdown.append(f"\nHolding the cube as it was scrambled, here is the solution to solve your cube! It starts by rotating the cube so that the " +  \
+                          f"{Y}{BOLD}YELLOW{DEFAULT} side is on the {BOLD}{UNDERLINE}BOTTOM{DEFAULT} and the {G}{BOLD}GREEN{DEFAULT} side is in " +  \
+                          f"{BOLD}{UNDERLINE}FRONT{DEFAULT} (facing you).\nRemember that the color of a side is determined by the color of its center.")
+    solveBreakdown.append(f"{BOLD}{UNDERLINE}Full (simplified) solution{DEFAULT}{BOLD}:    {simplifyMoves(fullSolution)}{DEFAULT}")
+    for i in range(len(solveBreakdown)):
+        print(solveBreakdown[i])
 
     return
 